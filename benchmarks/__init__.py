@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the text verbalizer.
+
+Run the whole suite with ``python -m benchmarks.run``.
+"""
@@ -0,0 +1,43 @@
+# benchmarks/bench_batch.py
+
+"""
+Throughput benchmark for normalize_batch.
+
+Usage:
+    python -m benchmarks.bench_batch
+"""
+
+import os
+import time
+
+from verbalizer import SwahiliVerbalizer
+
+from .corpus import generate_corpus
+
+
+def run(texts, workers=None, executors=('serial', 'thread', 'process')):
+    """
+    Time normalize_batch over ``texts`` with each executor.
+
+    Args:
+        texts (list): Input sentences
+        workers (int, optional): Number of workers (default: CPU count)
+        executors (tuple): Executors to measure
+
+    Returns:
+        dict: Wall time in seconds per executor, keyed ``batch_<executor>_s``
+    """
+    verbalizer = SwahiliVerbalizer()
+    workers = workers or os.cpu_count() or 1
+    results = {}
+    for executor in executors:
+        start = time.perf_counter()
+        verbalizer.normalize_batch(texts, workers=workers, executor=executor)
+        results[f'batch_{executor}_s'] = time.perf_counter() - start
+    return results
+
+
+if __name__ == "__main__":
+    texts = generate_corpus(sentences=20000)
+    for key, seconds in run(texts).items():
+        print(f"{key:>20}: {seconds:.3f} s ({len(texts) / seconds:.0f} texts/s)")
@@ -0,0 +1,74 @@
+# benchmarks/bench_currency.py
+
+"""
+Currency detection cost against the size of the code table: the prefix-tree
+regex of verbalizer.currencies versus a plain alternation of the same codes.
+
+Tables grow from the corpus's four codes to every ISO 4217 code and beyond
+with made-up three-letter codes; the corpus stays the same, so a flat line
+means the table size costs nothing.
+
+Usage:
+    python -m benchmarks.bench_currency
+"""
+
+import itertools
+import re
+import string
+import time
+
+from verbalizer.currencies import ISO_4217, currency_regex
+
+from .corpus import CURRENCY_CODES, generate_corpus
+
+
+TABLE_SIZES = (4, 16, 64, len(ISO_4217), 512)
+
+AMOUNT = r'\s*(\d+(?:\.\d{1,2})?)\b'
+
+
+def make_table(size):
+    """The corpus's codes, then ISO 4217 codes, then invented ones, up to ``size``."""
+    codes = list(CURRENCY_CODES)
+    codes += [code for code in ISO_4217 if code not in codes]
+    invented = (''.join(letters) for letters in itertools.product(string.ascii_uppercase, repeat=3))
+    codes += [code for code in invented if code not in ISO_4217]
+    return codes[:size]
+
+
+def time_pattern(pattern, text, repeat):
+    """Best seconds to find every match of a pattern in the text."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = sum(1 for _ in pattern.finditer(text))
+        best = min(best, time.perf_counter() - start)
+    return best, found
+
+
+def run(sentences=2000, sizes=TABLE_SIZES, repeat=5):
+    """
+    Time both regexes for every table size.
+
+    Returns:
+        dict: Keyed by table size: ``trie_s`` and ``alternation_s``
+    """
+    text = '\n'.join(generate_corpus(sentences=sentences, seed=0))
+    results = {}
+    for size in sizes:
+        codes = make_table(size)
+        # Longest first, as a hand-written alternation would have to be
+        alternation = '|'.join(sorted(codes, key=len, reverse=True))
+        trie = re.compile(f"({currency_regex([], codes, 'prefix')}){AMOUNT}")
+        plain = re.compile(rf"\b({alternation}){AMOUNT}")
+        trie_s, trie_found = time_pattern(trie, text, repeat)
+        plain_s, plain_found = time_pattern(plain, text, repeat)
+        assert trie_found == plain_found
+        results[size] = {'trie_s': trie_s, 'alternation_s': plain_s}
+    return results
+
+
+if __name__ == "__main__":
+    for size, result in run().items():
+        print(f"{size:>4} codes: trie {result['trie_s'] * 1000:7.2f} ms, "
+              f"alternation {result['alternation_s'] * 1000:7.2f} ms")
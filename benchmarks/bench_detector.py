@@ -0,0 +1,77 @@
+# benchmarks/bench_detector.py
+
+"""
+Expression detection alone: one ``Detector`` pass versus a ``re.sub`` pass per
+category, in priority order, with the same trivial replacement.
+
+The replacement returns the matched text unchanged, so both sides do the same
+work apart from the scanning and both give the same output.
+
+Usage:
+    python -m benchmarks.bench_detector
+"""
+
+import time
+
+from verbalizer import SwahiliVerbalizer
+
+from .corpus import generate_corpus
+
+
+def keep(category, match):
+    """Replacement that leaves the expression as it is."""
+    return match.group(0)
+
+
+def sequential(order, text):
+    """One substitution pass per category, in priority order."""
+    for category, pattern in order:
+        text = pattern.sub(lambda match: keep(category, match), text)
+    return text
+
+
+def best_of(function, texts, repeat):
+    """Best seconds to run a function over every text."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            function(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sentences=20000, joined=200, repeat=5):
+    """
+    Time both approaches on short sentences and on long texts.
+
+    Args:
+        sentences (int): Sentences in the corpus
+        joined (int): Sentences joined into each long text
+        repeat (int): Runs per timing; the best is kept
+
+    Returns:
+        dict: Keyed by ``'sentences'`` and ``'texts'``: ``detector_s`` and
+        ``sequential_s``
+    """
+    detector = SwahiliVerbalizer().detector
+    corpus = generate_corpus(sentences=sentences, seed=0)
+    inputs = {
+        'sentences': corpus,
+        'texts': [' '.join(corpus[i:i + joined]) for i in range(0, len(corpus), joined)],
+    }
+    results = {}
+    for name, texts in inputs.items():
+        assert all(detector.sub(text, keep) == sequential(detector.order, text) for text in texts)
+        results[name] = {
+            'detector_s': best_of(lambda text: detector.sub(text, keep), texts, repeat),
+            'sequential_s': best_of(lambda text: sequential(detector.order, text), texts, repeat),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    for name, result in run().items():
+        print(f"{name:<10} detector {result['detector_s'] * 1000:8.2f} ms, "
+              f"sequential {result['sequential_s'] * 1000:8.2f} ms, "
+              f"speedup {result['sequential_s'] / result['detector_s']:5.2f}x")
@@ -0,0 +1,74 @@
+# benchmarks/bench_import.py
+
+"""
+Cold-start benchmark: time to import the package and to get a ready verbalizer.
+
+Each measurement runs in a fresh interpreter, as a short CLI invocation or a
+serverless cold start would.
+
+Usage:
+    python -m benchmarks.bench_import
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+SNIPPETS = {
+    'python': "pass",
+    'import': "import verbalizer",
+    'get_verbalizer': "import verbalizer; verbalizer.get_verbalizer('sw')",
+    'first_normalize': "import verbalizer; verbalizer.get_verbalizer('sw').normalize('KES 100')",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{snippet}
+print(time.perf_counter() - start)
+"""
+
+
+def time_snippet(snippet, repeat=10):
+    """
+    Time a snippet in fresh interpreters.
+
+    Args:
+        snippet (str): Python code
+        repeat (int): Interpreters started
+
+    Returns:
+        float: Median seconds spent in the snippet
+    """
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', TIMER.format(snippet=snippet)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        times.append(float(output))
+    return statistics.median(times)
+
+
+def loaded_modules(snippet):
+    """Return the verbalizer modules loaded after running ``snippet``."""
+    code = f"{snippet}\nimport sys\nprint(' '.join(sorted(m for m in sys.modules if m.startswith('verbalizer'))))"
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    return output.stdout.split()
+
+
+def run(repeat=10):
+    """
+    Time every snippet.
+
+    Returns:
+        dict: Median seconds per snippet, keyed ``import_<name>_s``
+    """
+    return {f'import_{name}_s': time_snippet(snippet, repeat) for name, snippet in SNIPPETS.items()}
+
+
+if __name__ == "__main__":
+    for key, seconds in run().items():
+        print(f"{key:>28}: {seconds * 1000:.2f} ms")
+    print("modules after import:", ' '.join(loaded_modules(SNIPPETS['import'])))
@@ -0,0 +1,72 @@
+# benchmarks/bench_incremental.py
+
+"""
+Per-edit latency of incremental normalization against documents of growing
+size, compared with re-normalizing the whole document.
+
+Usage:
+    python -m benchmarks.bench_incremental
+"""
+
+import random
+import time
+
+from verbalizer import SwahiliVerbalizer
+
+from .corpus import generate_corpus
+
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+# Keystrokes: digits and letters typed, characters deleted
+EDITS = ('5', '0', 'a', ' ', '')
+
+
+def make_document(chars, seed=0):
+    """Return a generated document of about ``chars`` characters."""
+    sentences = generate_corpus(sentences=chars // 60 + 1, seed=seed)
+    return ' '.join(sentences)[:chars]
+
+
+def time_edits(verbalizer, text, edits=200, seed=0):
+    """
+    Time single-keystroke edits at random offsets.
+
+    Returns:
+        float: Median seconds per edit
+    """
+    document = verbalizer.incremental(text)
+    rng = random.Random(seed)
+    times = []
+    for _ in range(edits):
+        offset = rng.randrange(len(document))
+        inserted = rng.choice(EDITS)
+        start = time.perf_counter()
+        document.edit(offset, 0 if inserted else 1, inserted)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def run(sizes=SIZES, edits=200):
+    """
+    Time edits and full normalization at every document size.
+
+    Returns:
+        dict: Seconds keyed ``edit_<chars>_s`` (median per edit) and
+        ``full_<chars>_s`` (one normalize of the whole document)
+    """
+    verbalizer = SwahiliVerbalizer(errors='ignore')
+    results = {}
+    for chars in sizes:
+        text = make_document(chars)
+        results[f'edit_{chars}_s'] = time_edits(verbalizer, text, edits)
+        start = time.perf_counter()
+        verbalizer.normalize(text)
+        results[f'full_{chars}_s'] = time.perf_counter() - start
+    return results
+
+
+if __name__ == "__main__":
+    for key, seconds in run().items():
+        print(f"{key:>16}: {seconds * 1e6:10.1f} us")
@@ -0,0 +1,50 @@
+# benchmarks/bench_inverse.py
+
+"""
+Inverse normalization throughput: spoken text, as a speech recognizer
+would produce it, written back in digits.
+
+The input is the normalized corpus, at growing lengths; a steady rate of
+characters per second means the cost is linear in the length of the text.
+
+Usage:
+    python -m benchmarks.bench_inverse
+"""
+
+import time
+
+from verbalizer import SwahiliVerbalizer
+
+from .corpus import generate_corpus
+
+
+# Sentences per text
+TEXT_SIZES = (10, 100, 1000, 10000)
+
+
+def run(sizes=TEXT_SIZES, repeat=3):
+    """
+    Time inverse_normalize on texts of every size.
+
+    Returns:
+        dict: Keyed by sentences: ``chars`` (text length) and
+        ``chars_per_s`` (best throughput)
+    """
+    verbalizer = SwahiliVerbalizer(errors='ignore')
+    spoken = [verbalizer.normalize(text) for text in generate_corpus(sentences=max(sizes), seed=0)]
+    results = {}
+    for size in sizes:
+        text = ' '.join(spoken[:size])
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            verbalizer.inverse_normalize(text)
+            best = min(best, time.perf_counter() - start)
+        results[size] = {'chars': len(text), 'chars_per_s': len(text) / best}
+    return results
+
+
+if __name__ == "__main__":
+    for size, result in run().items():
+        print(f"{size:>6} sentences ({result['chars']:>8} chars): "
+              f"{result['chars_per_s']:10.0f} chars/s")
@@ -0,0 +1,69 @@
+# benchmarks/bench_lexicon.py
+
+"""
+Lexicon benchmark: building a Swahili lexicon file, opening it, and reading
+numbers from it versus composing them with number_to_words.
+
+Usage:
+    python -m benchmarks.bench_lexicon
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from verbalizer.languages.swahili.lexicon import build_lexicon, open_lexicon
+from verbalizer.languages.swahili.number import number_to_words
+
+
+def per_call(function, keys):
+    """Mean seconds per call over the keys."""
+    start = time.perf_counter()
+    for key in keys:
+        function(key)
+    return (time.perf_counter() - start) / len(keys)
+
+
+def run(numbers=(0, 1000000), lookups=200000, seed=0):
+    """
+    Build a lexicon and time lookups of random numbers in its range.
+
+    Returns:
+        dict: ``build_s``, ``size_bytes``, ``open_s``, then seconds per
+        number: ``lexicon_s`` (lexicon lookup), ``compose_s``
+        (number_to_words with an empty memo) and ``memo_s`` (memo hits)
+    """
+    rng = random.Random(seed)
+    keys = [rng.randint(*numbers) for _ in range(lookups)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'sw.lex')
+        start = time.perf_counter()
+        build_lexicon(path, numbers)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lexicon = open_lexicon(path)
+        open_s = time.perf_counter() - start
+        with lexicon:
+            words = lexicon.lookup('number')
+            lexicon_s = per_call(words, keys)
+            number_to_words.cache_clear()
+            compose_s = per_call(number_to_words, keys)
+            memo_s = per_call(number_to_words, keys[:1000] * (lookups // 1000))
+        return {
+            'build_s': build_s,
+            'size_bytes': os.path.getsize(path),
+            'open_s': open_s,
+            'lexicon_s': lexicon_s,
+            'compose_s': compose_s,
+            'memo_s': memo_s,
+        }
+
+
+if __name__ == "__main__":
+    result = run()
+    print(f"build: {result['build_s']:.2f} s, {result['size_bytes'] / 2 ** 20:.1f} MiB, "
+          f"open: {result['open_s'] * 1e6:.0f} us")
+    for key in ('lexicon_s', 'compose_s', 'memo_s'):
+        print(f"{key[:-2]:>8}: {result[key] * 1e9:6.0f} ns per number")
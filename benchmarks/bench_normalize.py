@@ -0,0 +1,53 @@
+# benchmarks/bench_normalize.py
+
+"""
+Benchmarks for the per-category normalizers and end-to-end normalize.
+
+Usage:
+    python -m benchmarks.bench_normalize
+"""
+
+import timeit
+
+from verbalizer import SwahiliVerbalizer
+from verbalizer.languages.swahili.number import number_to_words
+
+from .corpus import generate_corpus
+
+
+PASSES = ('normalize_currency', 'normalize_dates', 'normalize_time', 'normalize_numbers', 'normalize')
+
+
+def run(texts, repeat=5):
+    """
+    Time each normalizer over every text.
+
+    The number memo is cleared before each repetition so that every pass
+    pays for its own verbalization.
+
+    Args:
+        texts (list): Input sentences
+        repeat (int): Number of timing repetitions; the best is kept
+
+    Returns:
+        dict: Best time in seconds per pass, keyed ``<pass>_s``
+    """
+    verbalizer = SwahiliVerbalizer()
+    results = {}
+    for name in PASSES:
+        method = getattr(verbalizer, name)
+
+        def loop():
+            number_to_words.cache_clear()
+            for text in texts:
+                method(text)
+
+        results[f'{name}_s'] = min(timeit.repeat(loop, number=1, repeat=repeat))
+    return results
+
+
+if __name__ == "__main__":
+    texts = generate_corpus()
+    chars = sum(map(len, texts))
+    for key, seconds in run(texts).items():
+        print(f"{key:>24}: {seconds:.4f} s ({chars / seconds / 1e6:.2f} M chars/s)")
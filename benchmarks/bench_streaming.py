@@ -0,0 +1,62 @@
+# benchmarks/bench_streaming.py
+
+"""
+Latency of pushed streams: text fed in small chunks, as it arrives from a
+language model or a speech pipeline, through StreamingNormalizer.
+
+Usage:
+    python -m benchmarks.bench_streaming
+"""
+
+import time
+
+from verbalizer import SwahiliVerbalizer
+
+from .corpus import generate_corpus
+
+
+# Characters per feed
+CHUNK_SIZES = (1, 4, 16)
+
+
+def run(sentences=500, chunk_sizes=CHUNK_SIZES):
+    """
+    Feed a generated corpus in chunks of every size.
+
+    Returns:
+        dict: Keyed by chunk size: ``chars_per_s`` (throughput),
+        ``first_output_chunks`` (feeds until the first output) and
+        ``mean_held`` (characters held back after a feed, on average)
+    """
+    verbalizer = SwahiliVerbalizer(errors='ignore')
+    text = ' '.join(generate_corpus(sentences=sentences, seed=0))
+    results = {}
+    for size in chunk_sizes:
+        stream = verbalizer.streaming()
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        first = None
+        held = 0
+        outputs = []
+        start = time.perf_counter()
+        for count, chunk in enumerate(chunks, start=1):
+            output = stream.feed(chunk)
+            if output and first is None:
+                first = count
+            held += len(stream.pending)
+            outputs.append(output)
+        outputs.append(stream.flush())
+        seconds = time.perf_counter() - start
+        assert ''.join(outputs) == verbalizer.normalize(text)
+        results[size] = {
+            'chars_per_s': len(text) / seconds,
+            'first_output_chunks': first,
+            'mean_held': held / len(chunks),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    for size, result in run().items():
+        print(f"chunk {size:>3}: {result['chars_per_s']:10.0f} chars/s, "
+              f"first output after {result['first_output_chunks']} feeds, "
+              f"{result['mean_held']:.1f} chars held")
@@ -0,0 +1,152 @@
+# benchmarks/bench_threads.py
+
+"""
+Thread-scaling benchmark: one shared verbalizer, many threads.
+
+Every thread normalizes its share of the corpus with the same instance, as
+in a thread-pool server. With the GIL, throughput stays flat as threads are
+added; on a free-threaded build (e.g. python3.13t) it should grow with the
+number of cores. Run the benchmark under several interpreters to compare:
+
+Usage:
+    python -m benchmarks.bench_threads
+    python -m benchmarks.bench_threads --python python3.13 python3.13t
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from verbalizer import SwahiliVerbalizer
+from verbalizer.languages.swahili.number import number_to_words
+
+from .corpus import generate_corpus
+
+
+MODES = ('plain', 'cached', 'stats')
+
+
+def gil_enabled():
+    """Return whether this interpreter runs with the GIL."""
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def make_verbalizer(mode):
+    """Return a fresh verbalizer configured for a benchmark mode."""
+    verbalizer = SwahiliVerbalizer()
+    if mode == 'cached':
+        verbalizer.enable_cache()
+    elif mode == 'stats':
+        verbalizer.enable_stats()
+    return verbalizer
+
+
+def time_threads(verbalizer, texts, threads):
+    """
+    Normalize ``texts`` split over threads sharing one verbalizer.
+
+    Args:
+        verbalizer: The shared instance
+        texts (list): Input sentences
+        threads (int): Number of threads
+
+    Returns:
+        float: Wall time in seconds, from the common start to the last thread
+    """
+    barrier = threading.Barrier(threads + 1)
+    shares = [texts[index::threads] for index in range(threads)]
+
+    def work(share):
+        normalize = verbalizer.normalize
+        barrier.wait()
+        for text in share:
+            normalize(text)
+
+    workers = [threading.Thread(target=work, args=(share,)) for share in shares]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def run(texts, thread_counts=(1, 2, 4, 8), modes=MODES, repeat=3):
+    """
+    Time every mode at every thread count.
+
+    The caches start empty in each repetition, so the cached mode measures a
+    mix of misses and hits.
+
+    Args:
+        texts (list): Input sentences
+        thread_counts (tuple): Numbers of threads to measure
+        modes (tuple): Verbalizer configurations ('plain', 'cached', 'stats')
+        repeat (int): Number of timing repetitions; the best is kept
+
+    Returns:
+        dict: Best time in seconds, keyed ``threads_<mode>_<n>_s``
+    """
+    results = {}
+    for mode in modes:
+        for threads in thread_counts:
+            times = []
+            for _ in range(repeat):
+                number_to_words.cache_clear()
+                times.append(time_threads(make_verbalizer(mode), texts, threads))
+            results[f'threads_{mode}_{threads}_s'] = min(times)
+    return results
+
+
+def report(results, texts, label):
+    """Print throughput and speedup over one thread for each mode."""
+    print(label)
+    for key, seconds in results.items():
+        _, mode, threads, _ = key.split('_')
+        speedup = results[f'threads_{mode}_1_s'] / seconds
+        print(f"{mode:>8} x{threads:<3}: {seconds:.3f} s ({len(texts) / seconds:.0f} texts/s, "
+              f"{speedup:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=20000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--modes', nargs='+', default=list(MODES), choices=MODES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--python', nargs='+', metavar='INTERPRETER',
+                        help="Run the benchmark under each of these interpreters")
+    parser.add_argument('--json', action='store_true', help="Print the results as JSON")
+    args = parser.parse_args()
+
+    options = ['--sentences', str(args.sentences), '--repeat', str(args.repeat),
+               '--threads', *map(str, args.threads), '--modes', *args.modes]
+    if args.python:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+        texts = generate_corpus(sentences=args.sentences)
+        for python in args.python:
+            output = subprocess.run(
+                [python, '-m', 'benchmarks.bench_threads', '--json', *options],
+                check=True, capture_output=True, text=True, cwd=root, env=env,
+            ).stdout
+            data = json.loads(output)
+            report(data['results'], texts, f"{python} (Python {data['python']}, GIL {'on' if data['gil'] else 'off'})")
+        return
+
+    texts = generate_corpus(sentences=args.sentences)
+    results = run(texts, tuple(args.threads), tuple(args.modes), args.repeat)
+    if args.json:
+        print(json.dumps({'python': sys.version.split()[0], 'gil': gil_enabled(), 'results': results}))
+    else:
+        report(results, texts, f"Python {sys.version.split()[0]}, GIL {'on' if gil_enabled() else 'off'}, "
+                               f"{os.cpu_count()} CPUs")
+
+
+if __name__ == "__main__":
+    main()
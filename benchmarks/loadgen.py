@@ -0,0 +1,137 @@
+# benchmarks/loadgen.py
+
+"""
+Load generator for ``python -m verbalizer.serve``.
+
+Sends ``/normalize`` requests from concurrent client threads over keep-alive
+connections and reports request rate and latency percentiles.
+
+Usage:
+    python -m verbalizer.serve --port 8090 --workers 4 &
+    python -m benchmarks.loadgen --port 8090 --clients 32 --duration 10
+    python -m benchmarks.loadgen --unix /tmp/verbalizer.sock
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import threading
+import time
+
+from .corpus import generate_corpus
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, path, timeout=30):
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run(connect, texts, clients=16, duration=5.0, batch=0):
+    """
+    Drive the server from ``clients`` threads for ``duration`` seconds.
+
+    Args:
+        connect (callable): Returns a new http.client connection
+        texts (list): Request texts, cycled through
+        clients (int): Concurrent client threads
+        duration (float): Seconds to run
+        batch (int): Texts per request; 0 sends single ``/normalize`` requests
+
+    Returns:
+        dict: ``requests``, ``errors``, ``req_per_s``, ``p50_ms``, ``p99_ms``
+    """
+    latencies = [[] for _ in range(clients)]
+    errors = [0] * clients
+    deadline = time.perf_counter() + duration
+
+    def client(index):
+        conn = connect()
+        position = index
+        while time.perf_counter() < deadline:
+            if batch:
+                path = '/normalize_batch'
+                chunk = [texts[(position + i) % len(texts)] for i in range(batch)]
+                body = json.dumps({'texts': chunk}).encode('utf-8')
+                position += batch
+            else:
+                path = '/normalize'
+                body = json.dumps({'text': texts[position % len(texts)]}).encode('utf-8')
+                position += clients
+            start = time.perf_counter()
+            try:
+                conn.request('POST', path, body, {'Content-Type': 'application/json'})
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    errors[index] += 1
+                    continue
+            except (OSError, http.client.HTTPException):
+                errors[index] += 1
+                conn.close()
+                conn = connect()
+                continue
+            latencies[index].append(time.perf_counter() - start)
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    merged = sorted(latency for per_client in latencies for latency in per_client)
+    return {
+        'requests': len(merged),
+        'errors': sum(errors),
+        'req_per_s': len(merged) / elapsed,
+        'p50_ms': percentile(merged, 50) * 1000,
+        'p99_ms': percentile(merged, 99) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--unix', help="connect over this Unix domain socket instead of TCP")
+    parser.add_argument('-c', '--clients', type=int, default=16)
+    parser.add_argument('-d', '--duration', type=float, default=5.0)
+    parser.add_argument('-b', '--batch', type=int, default=0,
+                        help="texts per /normalize_batch request (default: single /normalize requests)")
+    parser.add_argument('--sentences', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    if args.unix:
+        connect = lambda: UnixHTTPConnection(args.unix)  # noqa: E731
+    else:
+        connect = lambda: http.client.HTTPConnection(args.host, args.port, timeout=30)  # noqa: E731
+
+    texts = generate_corpus(sentences=args.sentences)
+    result = run(connect, texts, args.clients, args.duration, args.batch)
+    print(f"{'requests':>10}: {result['requests']} ({result['errors']} errors)")
+    print(f"{'req/s':>10}: {result['req_per_s']:.0f}")
+    print(f"{'p50':>10}: {result['p50_ms']:.2f} ms")
+    print(f"{'p99':>10}: {result['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# benchmarks/run.py
+
+"""
+Run the benchmark suite, save the results as JSON and compare them with a
+saved baseline.
+
+Usage:
+    python -m benchmarks.run -o baseline.json
+    python -m benchmarks.run -o current.json --baseline baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import verbalizer
+
+from . import bench_batch, bench_normalize, bench_number
+from .corpus import generate_corpus
+
+
+def run_suite(sentences=2000, length=12, density=0.2, seed=0, repeat=5, workers=None, batch=True):
+    """
+    Run every benchmark on one generated corpus.
+
+    Returns:
+        dict: ``{'meta': {...}, 'results': {metric: value}}``; metrics
+        ending in ``_s`` are times in seconds
+    """
+    texts = generate_corpus(sentences, length, density, seed)
+    results = {}
+    for key, value in bench_number.run(bench_number.make_values(seed=seed), repeat).items():
+        results[f'number.{key}'] = value
+    for key, value in bench_normalize.run(texts, repeat).items():
+        results[f'normalize.{key}'] = value
+    if batch:
+        for key, value in bench_batch.run(texts, workers).items():
+            results[f'batch.{key}'] = value
+
+    meta = {
+        'version': verbalizer.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'corpus': {
+            'sentences': sentences,
+            'length': length,
+            'density': density,
+            'seed': seed,
+            'chars': sum(map(len, texts)),
+        },
+    }
+    return {'meta': meta, 'results': results}
+
+
+def compare(current, baseline, threshold=0.1):
+    """
+    Compare timings with a baseline.
+
+    Args:
+        current (dict): Results of this run
+        baseline (dict): Saved results
+        threshold (float): Relative slowdown reported as a regression
+
+    Returns:
+        list: ``(metric, baseline, current, ratio, regressed)`` for every
+        timing present in both runs
+    """
+    rows = []
+    for metric, old in baseline['results'].items():
+        new = current['results'].get(metric)
+        if new is None or not metric.endswith('_s') or not old:
+            continue
+        ratio = new / old
+        rows.append((metric, old, new, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main(argv=None):
+    """Entry point for ``python -m benchmarks.run``."""
+    parser = argparse.ArgumentParser(description="Run the verbalizer benchmark suite.")
+    parser.add_argument('-o', '--output', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="compare with results saved in this JSON file")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="relative slowdown counted as a regression (default: 0.1)")
+    parser.add_argument('--sentences', type=int, default=2000)
+    parser.add_argument('--length', type=int, default=12)
+    parser.add_argument('--density', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--no-batch', dest='batch', action='store_false',
+                        help="skip the thread and process pool benchmarks")
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.sentences, args.length, args.density, args.seed,
+                        args.repeat, args.workers, args.batch)
+    for metric, value in current['results'].items():
+        print(f"{metric:<36} {value:10.4f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    rows = compare(current, baseline, args.threshold)
+    print(f"\n{'metric':<36} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for metric, old, new, ratio, regressed in rows:
+        flag = '  REGRESSION' if regressed else ''
+        print(f"{metric:<36} {old:10.4f} {new:10.4f} {ratio:7.2f}{flag}")
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
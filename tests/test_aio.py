@@ -0,0 +1,65 @@
+# tests/test_aio.py
+
+"""
+Test suite for the asyncio API.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+
+
+LONG_TEXT = "Nina KES 1500 na saa ni 14:30 tarehe 25/12/2024 na watoto 3. " * 200
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+class TestAsyncNormalize:
+    """Test anormalize and anormalize_batch."""
+    
+    def test_short_and_long(self, verbalizer):
+        """Test that inline and executor paths match normalize()."""
+        async def main():
+            return await asyncio.gather(
+                verbalizer.anormalize("Nina watoto 3"),
+                verbalizer.anormalize(LONG_TEXT),
+            )
+        
+        with ThreadPoolExecutor(2) as executor:
+            verbalizer.configure_async(executor=executor, inline_chars=100, piece_chars=500)
+            short, long = asyncio.run(main())
+        assert short == "Nina watoto tatu"
+        assert long == verbalizer.normalize(LONG_TEXT)
+    
+    def test_collect_offsets(self, verbalizer):
+        """Test that failure offsets refer to the whole text."""
+        text = LONG_TEXT + "45/13/2024"
+        verbalizer.configure_async(inline_chars=100, piece_chars=500)
+        result, failures = asyncio.run(verbalizer.anormalize(text, errors='collect'))
+        assert result == verbalizer.normalize(text, errors='ignore')
+        assert [f.offset for f in failures] == [len(LONG_TEXT)]
+    
+    def test_batch_order(self, verbalizer):
+        """Test that batch results keep the input order."""
+        texts = ["3", LONG_TEXT, "KES 5", "14:30"] * 3
+        verbalizer.configure_async(inline_chars=50, max_concurrency=2)
+        result = asyncio.run(verbalizer.anormalize_batch(texts))
+        assert result == [verbalizer.normalize(text) for text in texts]
+    
+    def test_cancellation(self, verbalizer):
+        """Test that a cancelled call raises CancelledError."""
+        async def main():
+            task = asyncio.ensure_future(verbalizer.anormalize(LONG_TEXT * 10))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        verbalizer.configure_async(inline_chars=100)
+        asyncio.run(main())
@@ -0,0 +1,63 @@
+# tests/test_batch.py
+
+"""
+Test suite for batch normalization.
+"""
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.batch import chunk_by_chars
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+@pytest.fixture
+def texts():
+    """Texts of very different lengths."""
+    return [
+        "Nina KES 5000",
+        "Tutaonana saa 14:30 tarehe 25/12/2024",
+        "Habari yako leo",
+        "Bei ni 150000 " * 50,
+        "",
+        "Nina watoto 3",
+    ] * 5
+
+
+class TestChunking:
+    """Test chunking by character count."""
+    
+    def test_chunks_keep_order(self, texts):
+        """Test that chunks concatenate back to the input."""
+        chunks = chunk_by_chars(texts, 100)
+        assert [text for chunk in chunks for text in chunk] == texts
+    
+    def test_chunks_are_bounded_by_characters(self):
+        """Test that chunks are split on total characters, not item count."""
+        chunks = chunk_by_chars(["a" * 40] * 4 + ["b" * 500, "c"], 100)
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1, 1]
+
+
+class TestNormalizeBatch:
+    """Test normalize_batch."""
+    
+    @pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+    def test_matches_normalize(self, verbalizer, texts, executor):
+        """Test that every executor returns normalize() results in order."""
+        expected = [verbalizer.normalize(text) for text in texts]
+        result = verbalizer.normalize_batch(texts, workers=2, executor=executor, chunksize=200)
+        assert result == expected
+    
+    def test_accepts_iterables(self, verbalizer):
+        """Test that a generator of texts is accepted."""
+        result = verbalizer.normalize_batch((t for t in ["3", "5"]), executor="serial")
+        assert result == ["tatu", "tano"]
+    
+    def test_unknown_executor(self, verbalizer):
+        """Test that an unknown executor is rejected."""
+        with pytest.raises(ValueError):
+            verbalizer.normalize_batch(["3"], executor="gpu")
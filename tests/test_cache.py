@@ -0,0 +1,143 @@
+# tests/test_cache.py
+
+"""
+Test suite for the in-memory result caches.
+"""
+
+import pickle
+import warnings
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.cache import LRUCache
+from verbalizer.errors import NormalizationError
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+class TestLRUCache:
+    """Test the bounded LRU cache."""
+
+    def test_entry_limit(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LRUCache(max_entries=2, max_bytes=1 << 20)
+        cache.put('a', 'x')
+        cache.put('b', 'y')
+        assert cache.get('a') == 'x'
+        cache.put('c', 'z')
+        assert 'b' not in cache and 'a' in cache and 'c' in cache
+        assert cache.evictions == 1
+
+    def test_byte_limit(self):
+        """Test that entries are evicted to stay under the byte limit."""
+        cache = LRUCache(max_entries=100, max_bytes=1000)
+        for i in range(20):
+            cache.put(str(i), 'x' * 100)
+        assert 0 < len(cache) < 20
+        assert cache.bytes <= 1000
+        cache.put('huge', 'x' * 5000)
+        assert 'huge' not in cache
+
+    def test_hit_rate(self):
+        """Test hit and miss counting."""
+        cache = LRUCache(max_entries=10, max_bytes=1 << 20)
+        assert cache.hit_rate == 0.0
+        cache.get('a')
+        cache.put('a', 'x')
+        cache.get('a')
+        cache.get('a')
+        info = cache.info()
+        assert (info['hits'], info['misses'], info['entries']) == (2, 1, 1)
+        assert info['hit_rate'] == pytest.approx(2 / 3)
+
+
+class TestNormalizerCache:
+    """Test caching in BaseNormalizer."""
+
+    def test_off_by_default(self, verbalizer):
+        """Test that nothing is cached unless asked for."""
+        verbalizer.normalize("Nina watoto 3")
+        assert verbalizer.cache is None
+
+    def test_results_unchanged(self, verbalizer):
+        """Test that cached results equal uncached ones."""
+        texts = ["Bei ni KES 100", "saa 14:30 na watoto 3", "Bei ni KES 100", "KES 100 na 3"]
+        expected = [verbalizer.normalize(text) for text in texts]
+        cache = verbalizer.enable_cache()
+        assert [verbalizer.normalize(text) for text in texts] == expected
+        assert [verbalizer.normalize(text) for text in texts] == expected
+        info = cache.info()
+        assert info['texts']['hits'] == 5
+        assert info['texts']['misses'] == 3
+        assert info['expressions']['hits'] > 0
+
+    def test_expression_level(self, verbalizer):
+        """Test that expressions are shared between different texts."""
+        cache = verbalizer.enable_cache(max_texts=0)
+        verbalizer.normalize("Bei ni KES 100")
+        verbalizer.normalize("Leo KES 100 tu")
+        assert ('currency', 'KES 100') in cache.expressions
+        assert cache.expressions.hits == 1
+        assert len(cache.texts) == 0
+
+    def test_failures_not_cached(self, verbalizer):
+        """Test that failing expressions are reported on every call."""
+        verbalizer.enable_cache()
+        for _ in range(2):
+            _, failures = verbalizer.normalize("tarehe 45/13/2024", errors='collect')
+            assert [f.category for f in failures] == ['date']
+        with pytest.warns(UserWarning):
+            verbalizer.normalize("tarehe 45/13/2024 leo")
+
+    def test_warmup(self, verbalizer):
+        """Test that warmup fills the caches."""
+        cache = verbalizer.enable_cache()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert verbalizer.warmup(["KES 100", "saa 14:30", "tarehe 45/13/2024"]) == 3
+        verbalizer.normalize("KES 100")
+        assert cache.texts.hits == 1
+
+    def test_warmup_with_pack_texts(self, verbalizer):
+        """Test that warmup defaults to the sample sentences of the language pack."""
+        cache = verbalizer.enable_cache()
+        texts = verbalizer._get_warmup_texts()
+        assert texts
+        assert verbalizer.warmup() == len(texts)
+        verbalizer.normalize(texts[0])
+        assert cache.texts.hits == 1
+
+    def test_policy_after_a_hit(self, verbalizer):
+        """Test that a text warmed up under 'ignore' still fails under other policies."""
+        verbalizer.enable_cache()
+        verbalizer.warmup(["32/13/2024"])
+        with pytest.raises(NormalizationError):
+            verbalizer.normalize("32/13/2024", errors='raise')
+        _, failures = verbalizer.normalize("32/13/2024", errors='collect')
+        assert [f.category for f in failures] == ['date']
+        verbalizer.normalize("KES 100")
+        assert verbalizer.normalize("KES 100", errors='collect') == (verbalizer.normalize("KES 100"), [])
+
+    def test_hits_are_counted_in_stats(self, verbalizer):
+        """Test that texts served from the cache are recorded with their matches."""
+        verbalizer.enable_cache()
+        with verbalizer.collect_stats() as stats:
+            for _ in range(3):
+                verbalizer.normalize("KES 100 na watoto 3")
+        assert stats.calls['normalize'] == 3
+        assert stats.cache_hits['normalize'] == 2
+        assert stats.matches == {'currency': 3, 'number': 3}
+
+    def test_disable_and_pickle(self, verbalizer):
+        """Test that caches can be turned off and are not pickled with contents."""
+        verbalizer.enable_cache(max_texts=5)
+        verbalizer.normalize("KES 100")
+        clone = pickle.loads(pickle.dumps(verbalizer))
+        assert len(clone.cache.texts) == 0 and clone.cache.texts.max_entries == 5
+        assert clone.normalize("KES 100") == verbalizer.normalize("KES 100")
+        cache = verbalizer.disable_cache()
+        assert verbalizer.cache is None and len(cache.texts) == 0
@@ -0,0 +1,117 @@
+# tests/test_cli.py
+
+"""
+Test suite for the verbalize command.
+"""
+
+import json
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.cli import main
+
+
+LINES = ["Nina KES 5000", "saa 14:30 tarehe 25/12/2024", "", "Nina watoto 3"] * 10
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+class TestVerbalizeCommand:
+    """Test the verbalize entry point."""
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_text(self, verbalizer, tmp_path, capsys, workers):
+        """Test plain text in input order, with a report on stderr."""
+        src = tmp_path / "in.txt"
+        dst = tmp_path / "out.txt"
+        src.write_text("\n".join(LINES) + "\n", encoding='utf-8')
+        assert main([str(src), "-o", str(dst), "--workers", str(workers), "--batch-lines", "3"]) == 0
+        expected = [verbalizer.normalize(line) for line in LINES]
+        assert dst.read_text(encoding='utf-8').split("\n")[:-1] == expected
+        report = capsys.readouterr().err
+        assert "lines: 40" in report
+        assert "currency=10" in report
+    
+    def test_cache_db_report(self, tmp_path, capsys):
+        """Test that a rerun served from the cache reports the same matches."""
+        src = tmp_path / "in.txt"
+        src.write_text("\n".join(LINES) + "\n", encoding='utf-8')
+        reports = []
+        for _ in range(2):
+            main([str(src), "-o", str(tmp_path / "out.txt"), "--cache-db", str(tmp_path / "cache.db")])
+            reports.append(capsys.readouterr().err.splitlines()[-1])
+        assert reports[0] == reports[1]
+        assert "currency=10" in reports[1]
+    
+    def test_unordered(self, verbalizer, tmp_path):
+        """Test that unordered output has the same lines."""
+        src = tmp_path / "in.txt"
+        dst = tmp_path / "out.txt"
+        src.write_text("\n".join(LINES) + "\n", encoding='utf-8')
+        main([str(src), "-o", str(dst), "-w", "2", "--batch-lines", "1", "--unordered", "-q"])
+        expected = [verbalizer.normalize(line) for line in LINES]
+        assert sorted(dst.read_text(encoding='utf-8').split("\n")[:-1]) == sorted(expected)
+    
+    def test_jsonl_field(self, tmp_path):
+        """Test that only the chosen JSONL field is normalized."""
+        src = tmp_path / "in.jsonl"
+        dst = tmp_path / "out.jsonl"
+        src.write_text(json.dumps({"id": "3", "sentence": "Nina watoto 3"}) + "\n", encoding='utf-8')
+        main([str(src), "-o", str(dst), "--format", "jsonl", "--field", "sentence", "-q"])
+        record = json.loads(dst.read_text(encoding='utf-8'))
+        assert record == {"id": "3", "sentence": "Nina watoto tatu"}
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_malformed_jsonl(self, tmp_path, workers):
+        """Test that a line that is not a JSON object stops the run with its line number."""
+        src = tmp_path / "in.jsonl"
+        lines = [json.dumps({"text": "Nina watoto 3"})] * 5 + ['{"text": "4"', "[1]"]
+        src.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        with pytest.raises(SystemExit, match="line 6: invalid JSONL record"):
+            main([str(src), "-o", str(tmp_path / "out.jsonl"), "--format", "jsonl",
+                  "-w", str(workers), "--batch-lines", "2", "-q"])
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_records_before_malformed_line(self, tmp_path, workers):
+        """Test that the records before a malformed line are written, its batch included."""
+        src = tmp_path / "in.jsonl"
+        dst = tmp_path / "out.jsonl"
+        lines = [json.dumps({"text": f"Nina watoto {n}"}) for n in range(1, 6)] + ["[1]"]
+        src.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        with pytest.raises(SystemExit, match="line 6"):
+            main([str(src), "-o", str(dst), "--format", "jsonl",
+                  "-w", str(workers), "--batch-lines", "4", "-q"])
+        records = [json.loads(line) for line in dst.read_text(encoding='utf-8').splitlines()]
+        assert [record["text"] for record in records] == \
+            ["Nina watoto moja", "Nina watoto mbili", "Nina watoto tatu", "Nina watoto nne", "Nina watoto tano"]
+    
+    def test_invalid_utf8(self, tmp_path):
+        """Test that a line that is not UTF-8 is reported with its line number."""
+        src = tmp_path / "in.txt"
+        dst = tmp_path / "out.txt"
+        src.write_bytes(b"Nina watoto 3\n\xff 4\n")
+        with pytest.raises(SystemExit, match="line 2: invalid UTF-8"):
+            main([str(src), "-o", str(dst), "-q"])
+        assert dst.read_text(encoding='utf-8') == "Nina watoto tatu\n"
+        assert main([str(src), "-o", str(dst), "--errors", "ignore", "-q"]) == 0
+        assert dst.read_bytes() == b"Nina watoto tatu\n\xff 4\n"
+    
+    def test_malformed_jsonl_ignored(self, tmp_path):
+        """Test that malformed lines are copied through under --errors ignore."""
+        src = tmp_path / "in.jsonl"
+        dst = tmp_path / "out.jsonl"
+        src.write_text('{"text": "3"\n[1]\n{"text": "3"}\n', encoding='utf-8')
+        assert main([str(src), "-o", str(dst), "--format", "jsonl", "--errors", "ignore", "-q"]) == 0
+        assert dst.read_text(encoding='utf-8') == '{"text": "3"\n[1]\n{"text": "tatu"}\n'
+    
+    def test_tsv_column(self, tmp_path):
+        """Test that only the chosen TSV column is normalized."""
+        src = tmp_path / "in.tsv"
+        dst = tmp_path / "out.tsv"
+        src.write_text("a.wav\t3\tNina watoto 3\n", encoding='utf-8')
+        main([str(src), "-o", str(dst), "--format", "tsv", "--column", "2", "-q"])
+        assert dst.read_text(encoding='utf-8') == "a.wav\t3\tNina watoto tatu\n"
@@ -0,0 +1,161 @@
+# tests/test_currency.py
+
+"""
+Test suite for currency detection over codes, symbols and local forms.
+"""
+
+import json
+import os
+import re
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.currencies import ISO_4217, currency_regex, trie_regex
+from verbalizer.languages.swahili import config
+from verbalizer.languages.swahili.currency import CURRENCY_INDEX, currency_code
+from verbalizer.packs import PackError, compile_pack
+
+SWAHILI_PACK = os.path.join(os.path.dirname(config.__file__), 'sw.json')
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+@pytest.fixture
+def spec():
+    """The parsed Swahili pack."""
+    with open(SWAHILI_PACK, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestTrieRegex:
+    """Test the prefix-tree regex builder."""
+
+    def test_factoring(self):
+        """Test that shared prefixes are merged."""
+        assert trie_regex(['KES', 'KSh', 'KShs']) == 'K(?:ES|Shs?)'
+        assert trie_regex([]) == ''
+
+    def test_matches_exactly_the_forms(self):
+        """Test the tree against a plain alternation on every code."""
+        regex = re.compile(trie_regex(ISO_4217 + ('KSh', 'KShs', '$', 'US$')))
+        for form in ISO_4217 + ('KSh', 'KShs', '$', 'US$'):
+            assert regex.fullmatch(form)
+        for form in ('KE', 'KESS', 'KS', 'kes', 'US', '$$'):
+            assert not regex.fullmatch(form)
+
+    def test_longest_form_first(self):
+        """Test that a longer form wins over its prefix."""
+        assert re.match(trie_regex(['KSh', 'KShs']), "KShs").group() == "KShs"
+
+    def test_boundaries(self):
+        """Test the boundaries added for prefix and suffix position."""
+        prefix = re.compile(currency_regex(['KES'], ['$'], 'prefix'))
+        assert prefix.search(" $") and not prefix.search("a$")
+        assert prefix.search(" KES") and not prefix.search("aKES")
+        suffix = re.compile(currency_regex(['KES'], ['€'], 'suffix'))
+        assert suffix.match("€") and not suffix.match("KESa")
+
+    def test_codes_in_upper_and_title_case(self):
+        """Test that pack codes match in upper and title case and other forms exactly."""
+        regex = re.compile(currency_regex(['KES'], ['CHF', 'KSh']))
+        for form in ('KES', 'Kes', 'CHF', 'KSh'):
+            assert regex.fullmatch(form)
+        for form in ('kes', 'kES', 'chf', 'ksh'):
+            assert not regex.fullmatch(form)
+
+    def test_codes_in_any_case(self):
+        """Test that any_case takes every spelling of the pack codes only."""
+        regex = re.compile(currency_regex(['KES'], ['CHF', 'KSh'], any_case=True))
+        for form in ('KES', 'Kes', 'kes', 'kES', 'CHF', 'KSh'):
+            assert regex.fullmatch(form)
+        for form in ('chf', 'ksh'):
+            assert not regex.fullmatch(form)
+
+
+class TestCurrencyIndex:
+    """Test the form -> code index compiled from the pack."""
+
+    def test_forms(self):
+        """Test that codes, symbols and ISO codes resolve."""
+        assert CURRENCY_INDEX['KSh'] == 'KES'
+        assert CURRENCY_INDEX['₦'] == 'NGN'
+        assert CURRENCY_INDEX['$'] == 'USD'
+        assert CURRENCY_INDEX['CHF'] == 'CHF'
+        assert set(ISO_4217) <= set(CURRENCY_INDEX)
+
+    def test_lookup_ignores_case_of_codes(self):
+        """Test that a code written in lower case finds its currency."""
+        assert currency_code('Kes') == 'KES'
+        assert currency_code('US$') == 'USD'
+
+    def test_duplicate_symbol(self, spec):
+        """Test that one symbol cannot stand for two currencies."""
+        spec['currencies']['TZS']['symbols'].append('KSh')
+        with pytest.raises(PackError, match="KSh"):
+            compile_pack(spec)
+
+    def test_unknown_table(self, spec):
+        """Test that an unknown code table is rejected."""
+        spec['currency_codes'] = 'iso9999'
+        with pytest.raises(PackError, match="iso9999"):
+            compile_pack(spec)
+
+
+class TestCurrencyDetection:
+    """Test currency amounts end to end."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("KSh 500", "shilingi mia tano"),
+        ("TSh 500", "shilingi mia tano"),
+        ("₦200", "naira mia mbili"),
+        ("$5", "dola tano"),
+        ("€50", "yuro hamsini"),
+        ("£10", "pauni kumi"),
+    ])
+    def test_symbols(self, verbalizer, text, expected):
+        """Test symbols and local forms before the amount."""
+        assert verbalizer.normalize(text) == expected
+
+    def test_no_space(self, verbalizer):
+        """Test a code written against the amount."""
+        assert verbalizer.normalize("KES5000 leo") == "shilingi elfu tano leo"
+
+    def test_suffix(self, verbalizer):
+        """Test forms after the amount."""
+        assert verbalizer.normalize("5000 KES") == "shilingi elfu tano"
+        assert verbalizer.normalize("50€ na 20 USh") == "yuro hamsini na shilingi ishirini"
+
+    def test_amount_between_forms(self, verbalizer):
+        """Test that an amount followed by another amount is not a suffix form."""
+        assert verbalizer.normalize("3 KES 100") == "tatu shilingi mia moja"
+
+    def test_iso_code_without_words(self, verbalizer):
+        """Test that a code the pack has no words for is read out as written."""
+        assert verbalizer.normalize("CHF 20") == "CHF ishirini"
+
+    def test_words_are_not_codes(self, verbalizer):
+        """Test that forms inside words are not detected."""
+        assert verbalizer.normalize("MKESA 5") == "MKESA tano"
+        assert verbalizer.normalize("5 kesho") == "tano kesho"
+
+    @pytest.mark.parametrize("text", [
+        "Azam FC 2", "Gari la RF 5", "5 zar", "2020 usd", "He is 20 ALL", "all 5",
+    ])
+    def test_words_that_look_like_forms(self, verbalizer, text):
+        """Test that short words, lower-case codes after a number and other ISO codes are not currencies."""
+        with verbalizer.collect_stats() as stats:
+            verbalizer.normalize(text)
+        assert 'currency' not in stats.matches
+
+    def test_title_case_code(self, verbalizer):
+        """Test that a pack code in title case is still read."""
+        assert verbalizer.normalize("Kes 5 na 5 Usd") == "shilingi tano na dola tano"
+
+    def test_dates_and_times_keep_their_digits(self, verbalizer):
+        """Test that a suffix form does not take the end of a date or time."""
+        assert verbalizer.normalize("15/03/2024 KES 500").endswith("shilingi mia tano")
+        assert verbalizer.normalize("saa 14:30 KES").startswith("saa saa kumi na nne")
@@ -0,0 +1,123 @@
+# tests/test_detector.py
+
+"""
+Test suite for the single-pass pattern detector.
+"""
+
+import re
+import warnings
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.detector import Detector, PRIORITY
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+def sequential(verbalizer, text):
+    """Reference result: each category substituted over the whole text in turn."""
+    text = verbalizer.normalize_currency(text)
+    text = verbalizer.normalize_dates(text)
+    text = verbalizer.normalize_time(text)
+    return verbalizer.normalize_numbers(text)
+
+
+class TestDetector:
+    """Test the prioritized scanner."""
+
+    def test_priority_order(self, verbalizer):
+        """Test that categories are ordered currency > date > time > number."""
+        assert [c for c, _ in verbalizer.detector.order] == list(PRIORITY)
+
+    def test_spans(self, verbalizer):
+        """Test that scan reports spans in source offsets."""
+        text = "Bei KES 100 saa 14:30 leo 5"
+        spans = list(verbalizer.detector.scan(text, lambda category, match: category))
+        assert [(text[s:e], c) for s, e, c, _ in spans] == [
+            ("KES 100", "currency"),
+            ("14:30 ", "time"),
+            ("5", "number"),
+        ]
+
+    def test_unmatched_text_is_returned_unchanged(self):
+        """Test that text without matches is passed through."""
+        detector = Detector({'number': re.compile(r'\d+')})
+        text = "hakuna tarakimu"
+        assert detector.sub(text, lambda category, match: "x") is text
+
+    @pytest.mark.parametrize("text", [
+        "Nina KES 5000 na tutaonana saa 14:30 tarehe 25/12/2024",
+        "12:30/12/2024",
+        "1.5/5/2024",
+        "saa 14:30 5",
+        "14:30 KES 5",
+        "14:30 1/1/2024",
+        "KES 10/12/2024",
+        "kes 100.5.3",
+        "45/13/2024 na 3",
+        "99:99 14:30:0KES53.14-",
+        "14:30 60556.38",
+        "14:301 14:30   1.5:99:99",
+        "1.15/03/2024 1:15/03/2024",
+        "2:36 €7",
+        "saa 2:36 $7 leo",
+        "",
+    ])
+    def test_matches_sequential_passes(self, verbalizer, text):
+        """Test that one pass gives the same result as four sequential passes."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            assert verbalizer.normalize(text) == sequential(verbalizer, text)
+
+    def test_uncombinable_patterns(self):
+        """Test patterns that cannot share one regex, such as backreferences."""
+        detector = Detector({'date': re.compile(r'(\d)\1'), 'number': re.compile(r'\d+')})
+        assert detector._compiled is None
+        assert detector.sub("11 23 445", lambda category, match: f"<{category}>") == \
+            "<date> <number> <date><number>"
+
+    def test_one_replacement_per_expression(self, verbalizer):
+        """Test that nothing is replaced twice when the exact scan takes over."""
+        calls = []
+
+        def replace(category, match):
+            calls.append((category, match.span()))
+            return category if category == 'number' else None
+
+        verbalizer.detector.sub("KES 5 tarehe 45/13/2024 na 3", replace)
+        assert len(calls) == len(set(calls))
+
+
+class TestNormalizeWithSpans:
+    """Test span and alignment output."""
+
+    def test_alignment(self, verbalizer):
+        """Test that spans map output regions back to the source."""
+        text = "Nina KES 5000 na saa 14:30 leo, watoto 3"
+        normalized, spans = verbalizer.normalize_with_spans(text)
+        assert normalized == verbalizer.normalize(text)
+        assert [span.category for span in spans] == ['currency', 'time', 'number']
+        for span in spans:
+            assert text[span.start:span.end] == span.text
+            assert normalized[span.out_start:span.out_end] == verbalizer.normalize(span.text).rstrip()
+        assert spans[0].text == "KES 5000"
+        assert spans[-1].out_end == len(normalized)
+
+    def test_compact_storage(self, verbalizer):
+        """Test that offsets are stored flat and spans are built on access."""
+        _, spans = verbalizer.normalize_with_spans("3 na 4 na 5")
+        assert len(spans) == 3
+        assert list(spans.offsets()[:4]) == [0, 1, 0, 4]
+        assert spans[-1] == spans[2]
+        with pytest.raises(IndexError):
+            spans[3]
+
+    def test_no_spans(self, verbalizer):
+        """Test text without expressions."""
+        normalized, spans = verbalizer.normalize_with_spans("Habari yako")
+        assert normalized == "Habari yako"
+        assert len(spans) == 0
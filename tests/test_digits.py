@@ -0,0 +1,79 @@
+# tests/test_digits.py
+
+"""
+Test suite for digit-by-digit reading of long digit runs.
+"""
+
+import time
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.languages.swahili.number import (
+    NumberReading, number_to_words, read_digits, verbalize_number,
+)
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+class TestDigitReading:
+    """Test the cardinal / digit-by-digit rule."""
+    
+    def test_phone_number(self):
+        """Test that a leading zero makes a run an identifier when enabled."""
+        verbalizer = SwahiliVerbalizer(leading_zero_digits=3)
+        assert verbalizer.normalize("Piga 0712345678") == \
+            "Piga sifuri saba moja mbili tatu nne tano sita saba nane"
+        assert verbalizer.normalize("05") == "tano"
+    
+    def test_short_leading_zero_is_cardinal(self, verbalizer):
+        """Test that runs with a leading zero stay cardinals by default."""
+        assert verbalizer.normalize("05") == "tano"
+        assert verbalizer.normalize("0.5") == "sifuri nukta tano"
+        assert verbalizer.normalize("007") == "saba"
+        assert verbalizer.normalize("1,000") == "moja,sifuri"
+    
+    def test_long_run(self, verbalizer):
+        """Test that runs over the cardinal limit are read digit by digit."""
+        assert verbalizer.normalize("123456789012345") == number_to_words(123456789012345)
+        assert verbalizer.normalize("1234567890123456") == read_digits("1234567890123456")
+    
+    def test_thresholds(self):
+        """Test configurable thresholds."""
+        verbalizer = SwahiliVerbalizer(max_cardinal_digits=4, leading_zero_digits=0)
+        assert verbalizer.normalize("1234") == "elfu moja na mia mbili na thelathini na nne"
+        assert verbalizer.normalize("12345") == "moja mbili tatu nne tano"
+        assert verbalizer.normalize("0712") == "mia saba na kumi na mbili"
+        with pytest.raises(ValueError):
+            NumberReading(max_cardinal_digits=100)
+    
+    def test_currency_ignores_leading_zero_rule(self, verbalizer):
+        """Test that amounts are cardinals unless over the length limit."""
+        assert verbalizer.normalize("KES 0100") == "shilingi mia moja"
+        assert verbalizer.normalize("KES " + "9" * 20) == "shilingi " + read_digits("9" * 20)
+    
+    def test_decimals(self):
+        """Test that decimal digits are read separately at any length."""
+        assert verbalize_number("3." + "14" * 5) == "tatu nukta " + " ".join(["moja nne"] * 5)
+    
+    def test_beyond_int_limit(self, verbalizer):
+        """Test runs longer than Python's int-to-str digit limit."""
+        digits = "7" * 50000
+        result = verbalizer.normalize(digits, errors='raise')
+        assert result.count("saba") == 50000
+    
+    def test_linear_cost(self):
+        """Test that reading cost grows linearly with the run length."""
+        def cost(length):
+            digits = "5" * length
+            start = time.perf_counter()
+            for _ in range(5):
+                verbalize_number(digits)
+            return time.perf_counter() - start
+        
+        cost(10000)
+        assert cost(400000) < cost(20000) * 20 * 4
+
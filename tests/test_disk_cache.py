@@ -0,0 +1,161 @@
+# tests/test_disk_cache.py
+
+"""
+Test suite for the persistent SQLite cache.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import verbalizer as verbalizer_package
+from verbalizer import SwahiliVerbalizer
+from verbalizer.disk_cache import DiskCache
+
+
+TEXTS = ["Nina KES 1500", "saa 14:30 leo", "tarehe 25/12/2024", "watoto 3"]
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+def fill(path, start):
+    """Write entries from another process."""
+    cache = DiskCache(path, 'test', 'v1', batch_size=10)
+    for i in range(start, start + 50):
+        cache.put(f"text {i}", f"result {i}")
+    cache.close()
+
+
+class TestDiskCache:
+    """Test DiskCache on its own."""
+
+    def test_roundtrip_and_batching(self, tmp_path):
+        """Test that entries are buffered and written in batches."""
+        path = tmp_path / 'cache.db'
+        cache = DiskCache(path, 'test', 'v1', batch_size=3)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert DiskCache(path, 'test', 'v1').get("a") is None
+        assert cache.get("a") == "A"
+        cache.put("c", "C")
+        reader = DiskCache(path, 'test', 'v1')
+        assert [reader.get(t) for t in "abc"] == ["A", "B", "C"]
+        assert reader.get("d") is None
+        assert (reader.hits, reader.misses) == (3, 1)
+
+    def test_match_counts(self, tmp_path):
+        """Test that match counts are stored with the result."""
+        path = tmp_path / 'cache.db'
+        cache = DiskCache(path, 'test', 'v1')
+        cache.put("a", "A", [('currency', 2), ('number', 1)])
+        cache.put("b", "B")
+        assert cache.get_entry("a") == ("A", (('currency', 2), ('number', 1)))
+        cache.close()
+        reader = DiskCache(path, 'test', 'v1')
+        assert reader.get_entry("a") == ("A", (('currency', 2), ('number', 1)))
+        assert reader.get_entry("b") == ("B", ())
+
+    def test_namespace_invalidation(self, tmp_path):
+        """Test that a new namespace drops the language's old entries only."""
+        path = tmp_path / 'cache.db'
+        for language in ('test', 'other'):
+            cache = DiskCache(path, language, 'v1')
+            cache.put("a", "A")
+            cache.close()
+        assert DiskCache(path, 'test', 'v2').get("a") is None
+        assert DiskCache(path, 'test', 'v1').get("a") is None
+        assert DiskCache(path, 'other', 'v1').get("a") == "A"
+
+    def test_concurrent_writers(self, tmp_path):
+        """Test that several processes can write to one database."""
+        path = str(tmp_path / 'cache.db')
+        with ProcessPoolExecutor(4) as pool:
+            list(pool.map(fill, [path] * 4, range(0, 200, 50)))
+        cache = DiskCache(path, 'test', 'v1')
+        assert all(cache.get(f"text {i}") == f"result {i}" for i in range(200))
+
+    def test_size_cap(self, tmp_path):
+        """Test that the least recently used entries are evicted over the cap."""
+        cache = DiskCache(tmp_path / 'cache.db', 'test', 'v1', max_bytes=256 * 1024, batch_size=100)
+        for i in range(5000):
+            cache.put(f"text {i}", "x" * 200)
+        cache.flush()
+        assert cache.evictions > 0
+        assert cache.size() <= 256 * 1024
+        assert cache.get("text 4999") is not None
+        assert cache.get("text 0") is None
+
+
+class TestNormalizerDiskCache:
+    """Test the disk cache behind BaseNormalizer.normalize."""
+
+    def test_results_reused_across_instances(self, verbalizer, tmp_path):
+        """Test that a second run is served from the database."""
+        path = tmp_path / 'cache.db'
+        expected = [verbalizer.normalize(text) for text in TEXTS]
+        verbalizer.enable_disk_cache(path)
+        assert [verbalizer.normalize(text) for text in TEXTS] == expected
+        verbalizer.disable_disk_cache()
+
+        second = SwahiliVerbalizer()
+        cache = second.enable_disk_cache(path)
+        assert [second.normalize(text) for text in TEXTS] == expected
+        assert cache.hit_rate == 1.0
+
+    def test_version_change_invalidates(self, verbalizer, tmp_path, monkeypatch):
+        """Test that entries from another library version are not used."""
+        path = tmp_path / 'cache.db'
+        verbalizer.enable_disk_cache(path)
+        verbalizer.normalize("watoto 3")
+        verbalizer.disable_disk_cache()
+
+        monkeypatch.setattr(verbalizer_package, '__version__', '99.0')
+        cache = SwahiliVerbalizer().enable_disk_cache(path)
+        assert cache.get("watoto 3") is None
+
+    def test_fingerprint(self, verbalizer):
+        """Test that the fingerprint is stable and covers the patterns."""
+        assert verbalizer.fingerprint() == SwahiliVerbalizer().fingerprint()
+        assert len(verbalizer.fingerprint()) == 64
+
+    def test_instance_settings(self, verbalizer, tmp_path):
+        """Test that instances configured differently do not share entries."""
+        path = tmp_path / 'cache.db'
+        verbalizer.enable_disk_cache(path)
+        verbalizer.normalize('0712345678')
+        verbalizer.disable_disk_cache()
+
+        other = SwahiliVerbalizer(leading_zero_digits=3)
+        assert other.fingerprint() != verbalizer.fingerprint()
+        expected = SwahiliVerbalizer(leading_zero_digits=3).normalize('0712345678')
+        other.enable_disk_cache(path)
+        assert other.normalize('0712345678') == expected
+        assert SwahiliVerbalizer(year_range=(1950, 2050)).fingerprint() != verbalizer.fingerprint()
+
+    def test_hits_are_counted_in_stats(self, verbalizer, tmp_path):
+        """Test that results read from the database are recorded with their matches."""
+        path = tmp_path / 'cache.db'
+        verbalizer.enable_disk_cache(path)
+        [verbalizer.normalize(text) for text in TEXTS]
+        verbalizer.disable_disk_cache()
+
+        second = SwahiliVerbalizer()
+        second.enable_disk_cache(path)
+        with second.collect_stats() as stats:
+            [second.normalize(text) for text in TEXTS]
+        assert stats.cache_hits['normalize'] == len(TEXTS)
+        assert stats.matches == {'currency': 1, 'time': 1, 'date': 1, 'number': 1}
+
+    def test_batch_workers(self, verbalizer, tmp_path):
+        """Test that process workers share the database."""
+        path = tmp_path / 'cache.db'
+        texts = TEXTS * 50
+        verbalizer.enable_disk_cache(path)
+        expected = [SwahiliVerbalizer().normalize(text) for text in texts]
+        assert verbalizer.normalize_batch(texts, workers=2, chunksize=100) == expected
+        verbalizer.disable_disk_cache()
+        cache = SwahiliVerbalizer().enable_disk_cache(path)
+        assert all(cache.get(text) is not None for text in TEXTS)
@@ -0,0 +1,69 @@
+# tests/test_errors.py
+
+"""
+Test suite for error policies.
+"""
+
+import pickle
+import warnings
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.errors import Failure, NormalizationError
+
+
+TEXT = "Tarehe 45/13/2024 na 3"
+FALLBACK = "Tarehe arobaini na tano/kumi na tatu/elfu mbili na ishirini na nne na tatu"
+
+
+class TestErrorPolicies:
+    """Test the errors= policy."""
+    
+    def test_warn_is_default(self):
+        """Test that failures warn and fall through to plain numbers."""
+        with pytest.warns(UserWarning, match="45/13/2024"):
+            assert SwahiliVerbalizer().normalize(TEXT) == FALLBACK
+    
+    def test_ignore(self):
+        """Test that failures are skipped silently."""
+        verbalizer = SwahiliVerbalizer(errors='ignore')
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert verbalizer.normalize(TEXT) == FALLBACK
+    
+    def test_collect(self):
+        """Test that failures are returned with the result."""
+        verbalizer = SwahiliVerbalizer()
+        result, failures = verbalizer.normalize(TEXT, errors='collect')
+        assert result == FALLBACK
+        assert failures == [Failure(7, 'date', 'Invalid day: 45')]
+    
+    def test_collect_per_category(self):
+        """Test collect on a single-category normalizer."""
+        verbalizer = SwahiliVerbalizer(errors='collect')
+        result, failures = verbalizer.normalize_dates(TEXT)
+        assert result == TEXT
+        assert [f.offset for f in failures] == [7]
+    
+    def test_raise(self):
+        """Test that failures raise with their offset and category."""
+        verbalizer = SwahiliVerbalizer(errors='raise')
+        with pytest.raises(NormalizationError) as info:
+            verbalizer.normalize(TEXT)
+        assert info.value.offset == 7
+        assert info.value.category == 'date'
+        assert info.value.text == "45/13/2024"
+    
+    def test_unknown_policy(self):
+        """Test that unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            SwahiliVerbalizer(errors='explode')
+        with pytest.raises(ValueError):
+            SwahiliVerbalizer().normalize(TEXT, errors='explode')
+    
+    def test_pickle_keeps_policy(self):
+        """Test that a pickled verbalizer keeps its policy."""
+        verbalizer = pickle.loads(pickle.dumps(SwahiliVerbalizer(errors='ignore')))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert verbalizer.normalize(TEXT) == FALLBACK
@@ -0,0 +1,121 @@
+# tests/test_incremental.py
+
+"""
+Test suite for incremental normalization of edited documents.
+"""
+
+import random
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.incremental import IncrementalNormalizer
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer(errors='ignore')
+
+
+def apply(text, offset, deleted, inserted):
+    """Apply an edit to a string."""
+    return text[:offset] + inserted + text[offset + deleted:]
+
+
+class TestIncrementalNormalizer:
+    """Test that edits keep the output equal to a full normalize."""
+
+    def check(self, verbalizer, document, output):
+        assert document.output == verbalizer.normalize(document.text)
+        assert output == document.output
+
+    def test_initial_document(self, verbalizer):
+        """Test that a new document is normalized as a whole."""
+        text = "Nina KES 5000 na saa 14:30 tarehe 15/03/2024 " * 20
+        document = verbalizer.incremental(text, piece_chars=64)
+        assert document.text == text
+        assert document.output == verbalizer.normalize(text)
+        assert len(document) == len(text)
+
+    def test_expression_growing_across_pieces(self, verbalizer):
+        """Test typing that extends an expression at a piece boundary."""
+        document = verbalizer.incremental("Nina KES 15", piece_chars=4)
+        output = document.output
+        for offset, char in enumerate("00.50", start=11):
+            output = apply(output, *document.edit(offset, 0, char))
+            self.check(verbalizer, document, output)
+        assert document.text == "Nina KES 1500.50"
+
+    def test_edit_removes_safe_point(self, verbalizer):
+        """Test edits that join words into one expression."""
+        document = verbalizer.incremental("saa kumi na mbili saa 14 kamili", piece_chars=4)
+        output = document.output
+        # "saa 14 kamili" -> "saa 14:30 kamili", then join the words around a space
+        output = apply(output, *document.edit(24, 0, ":30"))
+        self.check(verbalizer, document, output)
+        output = apply(output, *document.edit(3, 1, ""))
+        self.check(verbalizer, document, output)
+        output = apply(output, *document.edit(0, 0, "5"))
+        self.check(verbalizer, document, output)
+
+    def test_delete_everything(self, verbalizer):
+        """Test emptying the document and typing into it again."""
+        document = verbalizer.incremental("Nina KES 5000 leo", piece_chars=4)
+        assert document.edit(0, len(document), "") == (0, len(verbalizer.normalize("Nina KES 5000 leo")), '')
+        assert document.text == document.output == ''
+        document.edit(0, 0, "3")
+        assert document.output == "tatu"
+
+    def test_patch_is_minimal(self, verbalizer):
+        """Test that the output change covers only what changed."""
+        document = verbalizer.incremental("Nina watoto 3 leo")
+        assert document.edit(12, 1, "4") == (12, 4, "nne")
+
+    def test_random_edits(self, verbalizer):
+        """Test random keystrokes against a full normalize after every edit."""
+        alphabet = list("KES TZS 0123456789:/.,") + ["saa ", "tarehe ", "jioni", " ", "\n", "a"]
+        for seed in range(40):
+            rng = random.Random(seed)
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 150)))
+            document = verbalizer.incremental(text, piece_chars=rng.choice([4, 16, 512]))
+            output = document.output
+            for _ in range(40):
+                offset = rng.randint(0, len(text))
+                deleted = rng.randint(0, min(4, len(text) - offset))
+                inserted = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 3)))
+                output = apply(output, *document.edit(offset, deleted, inserted))
+                text = apply(text, offset, deleted, inserted)
+                assert document.text == text
+                self.check(verbalizer, document, output)
+
+    def test_numeric_table(self, verbalizer):
+        """Test that a document without letters is split into pieces too."""
+        text = "".join(f"{i}\t{i * 7}\t14:30\n" for i in range(500))
+        document = verbalizer.incremental(text, piece_chars=64)
+        assert len(document._sources) > 100
+        output = document.output
+        for offset, deleted, inserted in [(100, 0, "5"), (0, 3, ""), (len(text) - 10, 2, " PM")]:
+            output = apply(output, *document.edit(offset, deleted, inserted))
+            self.check(verbalizer, document, output)
+        assert len(document._sources) > 100
+
+    def test_reset(self, verbalizer):
+        """Test replacing the whole document."""
+        document = verbalizer.incremental("3")
+        document.reset("Nina KES 20")
+        assert document.output == verbalizer.normalize("Nina KES 20")
+
+    def test_invalid_edits(self, verbalizer):
+        """Test that edits outside the document are rejected."""
+        document = verbalizer.incremental("abc")
+        with pytest.raises(ValueError):
+            document.edit(4, 0, "x")
+        with pytest.raises(ValueError):
+            document.edit(2, 2, "")
+        with pytest.raises(ValueError):
+            document.edit(-1, 0, "x")
+
+    def test_collect_policy_rejected(self, verbalizer):
+        """Test that the 'collect' policy is refused."""
+        with pytest.raises(ValueError):
+            IncrementalNormalizer(verbalizer, "3", errors='collect')
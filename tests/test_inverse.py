@@ -0,0 +1,102 @@
+# tests/test_inverse.py
+
+"""
+Test suite for Swahili inverse text normalization.
+"""
+
+import random
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.languages.swahili.currency import verbalize_currency
+from verbalizer.languages.swahili.date import verbalize_date
+from verbalizer.languages.swahili.inverse import inverse_normalize
+from verbalizer.languages.swahili.number import number_to_words
+from verbalizer.languages.swahili.time import verbalize_time
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+class TestNumbers:
+    """Test cardinals, digit strings and decimals."""
+
+    def test_round_trip_below_ten_thousand(self):
+        """Test that every number below 10000 comes back exactly."""
+        for n in range(10000):
+            assert inverse_normalize(number_to_words(n)) == str(n)
+
+    def test_round_trip_large(self):
+        """Test that large numbers read back to the same words."""
+        rng = random.Random(0)
+        for _ in range(2000):
+            words = number_to_words(rng.randrange(10 ** rng.randint(4, 21)))
+            assert number_to_words(int(inverse_normalize(words))) == words
+
+    def test_ambiguous_group(self):
+        """Test that "na" extends the group read so far."""
+        assert inverse_normalize("elfu mia tano na ishirini") == "520000"
+        assert inverse_normalize("elfu moja na tano") == "1005"
+
+    def test_digits_and_decimals(self):
+        """Test digit-by-digit readings and decimal points."""
+        verbalizer = SwahiliVerbalizer(leading_zero_digits=3)
+        assert inverse_normalize(verbalizer.normalize("0712345678")) == "0712345678"
+        assert inverse_normalize("tatu nukta moja nne") == "3.14"
+        assert inverse_normalize("hasi tano") == "-5"
+
+    def test_text_around_numbers(self):
+        """Test that other words, punctuation and case are kept."""
+        assert inverse_normalize("Watoto Ishirini na moja na mbwa tatu.") == "Watoto 21 na mbwa 3."
+        assert inverse_normalize("tano, sita") == "5, 6"
+        assert inverse_normalize("mia na elfu") == "mia na elfu"
+        assert inverse_normalize("") == ""
+
+
+class TestExpressions:
+    """Test currency, time and date round trips."""
+
+    def test_currency(self):
+        """Test amounts with and without subunits."""
+        assert inverse_normalize("shilingi elfu moja na mia tano") == "KES 1500"
+        assert inverse_normalize(verbalize_currency('USD', '5.99')) == "USD 5.99"
+        assert inverse_normalize(verbalize_currency('NGN', '2500.05')) == "NGN 2500.05"
+        assert inverse_normalize("shilingi na senti") == "shilingi na senti"
+
+    def test_shared_currency_name(self):
+        """Test that a name used by several currencies gives the first one."""
+        assert inverse_normalize(verbalize_currency('TZS', '20')) == "KES 20"
+
+    def test_every_minute(self):
+        """Test every minute of the day, on the 24 and 12-hour clocks."""
+        for hours in range(24):
+            for minutes in range(60):
+                written = f"{hours}:{minutes:02d}"
+                assert inverse_normalize(verbalize_time(written)) == written
+        assert inverse_normalize(verbalize_time("2:30:15 PM")) == "2:30:15 PM"
+        assert inverse_normalize(verbalize_time("12:05 AM")) == "12:05 AM"
+
+    def test_date(self):
+        """Test dates in DD/MM/YYYY."""
+        for day, month, year in [(1, 1, 2000), (15, 3, 2024), (31, 12, 1999), (9, 9, 1066)]:
+            written = f"{day:02d}/{month:02d}/{year:04d}"
+            assert inverse_normalize(verbalize_date(day, month, year)) == written
+
+    def test_incomplete_expressions(self):
+        """Test that a keyword without its numbers is left as it is."""
+        assert inverse_normalize("saa ni") == "saa ni"
+        assert inverse_normalize("saa thelathini") == "saa 30"
+        assert inverse_normalize("tarehe tano mwezi wa Machi") == "tarehe 5 mwezi wa Machi"
+
+    def test_normalized_text(self, verbalizer):
+        """Test whole sentences through normalize and back."""
+        rng = random.Random(1)
+        for _ in range(200):
+            text = (f"Nina KES {rng.randrange(1, 10 ** 6)} na watoto {rng.randrange(10000)}, "
+                    f"tutaonana saa {rng.randrange(24)}:{rng.randrange(60):02d} PM "
+                    f"tarehe {rng.randrange(1, 29):02d}/{rng.randrange(1, 13):02d}/{rng.randrange(1900, 2100)}")
+            words = verbalizer.normalize(text)
+            assert verbalizer.normalize(verbalizer.inverse_normalize(words)) == words
@@ -0,0 +1,80 @@
+# tests/test_lexicon.py
+
+"""
+Test suite for memory-mapped lexicons.
+"""
+
+import pickle
+import struct
+
+import pytest
+from verbalizer.languages.swahili.config import PACK
+from verbalizer.languages.swahili.lexicon import build_lexicon, open_lexicon
+from verbalizer.languages.swahili.number import number_to_words
+from verbalizer.lexicon import Lexicon, write_lexicon
+
+
+@pytest.fixture
+def lexicon_path(tmp_path):
+    """A small Swahili lexicon file."""
+    return build_lexicon(str(tmp_path / "sw.lex"), numbers=(0, 20000))
+
+
+class TestLexicon:
+    """Test writing and reading lexicon files."""
+
+    def test_sections(self, lexicon_path):
+        """Test that every section holds the forward words."""
+        with open_lexicon(lexicon_path) as lexicon:
+            assert lexicon.range('number') == range(0, 20001)
+            assert all(lexicon.get('number', n) == number_to_words(n) for n in range(20001))
+            assert lexicon.get('year', 2024) == number_to_words(2024)
+            assert lexicon.range('year') == range(0, 10000)
+            assert lexicon.get('time', 14 * 60 + 30) == PACK.clock[14 * 60 + 30]
+
+    def test_outside_the_sections(self, lexicon_path):
+        """Test keys and sections the file does not cover."""
+        with open_lexicon(lexicon_path) as lexicon:
+            assert lexicon.get('number', 20001) is None
+            assert lexicon.get('number', -1) is None
+            assert lexicon.get('ordinal', 1) is None
+            assert lexicon.range('ordinal') == range(0)
+            assert lexicon.lookup('ordinal')(1) is None
+
+    def test_layout(self, tmp_path):
+        """Test the documented layout, as a reader in another language sees it."""
+        path = str(tmp_path / "small.lex")
+        write_lexicon(path, {'n': (5, ["tano", "sita", "ñ"])}, tag=b'abc')
+        data = open(path, 'rb').read()
+        magic, version, count, blob, blob_size, tag = struct.unpack_from('<4sHHQQ32s', data)
+        assert (magic, version, count, tag.rstrip(b'\0')) == (b'VLEX', 1, 1, b'abc')
+        name, first, size, index = struct.unpack_from('<16sqQQ', data, 56)
+        assert (name.rstrip(b'\0'), first, size) == (b'n', 5, 3)
+        offsets = struct.unpack_from('<4I', data, index)
+        words = [data[blob + start:blob + end].decode('utf-8')
+                 for start, end in zip(offsets, offsets[1:])]
+        assert words == ["tano", "sita", "ñ"]
+        assert blob + blob_size == len(data)
+
+    @pytest.mark.parametrize("content", [b"", b"VLEX", b"NOPE" + bytes(100)])
+    def test_invalid_files(self, tmp_path, content):
+        """Test that files that are not lexicons are refused."""
+        path = tmp_path / "bad.lex"
+        path.write_bytes(content)
+        with pytest.raises((ValueError, struct.error)):
+            Lexicon(str(path))
+
+    def test_stale_lexicon(self, tmp_path):
+        """Test that a lexicon built from another pack is refused."""
+        path = str(tmp_path / "old.lex")
+        write_lexicon(path, {'number': (0, ["sifuri"])}, tag=b'0' * 32)
+        with pytest.raises(ValueError, match="rebuild"):
+            open_lexicon(path)
+
+    def test_pickle(self, lexicon_path):
+        """Test that a pickled lexicon maps the file again."""
+        with open_lexicon(lexicon_path) as lexicon:
+            copy = pickle.loads(pickle.dumps(lexicon))
+        with copy:
+            assert copy.get('number', 42) == number_to_words(42)
+
@@ -0,0 +1,160 @@
+# tests/test_manifest.py
+
+"""
+Test suite for streaming TSV/CSV manifest normalization.
+"""
+
+import csv
+import io
+import tracemalloc
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.cli import main
+from verbalizer.manifest import MAX_RECORD_BYTES, iter_records, split_fields
+
+
+CSV_MANIFEST = (
+    'path,duration,transcript\r\n'
+    'clips/a.wav,1.50,"Nina KES 5000, asante"\r\n'
+    '"clips/b c.wav",2.0,saa 14:30\r\n'
+    'clips/c.wav,3,"Alisema ""tarehe 25/12/2024""\r\nna watoto 3"\r\n'
+    'clips/d.wav,,\r\n'
+)
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+def run(verbalizer, data, columns, **options):
+    """Normalize an in-memory manifest and return the output text."""
+    out = io.BytesIO()
+    verbalizer.normalize_manifest(io.BytesIO(data.encode('utf-8')), out, columns, **options)
+    return out.getvalue().decode('utf-8')
+
+
+class TestParsing:
+    """Test record and field splitting."""
+    
+    def test_quoted_newlines(self):
+        """Test that a quoted field spanning lines stays one record."""
+        records = list(iter_records(io.BytesIO(CSV_MANIFEST.encode()), ',', '"'))
+        assert len(records) == 5
+        assert b''.join(records) == CSV_MANIFEST.encode()
+        assert records[3].count(b'\n') == 2
+    
+    def test_split_matches_csv(self):
+        """Test that unquoted cells agree with the csv module."""
+        for line in CSV_MANIFEST.replace('\r\n', '\n').split('\n')[:3]:
+            cells = split_fields(line, ',', '"')
+            assert ','.join(cells) == line
+            parsed = next(csv.reader([line]))
+            assert [c[1:-1] if c.startswith('"') else c for c in cells] == parsed
+    
+    def test_unterminated_quote(self, monkeypatch):
+        """Test that an unclosed quote is reported instead of buffering the file."""
+        monkeypatch.setattr('verbalizer.manifest.MAX_RECORD_BYTES', 64)
+        data = b'a,"open\n' + b'line\n' * 100
+        with pytest.raises(ValueError, match="Unterminated"):
+            list(iter_records(io.BytesIO(data), ',', '"'))
+        assert MAX_RECORD_BYTES > 64
+
+
+class TestNormalizeManifest:
+    """Test normalize_manifest."""
+    
+    def test_csv_by_name(self, verbalizer):
+        """Test that only the chosen column changes and quoting is kept."""
+        result = run(verbalizer, CSV_MANIFEST, ['transcript'], dialect='csv', header=True)
+        lines = result.split('\r\n')
+        assert lines[0] == 'path,duration,transcript'
+        assert lines[1] == 'clips/a.wav,1.50,"Nina shilingi elfu tano, asante"'
+        assert lines[2] == '"clips/b c.wav",2.0,saa saa kumi na nne na dakika thelathini'
+        assert lines[3].startswith('clips/c.wav,3,"Alisema ""tarehe tarehe ishirini na tano')
+        assert lines[4] == 'na watoto tatu"'
+        assert lines[5] == 'clips/d.wav,,'
+        rows = list(csv.reader(io.StringIO(result)))
+        assert [row[:2] for row in rows] == [row[:2] for row in csv.reader(io.StringIO(CSV_MANIFEST))]
+    
+    def test_keep_original(self, verbalizer):
+        """Test the extra column with the original text."""
+        result = run(verbalizer, CSV_MANIFEST, [2], dialect='csv', header=True, keep_original=True)
+        rows = list(csv.reader(io.StringIO(result)))
+        original = list(csv.reader(io.StringIO(CSV_MANIFEST)))
+        assert rows[0] == original[0] + ['transcript_original']
+        assert [row[3] for row in rows[1:]] == [row[2] for row in original[1:]]
+    
+    def test_tsv_raw_quotes(self, verbalizer):
+        """Test that TSV quotes are plain text by default."""
+        data = 'a.wav\t"Nina" watoto 3\n'
+        assert run(verbalizer, data, [1]) == 'a.wav\t"Nina" watoto tatu\n'
+    
+    def test_unknown_column(self, verbalizer):
+        """Test that names need a header that has them."""
+        with pytest.raises(ValueError):
+            run(verbalizer, CSV_MANIFEST, ['text'], dialect='csv', header=True)
+        with pytest.raises(ValueError):
+            run(verbalizer, CSV_MANIFEST, ['transcript'], dialect='csv')
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_workers(self, verbalizer, tmp_path, workers):
+        """Test that worker processes give the inline result, in order."""
+        src = tmp_path / "in.csv"
+        dst = tmp_path / "out.csv"
+        src.write_bytes(CSV_MANIFEST.encode() * 20)
+        stats = verbalizer.normalize_manifest(src, dst, [2], dialect='csv', workers=workers,
+                                              batch_rows=3)
+        assert stats['lines'] == 100
+        assert stats['matches']['currency'] == 20
+        assert dst.read_bytes().decode('utf-8') == run(
+            verbalizer, CSV_MANIFEST * 20, [2], dialect='csv')
+    
+    def test_constant_memory(self, verbalizer):
+        """Test that peak memory does not grow with the number of rows."""
+        row = 'clips/x.wav,1.0,"Nina KES 5000 na watoto 3"\n'
+        
+        def peak(rows):
+            src = io.BytesIO((row * rows).encode())
+            tracemalloc.start()
+            verbalizer.normalize_manifest(src, NullWriter(), [2], dialect='csv', batch_rows=100)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+        
+        peak(100)
+        assert peak(20000) < peak(2000) * 2
+
+
+class NullWriter(io.RawIOBase):
+    """Binary sink that discards what it is given."""
+    
+    def writable(self):
+        return True
+    
+    def write(self, data):
+        return len(data)
+
+
+class TestManifestCommand:
+    """Test the CSV mode of the verbalize command."""
+    
+    def test_csv(self, verbalizer, tmp_path):
+        """Test columns by name with the original text kept."""
+        src = tmp_path / "in.csv"
+        dst = tmp_path / "out.csv"
+        src.write_bytes(CSV_MANIFEST.encode())
+        assert main([str(src), "-o", str(dst), "--format", "csv", "--header",
+                     "--column", "transcript", "--keep-original", "-q"]) == 0
+        assert dst.read_bytes().decode('utf-8') == run(
+            verbalizer, CSV_MANIFEST, [2], dialect='csv', header=True, keep_original=True)
+    
+    def test_bad_column(self, tmp_path):
+        """Test that an unknown column name is a usage error."""
+        src = tmp_path / "in.csv"
+        src.write_bytes(CSV_MANIFEST.encode())
+        with pytest.raises(SystemExit):
+            main([str(src), "-o", str(tmp_path / "out.csv"), "--format", "csv",
+                  "--column", "transcript", "-q"])
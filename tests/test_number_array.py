@@ -0,0 +1,80 @@
+# tests/test_number_array.py
+
+"""
+Test suite for bulk number verbalization.
+"""
+
+import random
+import sys
+
+import pytest
+from verbalizer.languages.swahili.number import number_to_words, verbalize_numbers_array
+
+
+def sample_values(count=20000, seed=0):
+    """Signed values of every magnitude up to 10^18."""
+    rng = random.Random(seed)
+    values = [rng.randrange(10 ** rng.randint(1, 18)) * rng.choice((1, -1)) for _ in range(count)]
+    return values + [0, 1, 1000, 1001, 10 ** 18, 2 ** 63 - 1, -2 ** 63]
+
+
+class TestFallback:
+    """Test the pure-Python path."""
+    
+    def test_without_numpy(self, monkeypatch):
+        """Test that lists are verbalized when NumPy is not installed."""
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+        values = sample_values(2000)
+        assert verbalize_numbers_array(values) == [number_to_words(v) for v in values]
+    
+    def test_iterables(self):
+        """Test that any iterable of ints gives a list."""
+        assert verbalize_numbers_array(range(3)) == ["sifuri", "moja", "mbili"]
+        assert verbalize_numbers_array([]) == []
+    
+    def test_big_ints(self):
+        """Test values beyond 64 bits."""
+        values = [10 ** 30, -5]
+        assert verbalize_numbers_array(values) == [number_to_words(v) for v in values]
+
+
+class TestNumpy:
+    """Test the vectorized path."""
+    
+    @pytest.fixture
+    def np(self):
+        """The numpy module, if installed."""
+        return pytest.importorskip("numpy")
+    
+    def test_matches_number_to_words(self, np):
+        """Test element-for-element agreement with number_to_words."""
+        values = sample_values()
+        result = verbalize_numbers_array(np.array(values, dtype=np.int64))
+        assert result.dtype == object
+        assert result.tolist() == [number_to_words(v) for v in values]
+    
+    def test_dtypes(self, np):
+        """Test narrow, unsigned and extreme integer types."""
+        int8 = np.array([-128, -1, 0, 127], dtype=np.int8)
+        assert verbalize_numbers_array(int8).tolist() == [number_to_words(v) for v in (-128, -1, 0, 127)]
+        uint64 = np.array([2 ** 64 - 1, 10 ** 19, 7], dtype=np.uint64)
+        assert verbalize_numbers_array(uint64).tolist() == [
+            number_to_words(v) for v in (2 ** 64 - 1, 10 ** 19, 7)
+        ]
+    
+    def test_shape(self, np):
+        """Test that the input's shape is kept."""
+        result = verbalize_numbers_array(np.arange(6).reshape(2, 3))
+        assert result.shape == (2, 3)
+        assert result[1, 2] == "tano"
+        assert verbalize_numbers_array(np.array([], dtype=np.int32)).shape == (0,)
+    
+    def test_rejects_floats(self, np):
+        """Test that non-integer arrays are rejected."""
+        with pytest.raises(TypeError):
+            verbalize_numbers_array(np.array([1.5]))
+    
+    def test_object_arrays(self, np):
+        """Test arrays of Python ints beyond 64 bits."""
+        values = np.array([10 ** 25, 3], dtype=object)
+        assert verbalize_numbers_array(values).tolist() == [number_to_words(10 ** 25), "tatu"]
@@ -0,0 +1,162 @@
+# tests/test_packs.py
+
+"""
+Test suite for declarative language packs.
+"""
+
+import json
+import os
+import re
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer import packs
+from verbalizer.detector import pattern_hints
+from verbalizer.languages.swahili import config
+from verbalizer.packs import PackError, compile_pack, load_pack
+
+
+SWAHILI_PACK = os.path.join(os.path.dirname(config.__file__), 'sw.json')
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+@pytest.fixture
+def spec():
+    """The parsed Swahili pack."""
+    with open(SWAHILI_PACK, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_pack(path, spec):
+    """Write a pack file and return its path."""
+    path.write_text(json.dumps(spec), encoding='utf-8')
+    return str(path)
+
+
+class TestCompile:
+    """Test compile_pack."""
+    
+    def test_swahili_tables(self, spec):
+        """Test the compiled Swahili tables."""
+        tables = compile_pack(spec)
+        assert tables['group_words'][999] == "mia tisa na tisini na tisa"
+        assert tables['scales'][0] == (10 ** 18, "kwintilioni")
+        assert tables['clock'][14 * 60 + 30] == "saa kumi na nne na dakika thelathini"
+        assert tables['date_prefixes'][11 * 31 + 24] == "tarehe ishirini na tano mwezi wa Desemba mwaka "
+        assert tables['currencies']['NGN']['subunit'] == "kobo"
+    
+    def test_patterns(self, spec):
+        """Test that fragments expand to the detection patterns."""
+        spec['patterns']['currency'] = {"regex": r"\b({currency_codes})\s*({amount})\b"}
+        regex, flags = compile_pack(spec)['patterns']['currency']
+        assert '{' not in regex.replace('{1,2}', '')
+        assert not flags
+        for text in ("KES 5", "Kes 5", "kes 5", "KSh 5", "CHF 5"):
+            assert re.fullmatch(regex, text)
+        assert not re.fullmatch(regex, "chf 5")
+    
+    @pytest.mark.parametrize("edit, message", [
+        (lambda s: s.pop('months'), "months"),
+        (lambda s: s['numbers']['ones'].pop(), "ones"),
+        (lambda s: s['numbers']['scales'].pop(0), "scales"),
+        (lambda s: s['patterns']['number'].update(regex="{missing}"), "missing"),
+        (lambda s: s['patterns']['number'].update(regex="(unclosed"), "Invalid pattern"),
+        (lambda s: s['patterns']['number'].update(flags=["DOTALL_TYPO"]), "flag"),
+        (lambda s: s.update(warmup="KES 5"), "warmup"),
+    ])
+    def test_invalid(self, spec, edit, message):
+        """Test that malformed packs are rejected with a useful message."""
+        edit(spec)
+        with pytest.raises(PackError, match=message):
+            compile_pack(spec)
+
+
+class TestLoad:
+    """Test load_pack and its disk cache."""
+    
+    def test_cache_roundtrip(self, tmp_path):
+        """Test that the second load reads the cache and gives the same tables."""
+        first = load_pack(SWAHILI_PACK, cache_dir=str(tmp_path))
+        assert not first.cached
+        assert [name.endswith('.marshal') for name in os.listdir(tmp_path)] == [True]
+        second = load_pack(SWAHILI_PACK, cache_dir=str(tmp_path))
+        assert second.cached
+        assert second.source_hash == first.source_hash
+        assert second.group_words == first.group_words
+        assert second.clock == first.clock
+        assert second.date_prefixes == first.date_prefixes
+        assert second.patterns == first.patterns
+        assert second.pattern_hints == first.pattern_hints
+        assert second.pattern_hints == {
+            category: pattern_hints(pattern) for category, pattern in second.patterns.items()
+        }
+    
+    def test_content_hash(self, tmp_path, spec):
+        """Test that editing a pack recompiles it."""
+        cache_dir = str(tmp_path / "cache")
+        path = write_pack(tmp_path / "sw.json", spec)
+        assert load_pack(path, cache_dir=cache_dir).months[1] == "Januari"
+        spec['months'][0] = "Janwari"
+        write_pack(tmp_path / "sw.json", spec)
+        pack = load_pack(path, cache_dir=cache_dir)
+        assert not pack.cached
+        assert pack.months[1] == "Janwari"
+        assert len(os.listdir(cache_dir)) == 2
+    
+    def test_old_builds_pruned(self, tmp_path, spec):
+        """Test that only the newest builds of a language are kept."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        legacy = cache_dir / ("sw-" + "0" * 32 + ".marshal")
+        legacy.write_bytes(b"")
+        path = write_pack(tmp_path / "sw.json", spec)
+        for month in ("Jan", "Janu", "Janua"):
+            spec['months'][0] = month
+            write_pack(tmp_path / "sw.json", spec)
+            load_pack(path, cache_dir=str(cache_dir))
+        assert len(os.listdir(cache_dir)) == packs.KEPT_BUILDS
+        assert not legacy.exists()
+        assert load_pack(path, cache_dir=str(cache_dir)).cached
+    
+    def test_compiler_change(self, tmp_path, monkeypatch):
+        """Test that a change to the compiler's source recompiles the pack."""
+        assert load_pack(SWAHILI_PACK, cache_dir=str(tmp_path)).source_hash
+        monkeypatch.setattr(packs, '_compiler_digest', "changed")
+        assert not load_pack(SWAHILI_PACK, cache_dir=str(tmp_path)).cached
+    
+    def test_corrupt_cache(self, tmp_path):
+        """Test that an unreadable cache entry is recompiled."""
+        pack = load_pack(SWAHILI_PACK, cache_dir=str(tmp_path))
+        (tmp_path / os.listdir(tmp_path)[0]).write_bytes(b"garbage")
+        again = load_pack(SWAHILI_PACK, cache_dir=str(tmp_path))
+        assert not again.cached
+        assert again.group_words == pack.group_words
+    
+    def test_no_cache(self, tmp_path):
+        """Test loading with the cache disabled or unwritable."""
+        assert not load_pack(SWAHILI_PACK, cache_dir=False).cached
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        assert load_pack(SWAHILI_PACK, cache_dir=str(blocker / "cache")).ones[0] == "sifuri"
+
+
+class TestSwahiliPack:
+    """Test that Swahili is served from its pack."""
+    
+    def test_patterns_from_pack(self):
+        """Test that the verbalizer uses the pack's patterns."""
+        assert config.PATTERNS is config.PACK.patterns
+        assert config.SUPPORTED_CURRENCIES[:4] == ['KES', 'TZS', 'NGN', 'RWF']
+    
+    def test_output(self, verbalizer):
+        """Test every category end to end."""
+        assert verbalizer.normalize("KES 1500.50, 3:45 PM, 15/08/2024, watoto -3") == (
+            "shilingi elfu moja na mia tano na senti hamsini, saa kumi na tano na dakika "
+            "arobaini na tano jioni, tarehe kumi na tano mwezi wa Agosti mwaka elfu mbili na "
+            "ishirini na nne, watoto -tatu"
+        )
@@ -0,0 +1,73 @@
+# tests/test_partial.py
+
+"""
+Test suite for partial matching of the detector's patterns.
+"""
+
+import random
+import re
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.partial import PartialMatcher
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+@pytest.fixture
+def matcher(verbalizer):
+    """Fixture to build the automaton for the Swahili patterns."""
+    return PartialMatcher(pattern for _, pattern in verbalizer.detector.order)
+
+
+class TestPartialMatcher:
+    """Test the prefix automaton."""
+
+    def test_supported(self, matcher):
+        """Test that the Swahili patterns can be modelled."""
+        assert matcher.supported
+
+    @pytest.mark.parametrize("pattern", [r'^\d', r'\d\Z', r'(\d)\1', r'(a)?(?(1)\d|x)'])
+    def test_unsupported(self, pattern):
+        """Test that anchors, backreferences and conditionals are refused."""
+        assert not PartialMatcher([re.compile(pattern)]).supported
+
+    def test_open_expressions(self, matcher):
+        """Test where matches are reported in progress."""
+        text = "Nina KES 15 na saa 14:"
+        live = matcher.scan(text)
+        assert live[len("Nina KES 15")] == len("Nina ")
+        # "15 " may still be followed by a currency code
+        assert live[len("Nina KES 15 ")] == len("Nina KES ")
+        assert live[len("Nina KES 15 na")] is None
+        assert live[len(text)] == len("Nina KES 15 na saa ")
+        assert live[len("Nina KES 15 na saa")] is None
+
+    def test_lookarounds_extend_matches(self):
+        """Test that the text a lookaround inspects is part of the expression."""
+        behind = PartialMatcher([re.compile(r'(?<![/x])\d+')])
+        assert behind.supported
+        assert behind.scan("a/1") == [None, None, 1, 1]
+        ahead = PartialMatcher([re.compile(r'\d(?!\s*x)')])
+        assert ahead.scan("1  x.") == [None, 0, 0, 0, 0, None]
+
+    def test_lookbehind_after_boundary(self):
+        """Test that a lookbehind after a boundary still takes in its text."""
+        matcher = PartialMatcher([re.compile(r'\b(?<![,])\d+')])
+        assert matcher.scan(" ,1") == [None, None, 1, 1]
+
+    def test_never_misses_a_match(self, verbalizer, matcher):
+        """Test that every prefix of every real match is reported."""
+        alphabet = list("KES TZS 0123456789:/.") + ["PM", "am", "a", " "]
+        rng = random.Random(0)
+        for _ in range(300):
+            text = ''.join(rng.choice(alphabet) for _ in range(30))
+            live = matcher.scan(text)
+            for _, pattern in verbalizer.detector.order:
+                for match in pattern.finditer(text):
+                    for end in range(match.start() + 1, match.end() + 1):
+                        assert live[end] is not None and live[end] <= match.start()
@@ -0,0 +1,92 @@
+# tests/test_registry.py
+
+"""
+Test suite for the lazy language registry.
+"""
+
+import importlib.metadata
+import subprocess
+import sys
+
+import pytest
+import verbalizer
+from verbalizer import SwahiliVerbalizer, registry
+
+
+@pytest.fixture
+def clean_registry(monkeypatch):
+    """Fixture that restores the registry after a test."""
+    monkeypatch.setattr(registry, '_languages', dict(registry._languages))
+    monkeypatch.setattr(registry, '_aliases', dict(registry._aliases))
+    monkeypatch.setattr(registry, '_instances', {})
+    monkeypatch.setattr(registry, '_entry_points_loaded', False)
+
+
+class TestRegistry:
+    """Test get_verbalizer and language registration."""
+
+    def test_import_is_lazy(self):
+        """Test that importing the package loads no language."""
+        code = (
+            "import sys, verbalizer\n"
+            "print(sorted(m for m in sys.modules if m.startswith('verbalizer.languages')))\n"
+            "verbalizer.get_verbalizer('sw')\n"
+            "print('verbalizer.languages.swahili' in sys.modules)\n"
+        )
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout.split('\n')
+        assert output[:2] == ['[]', 'True']
+
+    def test_subsystems_are_lazy(self):
+        """Test that normalizing does not load the batch, streaming, caching or async code."""
+        code = (
+            "import sys, verbalizer\n"
+            "verbalizer.get_verbalizer('sw').normalize('KES 100')\n"
+            "print(' '.join(sorted(m for m in sys.modules if m.startswith('verbalizer'))))\n"
+        )
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout.split()
+        for module in ('aio', 'batch', 'cache', 'disk_cache', 'incremental', 'manifest', 'stream'):
+            assert f'verbalizer.{module}' not in output
+
+    def test_cached_instances(self, clean_registry):
+        """Test that one instance is kept per language and configuration."""
+        sw = verbalizer.get_verbalizer('sw')
+        assert isinstance(sw, SwahiliVerbalizer)
+        assert verbalizer.get_verbalizer('Swahili') is sw
+        ignoring = verbalizer.get_verbalizer('sw', errors='ignore')
+        assert ignoring is not sw and ignoring.errors == 'ignore'
+        assert verbalizer.get_verbalizer('sw', errors='ignore') is ignoring
+        assert sw.normalize("Nina watoto 3") == "Nina watoto tatu"
+
+    def test_unhashable_config(self, clean_registry):
+        """Test that list settings are accepted and share an instance with tuples."""
+        listed = verbalizer.get_verbalizer('sw', year_range=[1950, 2050])
+        assert verbalizer.get_verbalizer('sw', year_range=(1950, 2050)) is listed
+        assert listed.normalize("tarehe 25/12/2024") == SwahiliVerbalizer().normalize("tarehe 25/12/2024")
+
+    def test_unknown_language(self, clean_registry):
+        """Test that unknown languages are reported with the available ones."""
+        with pytest.raises(ValueError, match="Available: sw, swahili"):
+            verbalizer.get_verbalizer('xx')
+
+    def test_register_language(self, clean_registry):
+        """Test registering a class and an import path."""
+        class Custom(SwahiliVerbalizer):
+            pass
+
+        verbalizer.register_language('xx', Custom, aliases=['custom'])
+        assert type(verbalizer.get_verbalizer('custom')) is Custom
+        verbalizer.register_language('yy', 'verbalizer.languages.swahili:SwahiliVerbalizer')
+        assert verbalizer.get_verbalizer_class('yy') is SwahiliVerbalizer
+        assert {'xx', 'custom', 'yy'} <= set(verbalizer.available_languages())
+
+    def test_entry_points(self, clean_registry, monkeypatch):
+        """Test that languages are discovered through entry points."""
+        entry_point = importlib.metadata.EntryPoint(
+            name='zz', value='verbalizer.languages.swahili:SwahiliVerbalizer',
+            group=registry.ENTRY_POINT_GROUP,
+        )
+        monkeypatch.setattr(importlib.metadata, 'entry_points',
+                            lambda group: [entry_point] if group == registry.ENTRY_POINT_GROUP else [])
+        assert isinstance(verbalizer.get_verbalizer('zz'), SwahiliVerbalizer)
@@ -0,0 +1,145 @@
+# tests/test_serve.py
+
+"""
+Test suite for the normalization server.
+"""
+
+import http.client
+import json
+import socket
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.serve import MicroBatcher, make_servers, serve
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, path, timeout=30):
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+@pytest.fixture
+def servers(verbalizer, tmp_path):
+    """Fixture serving on an ephemeral TCP port and a Unix socket."""
+    servers = make_servers('127.0.0.1', 0, str(tmp_path / 'verbalizer.sock'))
+    thread = threading.Thread(target=serve, args=(servers, verbalizer), daemon=True)
+    thread.start()
+    yield servers
+    servers[0].shutdown()
+    thread.join()
+
+
+def post(conn, path, payload):
+    """POST a JSON payload and return the status and decoded response."""
+    conn.request('POST', path, json.dumps(payload).encode('utf-8'))
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestServer:
+    """Test the HTTP endpoints."""
+
+    def test_tcp_endpoints(self, servers, verbalizer):
+        """Test normalize, normalize_batch and health over TCP keep-alive."""
+        conn = http.client.HTTPConnection('127.0.0.1', servers[0].server_address[1], timeout=5)
+        status, body = post(conn, '/normalize', {'text': "Nina watoto 3"})
+        assert (status, body) == (200, {'text': "Nina watoto tatu"})
+        texts = ["KES 100", "saa 14:30", "Habari"]
+        status, body = post(conn, '/normalize_batch', {'texts': texts})
+        assert body == {'texts': [verbalizer.normalize(t) for t in texts]}
+        conn.request('GET', '/health')
+        assert json.loads(conn.getresponse().read()) == {'status': 'ok'}
+        conn.close()
+
+    def test_unix_socket(self, servers):
+        """Test the same endpoints over a Unix domain socket."""
+        conn = UnixHTTPConnection(servers[1].server_address)
+        assert post(conn, '/normalize', {'text': "KES 5000"}) == (200, {'text': "shilingi elfu tano"})
+        conn.close()
+
+    def test_bad_requests(self, servers):
+        """Test malformed bodies and unknown paths."""
+        conn = http.client.HTTPConnection('127.0.0.1', servers[0].server_address[1], timeout=5)
+        assert post(conn, '/normalize', {'texts': []})[0] == 400
+        assert post(conn, '/normalize_batch', {'texts': "3"})[0] == 400
+        assert post(conn, '/missing', {})[0] == 404
+        conn.close()
+
+
+class TestMicroBatcher:
+    """Test request micro-batching."""
+
+    def test_batches_concurrent_submissions(self, verbalizer):
+        """Test that texts arriving together are normalized in one batch."""
+        sizes = []
+        submitted = threading.Event()
+
+        class Recording(MicroBatcher):
+            def _run(self):
+                submitted.wait()
+                super()._run()
+
+            def run_batch(self, batch):
+                sizes.append(len(batch))
+                super().run_batch(batch)
+
+        batcher = Recording(verbalizer, max_batch=4, max_delay=0.5)
+        futures = [batcher.submit(f"watoto {i}") for i in range(6)]
+        submitted.set()
+        assert [f.result(timeout=5) for f in futures] == [
+            verbalizer.normalize(f"watoto {i}") for i in range(6)
+        ]
+        assert sizes == [4, 2]
+
+    def test_lone_request_is_not_delayed(self, verbalizer):
+        """Test that a request arriving alone does not wait for max_delay."""
+        batcher = MicroBatcher(verbalizer, max_batch=64, max_delay=5)
+        start = time.perf_counter()
+        assert batcher.normalize("watoto 3") == "watoto tatu"
+        assert time.perf_counter() - start < 1
+
+    def test_duplicates_normalized_once(self):
+        """Test that a text repeated within a batch is normalized once."""
+        calls = []
+
+        class Counting:
+            def normalize(self, text):
+                calls.append(text)
+                return text.upper()
+
+        batcher = MicroBatcher(Counting(), max_delay=5)
+        batch = [(text, Future()) for text in ["a", "b", "a", "a"]]
+        batcher.run_batch(batch)
+        assert [future.result() for _, future in batch] == ["A", "B", "A", "A"]
+        assert calls == ["a", "b"]
+
+    def test_errors_are_returned_per_text(self):
+        """Test that a failing text does not fail the rest of its batch."""
+        class Failing:
+            def normalize(self, text):
+                if text == "bad":
+                    raise ValueError("bad text")
+                return text.upper()
+
+        batcher = MicroBatcher(Failing(), max_delay=0.05)
+        good, bad = batcher.submit("good"), batcher.submit("bad")
+        assert good.result(timeout=5) == "GOOD"
+        with pytest.raises(ValueError):
+            bad.result(timeout=5)
@@ -0,0 +1,67 @@
+# tests/test_stats.py
+
+"""
+Test suite for normalization statistics.
+"""
+
+import warnings
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+class TestNormalizerStats:
+    """Test the stats surface of BaseNormalizer."""
+    
+    def test_off_by_default(self, verbalizer):
+        """Test that no statistics are recorded unless asked for."""
+        verbalizer.normalize("Nina watoto 3")
+        assert verbalizer.stats is None
+    
+    def test_counts(self, verbalizer):
+        """Test match, failure, character and call counts."""
+        text = "KES 100 saa 14:30 tarehe 45/13/2024 na 3"
+        stats = verbalizer.enable_stats()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            verbalizer.normalize(text)
+        assert dict(stats.matches) == {'currency': 1, 'time': 1, 'number': 4}
+        assert dict(stats.failures) == {'date': 1}
+        assert stats.chars == len(text)
+        assert stats.calls['normalize'] == 1
+        assert stats.seconds['normalize'] > 0
+        assert verbalizer.disable_stats() is stats
+        assert verbalizer.stats is None
+    
+    def test_single_category_pass(self, verbalizer):
+        """Test that the per-category normalizers are recorded as passes."""
+        stats = verbalizer.enable_stats()
+        verbalizer.normalize_numbers("3 na 4")
+        assert stats.calls == {'number': 1}
+        assert stats.matches == {'number': 2}
+    
+    def test_context_manager_and_callbacks(self, verbalizer):
+        """Test that collect_stats restores the previous state and calls back."""
+        events = []
+        with verbalizer.collect_stats(events.append) as stats:
+            verbalizer.normalize("Nina KES 5000")
+        assert verbalizer.stats is None
+        assert stats.matches == {'currency': 1}
+        assert events[0]['pass'] == 'normalize'
+        assert events[0]['matches'] == {'currency': 1}
+    
+    def test_merge(self, verbalizer):
+        """Test that worker snapshots can be merged."""
+        with verbalizer.collect_stats() as first:
+            verbalizer.normalize("3")
+        with verbalizer.collect_stats() as second:
+            verbalizer.normalize("4 na 5")
+        first.merge(second.snapshot())
+        assert first.matches == {'number': 3}
+        assert first.calls == {'normalize': 2}
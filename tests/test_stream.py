@@ -0,0 +1,128 @@
+# tests/test_stream.py
+
+"""
+Test suite for streaming file normalization.
+"""
+
+import io
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.stream import iter_normalized
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+CORPUS = (
+    "Nina KES 1500 na saa ni 14:30 PM tarehe 25/12/2024.\n"
+    "Bei ni TZS 50000 leo, watoto 3 na gari 12\r\n"
+    "saa 14:30 5 na 3.14 KES\n1500\n"
+) * 20
+
+
+class TestNormalizeFile:
+    """Test normalize_file."""
+    
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+    def test_matches_whole_text(self, verbalizer, chunk_size):
+        """Test that every buffer size gives the same result as normalize()."""
+        out = io.StringIO()
+        verbalizer.normalize_file(io.StringIO(CORPUS, newline=''), out, chunk_size=chunk_size)
+        assert out.getvalue() == verbalizer.normalize(CORPUS)
+    
+    def test_paths(self, verbalizer, tmp_path):
+        """Test reading and writing files by path."""
+        src = tmp_path / "in.txt"
+        dst = tmp_path / "out.txt"
+        src.write_bytes(CORPUS.encode('utf-8'))
+        written = verbalizer.normalize_file(src, dst, chunk_size=100)
+        expected = verbalizer.normalize(CORPUS)
+        assert dst.read_bytes().decode('utf-8') == expected
+        assert written == len(expected)
+    
+    def test_numeric_table_is_split(self, verbalizer):
+        """Test that text without letters is still normalized in pieces."""
+        table = "".join(f"{i}\t{i * 7}\t14:30\t{i}.5\n" for i in range(2000))
+        pieces = list(iter_normalized(verbalizer, io.StringIO(table), chunk_size=1000))
+        assert len(pieces) > 10
+        assert max(map(len, pieces)) < 10000
+        assert ''.join(pieces) == verbalizer.normalize(table)
+    
+    def test_carry_is_capped(self, verbalizer):
+        """Test that a cut is forced when there is no safe point for too long."""
+        text = "x1 " * 1000
+        pieces = list(iter_normalized(verbalizer, io.StringIO(text), chunk_size=100, max_carry=500))
+        assert len(pieces) > 4
+        assert max(map(len, pieces)) <= 600
+        assert ''.join(pieces) == text
+        assert len(list(iter_normalized(verbalizer, io.StringIO(text), chunk_size=100))) == 1
+
+
+TOKENS = ["Bei", " ni", " KES", " 15", "00", ".50", " kwa", " siku", ",", " saa",
+          " 14", ":", "30", " PM", " leo", "."]
+
+
+class TestStreamingNormalizer:
+    """Test the push-style StreamingNormalizer."""
+    
+    def test_tokens_match_whole_text(self, verbalizer):
+        """Test that the fed and flushed pieces add up to normalize()."""
+        stream = verbalizer.streaming()
+        pieces = [stream.feed(token) for token in TOKENS]
+        pieces.append(stream.flush())
+        assert ''.join(pieces) == verbalizer.normalize(''.join(TOKENS))
+    
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 17])
+    def test_corpus_in_chunks(self, verbalizer, size):
+        """Test that every chunk size gives the same result as normalize()."""
+        stream = verbalizer.streaming()
+        pieces = [stream.feed(CORPUS[pos:pos + size]) for pos in range(0, len(CORPUS), size)]
+        pieces.append(stream.flush())
+        assert ''.join(pieces) == verbalizer.normalize(CORPUS)
+    
+    def test_holds_back_only_open_expressions(self, verbalizer):
+        """Test that text is released as soon as it can no longer change."""
+        stream = verbalizer.streaming()
+        assert stream.feed("Bei ni KES 15") == "Bei ni "
+        assert stream.pending == "KES 15"
+        assert stream.feed("00") == ""
+        assert stream.feed(" kwa") == "shilingi elfu moja na mia tano "
+        assert stream.pending == "kwa"
+        assert stream.feed(" saa 14:") == "kwa saa "
+        assert stream.pending == "14:"
+        assert stream.flush() == verbalizer.normalize("14:")
+        assert stream.pending == ""
+    
+    def test_time_suffix_is_awaited(self, verbalizer):
+        """Test that a time is held while an AM/PM suffix may follow."""
+        stream = verbalizer.streaming()
+        assert stream.feed("saa 9:15 ") == "saa "
+        assert stream.feed("PM ") == verbalizer.normalize("9:15 PM")
+    
+    def test_pending_is_capped(self, verbalizer):
+        """Test that text with no possible cut is still released past max_pending."""
+        stream = verbalizer.streaming(max_pending=200)
+        pieces = []
+        for _ in range(500):
+            pieces.append(stream.feed("KES 5 "))
+            assert len(stream.pending) <= 206
+        pieces.append(stream.flush())
+        assert sum(map(bool, pieces)) > 10
+        assert ''.join(pieces) == verbalizer.normalize("KES 5 " * 500)
+    
+    def test_reuse_after_flush(self, verbalizer):
+        """Test that a flushed stream starts a new text."""
+        stream = verbalizer.streaming()
+        stream.feed("KES 5")
+        stream.flush()
+        assert stream.feed("3") == ""
+        assert stream.flush() == "tatu"
+    
+    def test_collect_policy_rejected(self, verbalizer):
+        """Test that the 'collect' policy is refused."""
+        with pytest.raises(ValueError):
+            verbalizer.streaming(errors='collect')
@@ -4,8 +4,44 @@
 Test suite for Swahili text verbalizer.
 """
 
+import random
+
 import pytest
 from verbalizer import SwahiliVerbalizer
+from verbalizer.languages.swahili.number import (
+    BILLION, HUNDRED, MILLION, ONES, QUADRILLION, QUINTILLION, TENS, THOUSAND, TRILLION,
+    number_to_words,
+)
+
+
+def recursive_number_to_words(n):
+    """
+    Reference implementation: the recursive algorithm the table-driven
+    engine replaced, with one recursion per scale.
+    """
+    if n == 0:
+        return ONES[0]
+    
+    if n < 0:
+        return "hasi " + recursive_number_to_words(-n)
+    
+    for scale, word in ((10 ** 18, QUINTILLION), (10 ** 15, QUADRILLION), (10 ** 12, TRILLION),
+                        (1_000_000_000, BILLION), (1_000_000, MILLION),
+                        (1000, THOUSAND), (100, HUNDRED)):
+        if n >= scale:
+            count, remainder = divmod(n, scale)
+            result = f"{word} {recursive_number_to_words(count)}"
+            if remainder > 0:
+                result += f" na {recursive_number_to_words(remainder)}"
+            return result
+    
+    if n >= 10:
+        tens_digit, ones_digit = divmod(n, 10)
+        if ones_digit == 0:
+            return TENS[tens_digit * 10]
+        return f"{TENS[tens_digit * 10]} na {ONES[ones_digit]}"
+    
+    return ONES[n]
 
 
 @pytest.fixture
@@ -97,6 +133,36 @@ class TestSwahiliNumbers:
         assert "kumi" in verbalizer.normalize("Bei ni 10 shilingi")
 
 
+class TestSwahiliNumberEngine:
+    """Test the table-driven number engine."""
+    
+    def test_matches_recursive_reference(self):
+        """Test that output is identical to the recursive algorithm."""
+        rng = random.Random(0)
+        values = list(range(0, 20000))
+        values += [rng.randrange(10 ** rng.randint(4, 24)) for _ in range(20000)]
+        values += [-v for v in values[:1000]]
+        for value in values:
+            assert number_to_words(value) == recursive_number_to_words(value)
+    
+    def test_scales_beyond_billions(self):
+        """Test trillions and up, and counts above the largest scale."""
+        assert number_to_words(1_000_000_000_000) == "trilioni moja"
+        assert number_to_words(2 * 10 ** 15 + 5) == "kwadrilioni mbili na tano"
+        assert number_to_words(10 ** 21) == "kwintilioni elfu moja"
+    
+    def test_memo_stats_and_clear(self):
+        """Test that the memo reports hits and can be cleared."""
+        number_to_words.cache_clear()
+        number_to_words(123456)
+        number_to_words(123456)
+        info = number_to_words.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        number_to_words.cache_clear()
+        assert number_to_words.cache_info().currsize == 0
+
+
 class TestSwahiliCurrency:
     """Test currency verbalization."""
     
@@ -0,0 +1,113 @@
+# tests/test_tables.py
+
+"""
+Test suite for the precomputed time and date tables.
+"""
+
+import pickle
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.languages.swahili.date import DateTable, date_table, verbalize_date, verbalize_date_parts
+from verbalizer.languages.swahili.time import (
+    TIME_TABLE, TimeTable, verbalize_time_12h, verbalize_time_24h, verbalize_time_parts,
+)
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer()
+
+
+def computed_time(hours, minutes, seconds, period):
+    """Reference result from the computed path."""
+    if period:
+        return verbalize_time_12h(hours, minutes, period, seconds)
+    return verbalize_time_24h(hours, minutes, seconds)
+
+
+class TestTimeTable:
+    """Test the time-of-day table."""
+
+    def test_every_minute(self):
+        """Test that every minute of the day, in both formats, matches the computed path."""
+        for hours in range(25):
+            for minutes in range(61):
+                for period in (None, 'AM', 'PM'):
+                    assert verbalize_time_parts(hours, minutes, None, period) == \
+                        computed_time(hours, minutes, None, period)
+
+    def test_seconds(self):
+        """Test times with seconds, including out-of-range values."""
+        for hours in (0, 7, 12, 23, 30):
+            for seconds in (0, 1, 30, 59, 60, 99):
+                for period in (None, 'AM', 'PM'):
+                    assert verbalize_time_parts(hours, 5, seconds, period) == \
+                        computed_time(hours, 5, seconds, period)
+
+    def test_outside_clock(self):
+        """Test that times outside the clock fall back to the computed path."""
+        table = TimeTable()
+        assert table.lookup(25, 75) is None
+        assert table.lookup(14, 30, None, 'PM') is None
+        assert verbalize_time_parts(99, 99) == "saa tisini na tisa na dakika tisini na tisa"
+
+    def test_lazy_build(self):
+        """Test that the table is built on the first lookup."""
+        table = TimeTable()
+        assert not table.built
+        assert table.lookup(14, 30) == "saa kumi na nne na dakika thelathini"
+        assert table.built
+
+
+class TestDateTable:
+    """Test the calendar-date table."""
+
+    def test_matches_computed(self):
+        """Test that every day in and around the year range matches the computed path."""
+        table = DateTable(1999, 2001)
+        for year in (1998, 1999, 2000, 2001, 2002):
+            for month in range(1, 13):
+                for day in range(1, 32):
+                    assert verbalize_date_parts(day, month, year, table) == \
+                        verbalize_date(day, month, year)
+
+    def test_year_range(self):
+        """Test that years outside the range are not in the table."""
+        table = DateTable(2000, 2010)
+        assert table.lookup(1, 1, 2011) is None
+        assert table.lookup(1, 1, 2010) is not None
+        with pytest.raises(ValueError):
+            DateTable(2010, 2000)
+
+    def test_validation(self):
+        """Test that invalid components are still rejected."""
+        with pytest.raises(ValueError, match="Invalid day: 45"):
+            verbalize_date_parts(45, 12, 2024)
+        with pytest.raises(ValueError, match="Invalid month: 13"):
+            verbalize_date_parts(1, 13, 2024)
+
+    def test_shared_and_picklable(self):
+        """Test that tables are shared per range and unpickle to the shared one."""
+        assert date_table(1950, 2050) is date_table(1950, 2050)
+        assert pickle.loads(pickle.dumps(date_table(1950, 2050))) is date_table(1950, 2050)
+
+
+class TestVerbalizerTables:
+    """Test the table options of SwahiliVerbalizer."""
+
+    def test_eager(self):
+        """Test that eager_tables builds both tables at construction."""
+        verbalizer = SwahiliVerbalizer(year_range=(1800, 1810), eager_tables=True)
+        assert TIME_TABLE.built
+        assert verbalizer.date_table.built
+        assert verbalizer.date_table.first_year == 1800
+
+    def test_output(self, verbalizer):
+        """Test end-to-end output inside and outside the year range."""
+        narrow = SwahiliVerbalizer(year_range=(2024, 2024))
+        for text in ["Tarehe 15/08/2024 saa 3:45 PM", "Tarehe 15/08/1066 saa 14:30:15"]:
+            assert narrow.normalize(text) == verbalizer.normalize(text)
+        assert verbalizer.normalize("Tutaonana 3:45 PM") == \
+            "Tutaonana saa kumi na tano na dakika arobaini na tano jioni"
@@ -0,0 +1,259 @@
+# tests/test_threads.py
+
+"""
+Stress tests for one normalizer shared by many threads.
+"""
+
+import pickle
+import sys
+import threading
+import warnings
+
+import pytest
+from verbalizer import SwahiliVerbalizer
+from verbalizer.cache import LRUCache, ShardedLRUCache
+
+
+THREADS = 8
+ROUNDS = 40
+
+TEXTS = [
+    "Nina KES 5000 na USD 20.50",
+    "Mkutano ni saa 14:30 tarehe 15/03/2024",
+    "Watoto 3 walikula maembe 12",
+    "Bei ni TZS 1,250,000 leo",
+    "Alifika saa 7:05:09 asubuhi",
+    "Namba 0712345678 na 1000000000000000000000",
+    "Tarehe 45/13/2024 si sahihi",
+    "Hakuna namba hapa",
+    "Mwaka 1999 na 2024",
+    "KES 0.75 na saa 23:59",
+]
+
+
+@pytest.fixture
+def verbalizer():
+    """Fixture to create a SwahiliVerbalizer instance."""
+    return SwahiliVerbalizer(errors='ignore')
+
+
+@pytest.fixture(autouse=True)
+def switch_often():
+    """Switch threads as often as possible, to interleave them with the GIL too."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def hammer(work, threads=THREADS):
+    """
+    Run ``work(index)`` on many threads released at once.
+
+    Returns:
+        list: Results per thread
+
+    Raises:
+        Exception: The first exception raised by a thread
+    """
+    barrier = threading.Barrier(threads)
+    results = [None] * threads
+    errors = []
+
+    def target(index):
+        try:
+            barrier.wait()
+            results[index] = work(index)
+        except BaseException as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=target, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def rotated(index):
+    """Return the test texts repeated ROUNDS times, starting at a thread's offset."""
+    texts = TEXTS[index % len(TEXTS):] + TEXTS[:index % len(TEXTS)]
+    return texts * ROUNDS
+
+
+class TestSharedNormalizer:
+    """Test that concurrent calls give the same results as serial ones."""
+
+    def expected(self, texts):
+        return [SwahiliVerbalizer(errors='ignore').normalize(text) for text in texts]
+
+    def test_plain(self, verbalizer):
+        """Test the uncached fast path."""
+        results = hammer(lambda index: [verbalizer.normalize(text) for text in rotated(index)])
+        for index, result in enumerate(results):
+            assert result == self.expected(rotated(index))
+
+    @pytest.mark.parametrize('shards, locked', [(1, False), (1, True), (8, False), (8, True)])
+    def test_cached(self, verbalizer, shards, locked):
+        """Test small caches that evict constantly, sharded or not, locked or not."""
+        verbalizer.enable_cache(max_texts=4, max_expressions=6, shards=shards)
+        for cache in (verbalizer.cache.texts, verbalizer.cache.expressions):
+            for shard in getattr(cache, '_shards', [cache]):
+                shard.locked = locked
+        results = hammer(lambda index: [verbalizer.normalize(text) for text in rotated(index)])
+        for index, result in enumerate(results):
+            assert result == self.expected(rotated(index))
+        info = verbalizer.cache.info()['texts']
+        assert info['entries'] <= 4 + shards
+        if locked:
+            assert info['hits'] + info['misses'] == THREADS * ROUNDS * len(TEXTS)
+
+    def test_collect_policy(self, verbalizer):
+        """Test that each call gets its own list of failures."""
+        def work(index):
+            return [verbalizer.normalize(text, errors='collect') for text in rotated(index)]
+
+        for index, result in enumerate(hammer(work)):
+            assert [output for output, _ in result] == self.expected(rotated(index))
+            # One invalid date per round of texts
+            assert sum(len(failures) for _, failures in result) == ROUNDS
+
+    def test_single_category_passes(self, verbalizer):
+        """Test the single-category normalizers."""
+        def work(index):
+            return [verbalizer.normalize_time(verbalizer.normalize_numbers(text))
+                    for text in rotated(index)]
+
+        serial = SwahiliVerbalizer(errors='ignore')
+        for index, result in enumerate(hammer(work)):
+            assert result == [serial.normalize_time(serial.normalize_numbers(text))
+                              for text in rotated(index)]
+
+    def test_disk_cache_first_use(self, verbalizer, tmp_path):
+        """Test that threads can open a disk cache together and share it."""
+        verbalizer.enable_disk_cache(tmp_path / 'cache.db', batch_size=7)
+        results = hammer(lambda index: [verbalizer.normalize(text) for text in rotated(index)])
+        verbalizer.disk_cache.flush()
+        for index, result in enumerate(results):
+            assert result == self.expected(rotated(index))
+        assert verbalizer.disk_cache.get(TEXTS[0]) == self.expected(TEXTS[:1])[0]
+
+
+class TestSharedStats:
+    """Test statistics recorded from many threads."""
+
+    def test_enabled_stats_are_exact(self, verbalizer):
+        """Test that no pass is lost when all threads record into one object."""
+        stats = verbalizer.enable_stats()
+        hammer(lambda index: [verbalizer.normalize(text) for text in rotated(index)])
+        serial = SwahiliVerbalizer(errors='ignore')
+        expected = serial.enable_stats()
+        for _ in range(THREADS):
+            for text in rotated(0):
+                serial.normalize(text)
+        assert stats.calls == expected.calls
+        assert stats.chars == expected.chars
+        assert stats.matches == expected.matches
+        assert stats.failures == expected.failures
+
+    def test_collect_stats_per_thread(self, verbalizer):
+        """Test that a collect_stats block records only its own thread's calls."""
+        background = verbalizer.enable_stats()
+
+        def work(index):
+            if index % 2:
+                for text in rotated(index):
+                    verbalizer.normalize(text)
+                return None
+            with verbalizer.collect_stats() as outer:
+                for text in rotated(index)[index:]:
+                    verbalizer.normalize(text)
+                with verbalizer.collect_stats() as inner:
+                    verbalizer.normalize("KES 5")
+            return outer, inner
+
+        results = hammer(work)
+        serial = SwahiliVerbalizer(errors='ignore')
+        for index, result in enumerate(results):
+            if index % 2 == 0:
+                outer, inner = result
+                with serial.collect_stats() as expected:
+                    for text in rotated(index)[index:]:
+                        serial.normalize(text)
+                assert outer.calls == {'normalize': len(TEXTS) * ROUNDS - index}
+                assert outer.matches == expected.matches
+                assert inner.matches == {'currency': 1}
+        assert background.calls['normalize'] == THREADS // 2 * ROUNDS * len(TEXTS)
+        assert verbalizer.stats is background
+        assert verbalizer.disable_stats() is background
+        assert verbalizer.stats is None
+
+    def test_collect_stats_over_batch_threads(self, verbalizer):
+        """Test that a block records the passes normalize_batch hands to its threads."""
+        texts = ["KES 5 na USD 20"] * 200
+        with verbalizer.collect_stats() as stats:
+            verbalizer.normalize_batch(texts, executor='thread', workers=4, chunksize=100)
+        assert stats.matches == {'currency': 400}
+        assert stats.calls == {'normalize': 200}
+        assert verbalizer.stats is None
+
+    def test_collect_stats_over_async_pieces(self, verbalizer):
+        """Test that a block records the pieces anormalize sends to its executor."""
+        import asyncio
+        verbalizer.configure_async(inline_chars=100, piece_chars=500)
+        text = "Bei ni KES 5 leo. " * 300
+        with verbalizer.collect_stats() as stats:
+            asyncio.run(verbalizer.anormalize(text))
+        assert stats.matches == {'currency': 300}
+        assert stats.calls['normalize'] > 1
+        assert verbalizer.stats is None
+
+    def test_pickle_inside_block(self, verbalizer):
+        """Test that an open block does not travel to a worker process."""
+        with verbalizer.collect_stats():
+            copy = pickle.loads(pickle.dumps(verbalizer))
+        assert copy.stats is None
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert copy.normalize("Watoto 3") == verbalizer.normalize("Watoto 3")
+
+
+class TestShardedLRUCache:
+    """Test the sharded cache used on free-threaded builds."""
+
+    def test_limits(self):
+        """Test that the limits hold across shards."""
+        cache = ShardedLRUCache(max_entries=64, max_bytes=1 << 20, shards=8)
+        for number in range(1000):
+            cache.put(str(number), str(number))
+        assert len(cache) <= 64
+        assert cache.evictions == 1000 - len(cache)
+        assert cache.get('999') == '999'
+        assert cache.info()['shards'] == 8
+
+    def test_tiny_cache(self):
+        """Test that small caches use fewer shards."""
+        cache = ShardedLRUCache(max_entries=2, max_bytes=1 << 20, shards=16)
+        assert cache.info()['shards'] == 2
+        assert ShardedLRUCache(max_entries=0, max_bytes=0).get('a') is None
+
+    def test_locked_counters_are_exact(self):
+        """Test that locked lookups count every hit and miss."""
+        for cache in (LRUCache(100, 1 << 20, locked=True),
+                      ShardedLRUCache(100, 1 << 20, shards=4, locked=True)):
+            for number in range(50):
+                cache.put(number, str(number))
+            hammer(lambda index: [cache.get(number) for _ in range(ROUNDS) for number in range(100)])
+            assert cache.hits == THREADS * ROUNDS * 50
+            assert cache.misses == THREADS * ROUNDS * 50
+
+    def test_pickle(self):
+        """Test that a pickled cache is empty with the same limits."""
+        cache = ShardedLRUCache(max_entries=32, max_bytes=1 << 20, shards=4, locked=True)
+        cache.put('a', 'b')
+        copy = pickle.loads(pickle.dumps(cache))
+        assert len(copy) == 0
+        assert copy.info()['shards'] == 4
+        assert copy.locked
@@ -2,9 +2,24 @@
 African Languages Text Normalizer
 
 A rule-based text normalization library for African languages.
+
+Languages are imported on first use; ``import verbalizer`` loads none of them.
 """
 
-from .languages.swahili import SwahiliVerbalizer
+from .registry import available_languages, get_verbalizer, get_verbalizer_class, register_language
 
 __version__ = "0.1.0"
-__all__ = ['SwahiliVerbalizer']
\ No newline at end of file
+__all__ = [
+    'SwahiliVerbalizer',
+    'available_languages',
+    'get_verbalizer',
+    'get_verbalizer_class',
+    'register_language',
+]
+
+
+def __getattr__(name):
+    # Language classes are resolved through the registry when first accessed
+    if name == 'SwahiliVerbalizer':
+        return get_verbalizer_class('sw')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,121 @@
+"""
+Asyncio support for normalization inside async servers.
+
+Short inputs are normalized inline; they take microseconds and a round trip
+through an executor would cost more. Long inputs are split at safe points and
+the pieces are normalized one after another in an executor, so the event
+loop keeps running, a cancelled request stops after the current piece, and a
+semaphore bounds how many long inputs are in the executor at once.
+
+asyncio itself is imported on first use, so that ``import verbalizer`` does
+not pay for it in programs that never normalize from a coroutine.
+"""
+
+import os
+import weakref
+from contextvars import copy_context
+
+from .batch import chunk_by_chars
+from .stream import split_text
+
+
+# Inputs up to this many characters are normalized on the event loop
+DEFAULT_INLINE_CHARS = 2048
+
+# Characters per executor job for long inputs
+DEFAULT_PIECE_CHARS = 64 * 1024
+
+
+class AsyncRunner:
+    """
+    Runs a normalizer from coroutines.
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        executor (concurrent.futures.Executor, optional): Executor for long
+            inputs (default: the event loop's default executor)
+        inline_chars (int): Inputs up to this size run inline
+        max_concurrency (int, optional): Long inputs processed at the same
+            time (default: CPU count)
+        piece_chars (int): Characters per executor job
+    """
+
+    def __init__(self, normalizer, executor=None, inline_chars=DEFAULT_INLINE_CHARS,
+                 max_concurrency=None, piece_chars=DEFAULT_PIECE_CHARS):
+        self.normalizer = normalizer
+        self.executor = executor
+        self.inline_chars = inline_chars
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.piece_chars = piece_chars
+        # asyncio primitives belong to one event loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self):
+        """Return the concurrency limit for the running loop."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def normalize(self, text, errors=None):
+        """
+        Normalize one text.
+
+        Args:
+            text (str): Input text
+            errors (str, optional): Error policy for this call
+
+        Returns:
+            Same as BaseNormalizer.normalize
+        """
+        normalize = self.normalizer.normalize
+        if len(text) <= self.inline_chars:
+            return normalize(text, errors)
+
+        import asyncio
+        loop = asyncio.get_running_loop()
+        pieces = split_text(self.normalizer.detector, text, self.piece_chars)
+        results = []
+        async with self._semaphore():
+            for offset, piece in pieces:
+                # run_in_executor does not carry the context over by itself
+                result = await loop.run_in_executor(
+                    self.executor, copy_context().run, normalize, piece, errors
+                )
+                results.append((offset, result))
+
+        if (errors or self.normalizer.errors) != 'collect':
+            return ''.join(result for _, result in results)
+        failures = [
+            failure._replace(offset=failure.offset + offset)
+            for offset, (_, piece_failures) in results
+            for failure in piece_failures
+        ]
+        return ''.join(result for _, (result, _) in results), failures
+
+    async def normalize_batch(self, texts, errors=None):
+        """
+        Normalize many texts concurrently.
+
+        Short texts are grouped so that each inline step stays under
+        ``inline_chars``; the event loop runs other tasks in between.
+
+        Args:
+            texts (iterable): Input texts
+            errors (str, optional): Error policy for this call
+
+        Returns:
+            list: Results in input order
+        """
+        async def run(chunk):
+            if len(chunk) == 1:
+                return [await self.normalize(chunk[0], errors)]
+            normalize = self.normalizer.normalize
+            return [normalize(text, errors) for text in chunk]
+
+        import asyncio
+        chunks = chunk_by_chars(list(texts), self.inline_chars)
+        results = await asyncio.gather(*(run(chunk) for chunk in chunks))
+        return [result for chunk in results for result in chunk]
@@ -3,9 +3,26 @@ Base verbalizer class for text normalization.
 All language-specific normalizers should inherit from this class.
 """
 
-import re
+import os
+import sys
+import threading
 import warnings
 from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import contextmanager
+
+from .detector import Detector
+from .errors import Failure, NormalizationError, check_policy
+from .stats import NormalizerStats, ScopedStats
+
+# The batch, streaming, caching and async subsystems are imported by the
+# methods that use them, so that loading a language stays cheap. Their
+# options default to None here, which stands for the subsystem's own default.
+
+
+def _given(**options):
+    """Return the options that were passed, i.e. are not None."""
+    return {name: value for name, value in options.items() if value is not None}
 
 
 class BaseNormalizer(ABC):
@@ -13,11 +30,58 @@ class BaseNormalizer(ABC):
     Abstract base class for text normalization.
     
     All language-specific normalizers must implement the abstract methods.
+    
+    Thread safety: one instance can be shared by any number of threads, on
+    regular and free-threaded CPython builds alike. Normalization keeps no
+    per-call state on the instance; the caches and statistics it updates are
+    safe to use concurrently (see verbalizer.cache and verbalizer.stats), and
+    ``collect_stats`` records only the calling thread's passes. Configure the
+    instance (``enable_cache``, ``enable_disk_cache``, ``configure_async``)
+    before sharing it: those calls are not meant to race with each other.
     """
     
-    def __init__(self):
-        """Initialize the verbalizer with language-specific patterns."""
+    def __init__(self, errors='warn'):
+        """
+        Initialize the verbalizer with language-specific patterns.
+        
+        Args:
+            errors (str): Default policy for expressions that cannot be
+                verbalized: 'ignore', 'collect', 'warn' or 'raise'
+                (see verbalizer.errors)
+        """
+        self.errors = check_policy(errors)
         self.patterns = self._get_patterns()
+        self.detector = Detector(self.patterns, hints=self._get_pattern_hints())
+        self.stats = None
+        self.cache = None
+        self.disk_cache = None
+        self._async = None
+        self._stats_lock = threading.Lock()
+        self._bind_verbalizers()
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Closures are rebuilt on unpickling, e.g. in a worker process;
+        # async settings hold an executor and stay with the original
+        del state['_verbalizers']
+        del state['_stats_lock']
+        state['_async'] = None
+        if isinstance(self.stats, ScopedStats):
+            # collect_stats blocks belong to this process's threads
+            state['stats'] = self.stats.fallback
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._stats_lock = threading.Lock()
+        self._bind_verbalizers()
+    
+    def _bind_verbalizers(self):
+        """Build the callbacks for the policies that need no per-call state."""
+        self._verbalizers = {
+            policy: self._make_verbalizer(policy)
+            for policy in ('ignore', 'warn', 'raise')
+        }
     
     @abstractmethod
     def _get_patterns(self):
@@ -29,6 +93,28 @@ class BaseNormalizer(ABC):
         """
         pass
     
+    def _get_pattern_hints(self):
+        """
+        Return the Detector's analysis of the patterns, if precomputed.
+        
+        Languages whose patterns come from a cached language pack return
+        its ``pattern_hints``, so that new processes skip parsing them.
+        
+        Returns:
+            dict or None: Category -> detector.pattern_hints of its pattern
+        """
+        return None
+    
+    def _get_warmup_texts(self):
+        """
+        Return sample texts of the language for :meth:`warmup`.
+        
+        Returns:
+            tuple: Texts; empty when the language has none, which skips
+            the warm-up
+        """
+        return ()
+    
     @abstractmethod
     def verbalize_number(self, number_str):
         """
@@ -81,105 +167,679 @@ class BaseNormalizer(ABC):
         """
         pass
     
-    def normalize_numbers(self, text):
+    def _verbalize_match(self, category, match):
+        """
+        Verbalize a single detected expression.
+        
+        Args:
+            category (str): Pattern category ('currency', 'date', 'time' or 'number')
+            match: Regex match object for the expression
+            
+        Returns:
+            str: Verbalized text
+            
+        Raises:
+            Exception: Whatever the language's verbalizer raises for an
+            expression it cannot handle
+        """
+        if category == 'number':
+            return self.verbalize_number(match.group())
+        if category == 'currency':
+            return self.verbalize_currency(match)
+        if category == 'time':
+            return self.verbalize_time(match)
+        if category == 'date':
+            return self.verbalize_date(match)
+        raise ValueError(f"Unknown category '{category}'")
+    
+    def _make_verbalizer(self, errors, failures=None):
+        """
+        Build a ``verbalize(category, match)`` callback for an error policy.
+        
+        The callback returns the verbalized text, or None when the expression
+        should be left as it is.
+        
+        Args:
+            errors (str): Error policy
+            failures (list, optional): Receives Failure records under 'collect'
+            
+        Returns:
+            callable: Verbalization callback
+        """
+        verbalize_match = self._verbalize_match
+        if self.cache is not None:
+            verbalize_match = self.cache.wrap(verbalize_match)
+        
+        if errors == 'raise':
+            def verbalize(category, match):
+                try:
+                    return verbalize_match(category, match)
+                except Exception as e:
+                    raise NormalizationError(match.start(), category, match.group(), str(e)) from e
+        elif errors == 'warn':
+            def verbalize(category, match):
+                try:
+                    return verbalize_match(category, match)
+                except Exception as e:
+                    warnings.warn(f"Failed to normalize {category} '{match.group()}': {str(e)}")
+                    return None
+        elif errors == 'collect':
+            def verbalize(category, match):
+                try:
+                    return verbalize_match(category, match)
+                except Exception as e:
+                    failures.append(Failure(match.start(), category, str(e)))
+                    return None
+        else:
+            def verbalize(category, match):
+                try:
+                    return verbalize_match(category, match)
+                except Exception:
+                    return None
+        
+        return verbalize
+    
+    def _run_pass(self, name, text, errors, run):
+        """
+        Run one normalization pass under an error policy.
+        
+        Args:
+            name (str): Pass name, for statistics
+            text (str): Input text
+            errors (str or None): Error policy, or None for the instance default
+            run (callable): ``run(verbalize)`` performing the pass
+            
+        Returns:
+            The result of ``run``, with the list of failures appended when
+            the policy is 'collect'
+        """
+        errors = self.errors if errors is None else check_policy(errors)
+        if errors == 'collect':
+            failures = []
+            verbalize = self._make_verbalizer(errors, failures)
+        else:
+            failures = None
+            verbalize = self._verbalizers[errors]
+        
+        if self.stats is not None:
+            result = self.stats.run_pass(name, text, verbalize, run)
+        else:
+            result = run(verbalize)
+        
+        if failures is None:
+            return result
+        if isinstance(result, tuple):
+            return result + (failures,)
+        return result, failures
+    
+    def _normalize_category(self, category, text, errors=None):
+        """
+        Normalize every expression of a single category in text.
+        
+        Args:
+            category (str): Pattern category
+            text (str): Input text
+            errors (str, optional): Error policy for this call
+            
+        Returns:
+            str: Text with that category normalized
+        """
+        pattern = self.patterns[category]
+        
+        def run(verbalize):
+            def replace(match):
+                result = verbalize(category, match)
+                return match.group() if result is None else result
+            return pattern.sub(replace, text)
+        
+        return self._run_pass(category, text, errors, run)
+    
+    def normalize_numbers(self, text, errors=None):
         """
         Normalize all numbers in text.
         
         Args:
             text (str): Input text
+            errors (str, optional): Error policy for this call
             
         Returns:
             str: Text with normalized numbers
         """
-        def replace_number(match):
-            try:
-                return self.verbalize_number(match.group())
-            except Exception as e:
-                warnings.warn(f"Failed to normalize number '{match.group()}': {str(e)}")
-                return match.group()
-        
-        return self.patterns['number'].sub(replace_number, text)
+        return self._normalize_category('number', text, errors)
     
-    def normalize_currency(self, text):
+    def normalize_currency(self, text, errors=None):
         """
         Normalize all currency amounts in text.
         
         Args:
             text (str): Input text
+            errors (str, optional): Error policy for this call
             
         Returns:
             str: Text with normalized currency
         """
-        def replace_currency(match):
-            try:
-                return self.verbalize_currency(match)
-            except Exception as e:
-                warnings.warn(f"Failed to normalize currency '{match.group()}': {str(e)}")
-                return match.group()
-        
-        return self.patterns['currency'].sub(replace_currency, text)
+        return self._normalize_category('currency', text, errors)
     
-    def normalize_time(self, text):
+    def normalize_time(self, text, errors=None):
         """
         Normalize all time expressions in text.
         
         Args:
             text (str): Input text
+            errors (str, optional): Error policy for this call
             
         Returns:
             str: Text with normalized time
         """
-        def replace_time(match):
-            try:
-                return self.verbalize_time(match)
-            except Exception as e:
-                warnings.warn(f"Failed to normalize time '{match.group()}': {str(e)}")
-                return match.group()
-        
-        return self.patterns['time'].sub(replace_time, text)
+        return self._normalize_category('time', text, errors)
     
-    def normalize_dates(self, text):
+    def normalize_dates(self, text, errors=None):
         """
         Normalize all dates in text.
         
         Args:
             text (str): Input text
+            errors (str, optional): Error policy for this call
             
         Returns:
             str: Text with normalized dates
         """
-        def replace_date(match):
-            try:
-                return self.verbalize_date(match)
-            except Exception as e:
-                warnings.warn(f"Failed to normalize date '{match.group()}': {str(e)}")
-                return match.group()
-        
-        return self.patterns['date'].sub(replace_date, text)
+        return self._normalize_category('date', text, errors)
     
-    def normalize(self, text):
+    def normalize(self, text, errors=None):
         """
         Apply all normalizations to text.
         
-        The order is: currency -> dates -> time -> numbers
-        This prevents double-normalization of numbers in currency/time/date expressions.
+        The priority is: currency -> dates -> time -> numbers
+        This prevents double-normalization of numbers in currency/time/date
+        expressions. All categories are detected in a single pass and the
+        result is the same as running the individual normalizers in that order.
+        
+        Args:
+            text (str): Input text
+            errors (str, optional): Error policy for this call ('ignore',
+                'collect', 'warn' or 'raise'); defaults to the instance policy
+            
+        Returns:
+            str: Fully normalized text, or ``(text, failures)`` under 'collect'
+        """
+        if self.cache is not None or self.disk_cache is not None:
+            return self._normalize_cached(text, errors)
+        if errors is None and self.stats is None and self.errors != 'collect':
+            return self.detector.sub(text, self._verbalizers[self.errors])
+        return self._run_pass(
+            'normalize', text, errors,
+            lambda verbalize: self.detector.sub(text, verbalize),
+        )
+    
+    def _normalize_cached(self, text, errors):
+        """
+        Normalize text through the in-memory and on-disk caches.
+        
+        Only texts normalized without a failure are cached. Their result is
+        the same under every error policy, so a hit is valid whatever the
+        policy of the call. Hits are recorded in ``stats`` with the matches
+        of the pass that produced them.
         
         Args:
             text (str): Input text
+            errors (str or None): Error policy, or None for the instance default
             
         Returns:
-            str: Fully normalized text
+            str: Normalized text, or ``(text, failures)`` under 'collect'
         """
-        # Process currency first (contains numbers)
-        text = self.normalize_currency(text)
+        cache = self.cache
+        disk_cache = self.disk_cache
+        entry = None
+        if cache is not None:
+            entry = cache.texts.get(text)
+        if entry is None and disk_cache is not None:
+            entry = disk_cache.get_entry(text)
+            if entry is not None and cache is not None:
+                cache.texts.put(text, entry)
+        collect = (self.errors if errors is None else check_policy(errors)) == 'collect'
+        if entry is not None:
+            result, matches = entry
+            if self.stats is not None:
+                self.stats.record_cached('normalize', text, matches)
+            return (result, []) if collect else result
+        
+        matches = Counter()
+        clean = True
         
-        # Then dates (contains numbers)
-        text = self.normalize_dates(text)
+        def run(verbalize):
+            def replace(category, match):
+                nonlocal clean
+                result = verbalize(category, match)
+                if result is None:
+                    clean = False
+                else:
+                    matches[category] += 1
+                return result
+            return self.detector.sub(text, replace)
         
-        # Then time (contains numbers)
-        text = self.normalize_time(text)
+        output = self._run_pass('normalize', text, errors, run)
+        if clean:
+            entry = (output[0] if collect else output, tuple(matches.items()))
+            if disk_cache is not None:
+                disk_cache.put(text, *entry)
+            if cache is not None:
+                cache.texts.put(text, entry)
+        return output
+    
+    def normalize_with_spans(self, text, errors=None):
+        """
+        Normalize text and report where every verbalized region came from.
         
-        # Finally standalone numbers
-        text = self.normalize_numbers(text)
+        The spans are produced in the same pass as the normalized text.
         
-        return text
\ No newline at end of file
+        Args:
+            text (str): Input text
+            errors (str, optional): Error policy for this call
+            
+        Returns:
+            tuple: ``(normalized text, SpanList)``; each span has the source
+            and output offsets, the category and the original text. Under
+            'collect' the list of failures is appended to the tuple.
+        """
+        return self._run_pass(
+            'normalize', text, errors,
+            lambda verbalize: self.detector.sub_with_spans(text, verbalize),
+        )
+    
+    def normalize_batch(self, texts, workers=None, executor='process', chunksize=None):
+        """
+        Normalize many texts, optionally across a thread or process pool.
+        
+        Texts are grouped into chunks by total character count and each
+        worker builds its normalizer once.
+        
+        Args:
+            texts (iterable): Input texts
+            workers (int, optional): Number of workers (default: CPU count)
+            executor (str): 'process', 'thread' or 'serial'
+            chunksize (int, optional): Target characters per task
+            
+        Returns:
+            list: Normalized texts, in input order
+        """
+        from .batch import normalize_batch
+        
+        return normalize_batch(self, texts, workers=workers, executor=executor, chunksize=chunksize)
+    
+    def normalize_file(self, src, dst, chunk_size=None, encoding='utf-8'):
+        """
+        Stream a text file through the normalizer in bounded memory.
+        
+        The output is identical to calling normalize() on the whole file.
+        
+        Args:
+            src: Input path, or a text file object opened for reading
+            dst: Output path, or a text file object opened for writing
+            chunk_size (int, optional): Characters read per buffer (default:
+                verbalizer.stream.DEFAULT_CHUNK_SIZE)
+            encoding (str): Encoding used for paths
+            
+        Returns:
+            int: Number of characters written
+        """
+        from .stream import normalize_file
+        
+        return normalize_file(self, src, dst, encoding=encoding, **_given(chunk_size=chunk_size))
+    
+    def streaming(self, errors=None, max_pending=None):
+        """
+        Normalize text pushed piece by piece, e.g. LLM tokens for live TTS.
+        
+        Example:
+            stream = verbalizer.streaming()
+            for token in tokens:
+                speak(stream.feed(token))
+            speak(stream.flush())
+        
+        Args:
+            errors (str, optional): 'ignore', 'warn' or 'raise'; defaults to
+                the instance policy
+            max_pending (int, optional): Characters held back after which a
+                cut is forced (default: verbalizer.stream.DEFAULT_MAX_PENDING)
+            
+        Returns:
+            StreamingNormalizer: A new stream; see verbalizer.stream
+        """
+        from .stream import StreamingNormalizer
+        
+        return StreamingNormalizer(self, errors, **_given(max_pending=max_pending))
+    
+    def normalize_manifest(self, src, dst, columns, dialect='tsv', header=False,
+                           keep_original=False, workers=1, batch_rows=None, **options):
+        """
+        Stream a TSV/CSV manifest, normalizing only the chosen columns.
+        
+        Other cells are copied byte for byte and rewritten cells keep their
+        quoting. Memory use does not depend on the size of the file.
+        
+        Args:
+            src: Input path, or a binary file object opened for reading
+            dst: Output path, or a binary file object opened for writing
+            columns (iterable): Zero-based column indexes, or header names
+            dialect (str): 'tsv' or 'csv'
+            header (bool): The first record is a header
+            keep_original (bool): Append the original text as extra columns
+            workers (int): Worker processes; 1 runs inline
+            batch_rows (int, optional): Records per batch (default:
+                verbalizer.manifest.DEFAULT_BATCH_ROWS)
+            **options: ``delimiter``, ``quotechar`` and ``ordered``, see
+                verbalizer.manifest.normalize_manifest
+            
+        Returns:
+            dict: Records and bytes read, and matches per category
+        """
+        from .manifest import normalize_manifest
+        
+        return normalize_manifest(self, src, dst, columns, dialect=dialect, header=header,
+                                  keep_original=keep_original, workers=workers,
+                                  **_given(batch_rows=batch_rows), **options)
+    
+    def incremental(self, text='', errors=None, piece_chars=None):
+        """
+        Hold a document and keep its normalized form up to date as it is edited.
+        
+        Example:
+            document = verbalizer.incremental(text)
+            document.edit(offset, deleted, inserted)
+            document.output    # == verbalizer.normalize(document.text)
+        
+        Args:
+            text (str): Initial document
+            errors (str, optional): 'ignore', 'warn' or 'raise'; defaults to
+                the instance policy
+            piece_chars (int, optional): Target characters re-normalized per
+                piece (default: verbalizer.incremental.DEFAULT_PIECE_CHARS)
+            
+        Returns:
+            IncrementalNormalizer: The document
+        """
+        from .incremental import IncrementalNormalizer
+        
+        return IncrementalNormalizer(self, text, errors, **_given(piece_chars=piece_chars))
+    
+    def enable_stats(self, *callbacks):
+        """
+        Start recording statistics for every normalization call.
+        
+        Args:
+            *callbacks: Callables invoked with an event dict after every pass,
+                e.g. to export the numbers to a metrics system
+            
+        Returns:
+            NormalizerStats: The counters being recorded
+        """
+        stats = NormalizerStats(callbacks)
+        with self._stats_lock:
+            if isinstance(self.stats, ScopedStats):
+                self.stats.fallback = stats
+            else:
+                self.stats = stats
+        return stats
+    
+    def disable_stats(self):
+        """
+        Stop recording statistics.
+        
+        Open ``collect_stats`` blocks keep recording until they end.
+        
+        Returns:
+            NormalizerStats or None: The counters recorded so far
+        """
+        with self._stats_lock:
+            if isinstance(self.stats, ScopedStats):
+                stats, self.stats.fallback = self.stats.fallback, None
+            else:
+                stats, self.stats = self.stats, None
+        return stats
+    
+    @contextmanager
+    def collect_stats(self, *callbacks):
+        """
+        Record statistics for the duration of a ``with`` block.
+        
+        Only the calls made in the current context are recorded, so threads
+        sharing the normalizer can each collect their own statistics. Work
+        that ``normalize_batch`` and the async adapter hand to worker threads
+        is recorded with the block that started it.
+        
+        Example:
+            with verbalizer.collect_stats() as stats:
+                verbalizer.normalize(text)
+            print(stats.matches)
+        
+        Args:
+            *callbacks: Callables invoked with an event dict after every pass
+            
+        Yields:
+            NormalizerStats: The counters for this block
+        """
+        stats = NormalizerStats(callbacks)
+        with self._stats_lock:
+            scoped = self.stats
+            if not isinstance(scoped, ScopedStats):
+                scoped = self.stats = ScopedStats(scoped)
+            scoped.push(stats)
+        try:
+            yield stats
+        finally:
+            with self._stats_lock:
+                if not scoped.pop(stats) and self.stats is scoped:
+                    self.stats = scoped.fallback
+    
+    def enable_cache(self, max_texts=None, max_text_bytes=None, max_expressions=None,
+                     max_expression_bytes=None, shards=None):
+        """
+        Start caching normalization results in memory.
+        
+        normalize() looks whole texts up first; on a miss, every detected
+        expression is looked up by ``(category, matched text)`` before it is
+        verbalized. Only texts without failures are cached, so every error
+        policy sees its failures; texts served from the cache are counted in
+        ``stats`` as cache hits. Pass 0 entries to disable a level. Options
+        left out take the defaults of verbalizer.cache.
+        
+        Args:
+            max_texts (int, optional): Whole-text cache entries
+            max_text_bytes (int, optional): Whole-text cache size, in approximate bytes
+            max_expressions (int, optional): Expression cache entries
+            max_expression_bytes (int, optional): Expression cache size, in approximate bytes
+            shards (int, optional): Independently locked shards per level; the
+                default is 1 with the GIL and 16 on free-threaded builds
+            
+        Returns:
+            NormalizerCache: The caches, with hit-rate counters
+        """
+        from .cache import NormalizerCache
+        
+        self.cache = NormalizerCache(**_given(
+            max_texts=max_texts, max_text_bytes=max_text_bytes,
+            max_expressions=max_expressions, max_expression_bytes=max_expression_bytes,
+            shards=shards,
+        ))
+        self._bind_verbalizers()
+        return self.cache
+    
+    def disable_cache(self):
+        """
+        Stop caching and drop the cached results.
+        
+        Returns:
+            NormalizerCache or None: The caches, with their final counters
+        """
+        cache, self.cache = self.cache, None
+        self._bind_verbalizers()
+        if cache is not None:
+            cache.clear()
+        return cache
+    
+    def fingerprint(self):
+        """
+        Hash everything that determines this normalizer's output.
+        
+        Covers the class, its patterns, the instance settings reported by
+        :meth:`_output_settings` and the source and language packs of the
+        language package, where the language's word tables live.
+        
+        Returns:
+            str: Hex digest
+        """
+        import hashlib
+        
+        digest = hashlib.sha256()
+        cls = type(self)
+        digest.update(f"{cls.__module__}.{cls.__qualname__}\0".encode('utf-8'))
+        for category, pattern in sorted(self.patterns.items()):
+            digest.update(f"{category}\0{pattern.pattern}\0{pattern.flags}\0".encode('utf-8'))
+        for name, value in sorted(self._output_settings().items()):
+            digest.update(f"{name}\0{value!r}\0".encode('utf-8'))
+        module = sys.modules[cls.__module__]
+        if getattr(module, '__file__', None):
+            package = os.path.dirname(module.__file__)
+            for name in sorted(os.listdir(package)):
+                if name.endswith(('.py', '.json')):
+                    with open(os.path.join(package, name), 'rb') as f:
+                        digest.update(f.read())
+        return digest.hexdigest()
+    
+    def _output_settings(self):
+        """
+        Return the instance settings that can change the output.
+        
+        Languages with constructor options override this so that
+        :meth:`fingerprint` tells differently configured instances apart.
+        The error policy is left out: only results without failures are
+        cached, and those are the same under every policy.
+        
+        Returns:
+            dict: Setting name -> value with a stable ``repr``
+        """
+        return {}
+    
+    def enable_disk_cache(self, path, max_bytes=None, batch_size=None):
+        """
+        Persist normalization results in a SQLite database.
+        
+        The database can be shared by concurrent processes and later runs;
+        rerunning an unchanged corpus becomes mostly cache reads. Entries
+        are keyed on the language, the library version, :meth:`fingerprint`
+        and the text, and the language's entries from other versions or
+        configurations are dropped when the cache is opened.
+        
+        Args:
+            path (str): Database file
+            max_bytes (int, optional): Size cap of the database; the least
+                recently used entries are evicted beyond it (default:
+                verbalizer.disk_cache.DEFAULT_MAX_BYTES)
+            batch_size (int, optional): Results written per transaction
+                (default: verbalizer.disk_cache.DEFAULT_BATCH_SIZE)
+            
+        Returns:
+            DiskCache: The cache, with hit-rate counters
+        """
+        from . import __version__
+        from .disk_cache import DiskCache
+        
+        cls = type(self)
+        self.disk_cache = DiskCache(
+            path, f"{cls.__module__}.{cls.__qualname__}", f"{__version__}:{self.fingerprint()}",
+            **_given(max_bytes=max_bytes, batch_size=batch_size),
+        )
+        return self.disk_cache
+    
+    def disable_disk_cache(self):
+        """
+        Flush and detach the on-disk cache.
+        
+        Returns:
+            DiskCache or None: The cache, with its final counters
+        """
+        disk_cache, self.disk_cache = self.disk_cache, None
+        if disk_cache is not None:
+            disk_cache.close()
+        return disk_cache
+    
+    def warmup(self, texts=None):
+        """
+        Normalize representative texts ahead of real traffic.
+        
+        Fills the result caches when enabled, as well as the language's own
+        lookup tables, so the first requests after a deploy do not pay the
+        full cost. Failures are ignored, and texts with failures are not
+        cached.
+        
+        Args:
+            texts (iterable, optional): Texts to normalize (default: the
+                language's own, see :meth:`_get_warmup_texts`)
+            
+        Returns:
+            int: Number of texts normalized
+        """
+        if texts is None:
+            texts = self._get_warmup_texts()
+        count = 0
+        for text in texts:
+            self.normalize(text, errors='ignore')
+            count += 1
+        return count
+    
+    def configure_async(self, executor=None, inline_chars=None, max_concurrency=None,
+                        piece_chars=None):
+        """
+        Configure anormalize() and anormalize_batch().
+        
+        Args:
+            executor (concurrent.futures.Executor, optional): Executor for long
+                inputs (default: the event loop's default executor)
+            inline_chars (int, optional): Inputs up to this many characters
+                are normalized directly on the event loop (default:
+                verbalizer.aio.DEFAULT_INLINE_CHARS)
+            max_concurrency (int, optional): Long inputs processed at the same
+                time (default: CPU count)
+            piece_chars (int, optional): Characters per executor job for long
+                inputs (default: verbalizer.aio.DEFAULT_PIECE_CHARS)
+        """
+        from .aio import AsyncRunner
+        
+        self._async = AsyncRunner(
+            self, executor=executor, max_concurrency=max_concurrency,
+            **_given(inline_chars=inline_chars, piece_chars=piece_chars),
+        )
+    
+    async def anormalize(self, text, errors=None):
+        """
+        Normalize text from a coroutine without blocking the event loop.
+        
+        Long inputs are normalized piece by piece in an executor; cancelling
+        the call stops after the current piece.
+        
+        Args:
+            text (str): Input text
+            errors (str, optional): Error policy for this call
+            
+        Returns:
+            Same as normalize()
+        """
+        if self._async is None:
+            self.configure_async()
+        return await self._async.normalize(text, errors)
+    
+    async def anormalize_batch(self, texts, errors=None):
+        """
+        Normalize many texts from a coroutine.
+        
+        Args:
+            texts (iterable): Input texts
+            errors (str, optional): Error policy for this call
+            
+        Returns:
+            list: Results in input order
+        """
+        if self._async is None:
+            self.configure_async()
+        return await self._async.normalize_batch(texts, errors)
@@ -0,0 +1,253 @@
+"""
+Batch normalization over thread and process pools.
+
+Work is split into chunks of consecutive texts with a roughly equal number
+of characters, so that a few long documents do not end up in one task while
+other workers sit idle. Each worker builds its normalizer once.
+
+:func:`run_batches` streams encoded records from a file through a process
+pool instead, for the ``verbalize`` command and manifest normalization.
+"""
+
+import os
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import copy_context
+
+
+EXECUTORS = ('process', 'thread', 'serial')
+
+# Bounds for the automatic chunk size, in characters
+MIN_CHUNK_CHARS = 16 * 1024
+MAX_CHUNK_CHARS = 4 * 1024 * 1024
+
+# Chunks per worker when the chunk size is chosen automatically
+CHUNKS_PER_WORKER = 4
+
+# Normalizer owned by the current worker process
+_worker_normalizer = None
+
+# Record normalizer owned by the current worker process
+_worker_records = None
+
+
+class RecordError(ValueError):
+    """
+    A record that stops a :func:`run_batches` run.
+
+    Attributes:
+        line (int): One-based line number in the input, once known
+        output (list): The normalized lines of its batch before it, once
+            known; they are written out before the run stops
+    """
+
+    line = None
+    output = ()
+
+
+def _init_worker(normalizer):
+    """Install the normalizer for this worker process."""
+    global _worker_normalizer
+    _worker_normalizer = normalizer
+
+
+def _normalize_chunk(chunk):
+    """Normalize a chunk of texts with the worker's normalizer."""
+    normalize = _worker_normalizer.normalize
+    return [normalize(text) for text in chunk]
+
+
+def chunk_by_chars(texts, chunk_chars):
+    """
+    Split texts into consecutive chunks of about ``chunk_chars`` characters.
+
+    A text longer than ``chunk_chars`` gets a chunk of its own.
+
+    Args:
+        texts (list): Input texts
+        chunk_chars (int): Target number of characters per chunk
+
+    Returns:
+        list: Lists of texts, in input order
+    """
+    chunks = []
+    chunk = []
+    size = 0
+    for text in texts:
+        if chunk and size + len(text) > chunk_chars:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+        chunk.append(text)
+        size += len(text)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def auto_chunk_chars(total_chars, workers):
+    """
+    Choose a chunk size for ``total_chars`` characters spread over ``workers``.
+
+    Args:
+        total_chars (int): Characters in the whole batch
+        workers (int): Number of workers
+
+    Returns:
+        int: Target characters per chunk
+    """
+    target = total_chars // (workers * CHUNKS_PER_WORKER) + 1
+    return max(MIN_CHUNK_CHARS, min(MAX_CHUNK_CHARS, target))
+
+
+def normalize_batch(normalizer, texts, workers=None, executor='process', chunksize=None):
+    """
+    Normalize many texts, optionally in parallel.
+
+    Args:
+        normalizer: A BaseNormalizer instance; process workers receive a copy
+        texts (iterable): Input texts
+        workers (int, optional): Number of workers (default: CPU count)
+        executor (str): 'process', 'thread' or 'serial'
+        chunksize (int, optional): Target characters per task (default:
+            chosen from the total size of the batch)
+
+    Returns:
+        list: Normalized texts, in input order
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}'. Expected one of {EXECUTORS}")
+
+    texts = list(texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    if chunksize is None:
+        chunksize = auto_chunk_chars(sum(map(len, texts)), workers)
+    chunks = chunk_by_chars(texts, chunksize)
+
+    if executor == 'serial' or workers == 1 or len(chunks) <= 1:
+        return [normalizer.normalize(text) for text in texts]
+
+    # Imported here: concurrent.futures pulls in multiprocessing, which
+    # serial use and plain ``import verbalizer`` do not need
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    workers = min(workers, len(chunks))
+    if executor == 'thread':
+        # Normalizers hold no per-call state, so threads share this one
+        def normalize_chunk(chunk):
+            return [normalizer.normalize(text) for text in chunk]
+
+        # Each chunk runs in a copy of the caller's context, so an open
+        # ``collect_stats`` block records the workers' passes too
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(copy_context().run, normalize_chunk, chunk) for chunk in chunks]
+            results = (future.result() for future in futures)
+            return [text for chunk in results for text in chunk]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(normalizer,)
+    ) as pool:
+        results = pool.map(_normalize_chunk, chunks)
+        return [text for chunk in results for text in chunk]
+
+
+def _init_record_worker(records):
+    """Install the record normalizer for this worker process."""
+    global _worker_records
+    _worker_records = records
+
+
+def _normalize_lines(lines):
+    """Normalize a batch of lines with the worker's record normalizer."""
+    return _worker_records.normalize_lines(lines)
+
+
+def run_batches(records, batches, out, workers=1, ordered=True):
+    """
+    Normalize batches of lines or manifest records and write them to ``out``.
+
+    At most a few batches per worker are in flight at a time, so memory use
+    does not grow with the size of the input.
+
+    Args:
+        records: Record normalizer with a ``normalize_lines`` method, e.g.
+            cli.RecordNormalizer or manifest.ManifestNormalizer
+        batches (iterable): Batches of encoded lines
+        out: Binary file object
+        workers (int): Number of worker processes; 1 runs inline
+        ordered (bool): Keep the input order; otherwise write batches as
+            soon as they are done
+
+    Returns:
+        Counter: Matches per category
+
+    Raises:
+        RecordError: With ``line`` counted from the start of the input, if
+            the record normalizer raised one; when ordered, everything
+            before that line has been written
+    """
+    counts = Counter()
+
+    if workers <= 1:
+        first = 0
+        for batch in batches:
+            with _numbered_from(first, out):
+                lines, batch_counts = records.normalize_lines(batch)
+            out.writelines(lines)
+            counts.update(batch_counts)
+            first += len(batch)
+        return counts
+
+    def emit(future, first):
+        with _numbered_from(first, out):
+            lines, batch_counts = future.result()
+        out.writelines(lines)
+        counts.update(batch_counts)
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    window = workers * 2
+    first = 0
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_record_worker, initargs=(records,)
+    ) as pool:
+        if ordered:
+            pending = deque()
+            for batch in batches:
+                pending.append((pool.submit(_normalize_lines, batch), first))
+                first += len(batch)
+                if len(pending) >= window:
+                    emit(*pending.popleft())
+            while pending:
+                emit(*pending.popleft())
+        else:
+            pending = {}
+            for batch in batches:
+                pending[pool.submit(_normalize_lines, batch)] = first
+                first += len(batch)
+                if len(pending) >= window:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        emit(future, pending.pop(future))
+            for future, first in pending.items():
+                emit(future, first)
+
+    return counts
+
+
+@contextmanager
+def _numbered_from(first, out):
+    """
+    Count the line of a RecordError raised inside from ``first`` lines
+    before the batch, and write the lines of the batch before it to ``out``.
+    """
+    try:
+        yield
+    except RecordError as error:
+        error.line += first
+        out.writelines(error.output)
+        raise
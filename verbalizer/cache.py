@@ -0,0 +1,349 @@
+"""
+Bounded in-memory result caches.
+
+Normalization traffic is repetitive: the same prompts, prices and times come
+up again and again. A NormalizerCache holds two LRU caches:
+
+- ``texts``: whole input text -> ``(normalized text, match counts)``
+- ``expressions``: ``(category, matched text)`` -> verbalized expression
+
+Each is bounded both in entries and in approximate bytes, and counts its
+hits, misses and evictions.
+
+Both are safe to share between threads. With the GIL, single OrderedDict
+operations are atomic, so lookups take no lock and only insertions do. On
+free-threaded builds lookups run truly in parallel and have to lock too, so
+each level is split into independently locked shards.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_MAX_TEXTS = 10000
+DEFAULT_MAX_TEXT_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_EXPRESSIONS = 100000
+DEFAULT_MAX_EXPRESSION_BYTES = 16 * 1024 * 1024
+
+# True on free-threaded CPython builds running without the GIL
+FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+# Shards per cache level; one keeps an exact LRU order
+DEFAULT_SHARDS = 16 if FREE_THREADED else 1
+
+
+def _sizeof(key, value):
+    """Approximate memory held by one entry, in bytes."""
+    if isinstance(key, tuple):
+        # (category, text): the category string is shared with the patterns
+        key = key[1]
+    if isinstance(value, tuple):
+        # (text, match counts): the counts are a few small pairs
+        value = value[0]
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache bounded in entries and bytes.
+
+    Values larger than ``max_bytes`` on their own are never stored.
+
+    Args:
+        max_entries (int): Largest number of entries
+        max_bytes (int): Largest approximate size of keys and values, in bytes
+        locked (bool): Take the lock for lookups too, which keeps the
+            counters exact; needed without the GIL (default: FREE_THREADED)
+
+    Attributes:
+        hits (int): Lookups that found an entry
+        misses (int): Lookups that did not
+        evictions (int): Entries dropped to stay within the limits
+        bytes (int): Approximate size of the current entries
+    """
+
+    def __init__(self, max_entries, max_bytes, locked=FREE_THREADED):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.locked = locked
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __reduce__(self):
+        # Worker processes get an empty cache with the same limits
+        return (type(self), (self.max_entries, self.max_bytes, self.locked))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key):
+        """
+        Look up a key and mark it as recently used.
+
+        Unless the cache is ``locked``, the hit and miss counters are
+        approximate under concurrent use.
+
+        Returns:
+            The cached value, or None
+        """
+        if self.locked:
+            with self._lock:
+                value = self._data.get(key)
+                if value is None:
+                    self.misses += 1
+                    return None
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+        # Lock-free: single dict operations are atomic, and an entry evicted
+        # between the lookup and the reordering is simply not reordered
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries as needed."""
+        size = _sizeof(key, value)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            data = self._data
+            old = data.pop(key, None)
+            if old is not None:
+                self.bytes -= _sizeof(key, old)
+            data[key] = value
+            self.bytes += size
+            while len(data) > self.max_entries or self.bytes > self.max_bytes:
+                old_key, old_value = data.popitem(last=False)
+                self.bytes -= _sizeof(old_key, old_value)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries; the counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups that were hits (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self):
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: ``entries``, ``bytes``, ``max_entries``, ``max_bytes``,
+            ``hits``, ``misses``, ``evictions`` and ``hit_rate``
+        """
+        return {
+            'entries': len(self._data),
+            'bytes': self.bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }
+
+    def __repr__(self):
+        return f"LRUCache({self.info()!r})"
+
+
+class ShardedLRUCache:
+    """
+    LRU cache split by key hash into independently locked shards.
+
+    Threads looking up different keys mostly take different locks, which
+    keeps lookups scaling on free-threaded builds. Each shard gets an equal
+    part of the limits and evicts on its own, so the order is only
+    approximately least-recently-used overall. Has the interface of LRUCache.
+
+    Args:
+        max_entries (int): Largest number of entries
+        max_bytes (int): Largest approximate size of keys and values, in bytes
+        shards (int): Number of shards; fewer are used for tiny caches
+        locked (bool): Lock lookups too (see LRUCache)
+    """
+
+    def __init__(self, max_entries, max_bytes, shards=DEFAULT_SHARDS, locked=FREE_THREADED):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.locked = locked
+        count = max(1, min(shards, max_entries))
+        self._shards = tuple(
+            LRUCache(-(-max_entries // count), max_bytes // count, locked)
+            for _ in range(count)
+        )
+
+    def __reduce__(self):
+        return (type(self), (self.max_entries, self.max_bytes, len(self._shards), self.locked))
+
+    def _shard(self, key):
+        return self._shards[hash(key) % len(self._shards)]
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, key):
+        return key in self._shard(key)
+
+    def get(self, key):
+        """
+        Look up a key and mark it as recently used.
+
+        Returns:
+            The cached value, or None
+        """
+        return self._shard(key).get(key)
+
+    def put(self, key, value):
+        """Store a value, evicting the shard's least recently used entries as needed."""
+        self._shard(key).put(key, value)
+
+    def clear(self):
+        """Drop all entries; the counters are kept."""
+        for shard in self._shards:
+            shard.clear()
+
+    @property
+    def bytes(self):
+        return sum(shard.bytes for shard in self._shards)
+
+    @property
+    def hits(self):
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self):
+        return sum(shard.misses for shard in self._shards)
+
+    @property
+    def evictions(self):
+        return sum(shard.evictions for shard in self._shards)
+
+    hit_rate = LRUCache.hit_rate
+
+    def info(self):
+        """
+        Return the cache counters, summed over the shards.
+
+        Returns:
+            dict: As LRUCache.info, plus ``shards``
+        """
+        return {
+            'entries': len(self),
+            'bytes': self.bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+            'shards': len(self._shards),
+        }
+
+    def __repr__(self):
+        return f"ShardedLRUCache({self.info()!r})"
+
+
+def make_lru_cache(max_entries, max_bytes, shards=DEFAULT_SHARDS):
+    """
+    Return an LRUCache, or a ShardedLRUCache for more than one shard.
+
+    Args:
+        max_entries (int): Largest number of entries
+        max_bytes (int): Largest approximate size, in bytes
+        shards (int): Number of shards
+
+    Returns:
+        LRUCache or ShardedLRUCache: The cache
+    """
+    if shards > 1 and max_entries > 1:
+        return ShardedLRUCache(max_entries, max_bytes, shards)
+    return LRUCache(max_entries, max_bytes)
+
+
+class NormalizerCache:
+    """
+    Whole-text and expression-level caches for one normalizer.
+
+    A limit of 0 entries disables that level.
+
+    Args:
+        max_texts (int): Whole-text cache entries
+        max_text_bytes (int): Whole-text cache size, in bytes
+        max_expressions (int): Expression cache entries
+        max_expression_bytes (int): Expression cache size, in bytes
+        shards (int): Shards per level (see ShardedLRUCache); 1 keeps an
+            exact LRU order
+    """
+
+    def __init__(self, max_texts=DEFAULT_MAX_TEXTS, max_text_bytes=DEFAULT_MAX_TEXT_BYTES,
+                 max_expressions=DEFAULT_MAX_EXPRESSIONS,
+                 max_expression_bytes=DEFAULT_MAX_EXPRESSION_BYTES, shards=DEFAULT_SHARDS):
+        self.texts = make_lru_cache(max_texts, max_text_bytes, shards)
+        self.expressions = make_lru_cache(max_expressions, max_expression_bytes, shards)
+
+    def wrap(self, verbalize_match):
+        """
+        Put the expression cache in front of a ``verbalize_match(category, match)``.
+
+        Only successful verbalizations are cached, so failures are reported
+        under the caller's error policy every time.
+
+        Args:
+            verbalize_match (callable): Uncached verbalization
+
+        Returns:
+            callable: Cached verbalization with the same signature
+        """
+        if self.expressions.max_entries <= 0:
+            return verbalize_match
+        get = self.expressions.get
+        put = self.expressions.put
+
+        def cached(category, match):
+            key = (category, match.group())
+            result = get(key)
+            if result is None:
+                result = verbalize_match(category, match)
+                put(key, result)
+            return result
+
+        return cached
+
+    def clear(self):
+        """Drop all entries from both levels."""
+        self.texts.clear()
+        self.expressions.clear()
+
+    def info(self):
+        """
+        Return the counters of both levels.
+
+        Returns:
+            dict: ``{'texts': {...}, 'expressions': {...}}``, see LRUCache.info
+        """
+        return {'texts': self.texts.info(), 'expressions': self.expressions.info()}
+
+    def __repr__(self):
+        return f"NormalizerCache({self.info()!r})"
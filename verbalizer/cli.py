@@ -0,0 +1,269 @@
+"""
+Command-line corpus normalizer.
+
+Reads plain text, JSONL, TSV or CSV from files or stdin, normalizes one
+record at a time and writes the result to a file or stdout, optionally across
+several worker processes. A throughput report is printed to stderr.
+
+Usage:
+    verbalize corpus.txt -o corpus.norm.txt --workers 8
+    verbalize --format jsonl --field text < data.jsonl > data.norm.jsonl
+    verbalize --format tsv --column 2 manifest.tsv
+    verbalize --format csv --header --column transcript --keep-original train.csv
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from .batch import RecordError, run_batches
+from .manifest import DIALECTS, normalize_manifest
+from .registry import available_languages, get_verbalizer_class
+
+
+FORMATS = ('text', 'jsonl') + tuple(DIALECTS)
+
+
+class MalformedRecord(RecordError):
+    """A line that is not valid UTF-8, or a JSONL line that is not a JSON object."""
+
+
+class RecordNormalizer:
+    """
+    Normalize plain text lines or the text field of JSONL records, and
+    count matches.
+
+    A line that is not valid UTF-8, or a JSONL line that is not a JSON
+    object, is copied through unchanged under the normalizer's 'ignore'
+    policy and raises MalformedRecord otherwise.
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        fmt (str): 'text' or 'jsonl'
+        field (str): JSON field to normalize
+    """
+
+    def __init__(self, normalizer, fmt='text', field='text'):
+        self.normalizer = normalizer
+        self.fmt = fmt
+        self.field = field
+
+    def normalize_line(self, line):
+        """
+        Normalize one encoded line.
+
+        Args:
+            line (bytes): Input line, including its line ending
+
+        Returns:
+            bytes: Output line with the same line ending
+
+        Raises:
+            MalformedRecord: For a line that is not valid UTF-8 or a JSONL
+                line that is not a JSON object, unless the policy is 'ignore'
+        """
+        try:
+            text = line.decode('utf-8')
+        except UnicodeDecodeError as error:
+            if self.normalizer.errors == 'ignore':
+                return line
+            raise MalformedRecord(f"invalid UTF-8: {error}") from None
+        body = text.rstrip('\r\n')
+        ending = text[len(body):]
+
+        if self.fmt == 'jsonl':
+            if body.strip():
+                try:
+                    record = json.loads(body)
+                    if not isinstance(record, dict):
+                        raise ValueError(f"expected a JSON object, got {type(record).__name__}")
+                except ValueError as error:
+                    if self.normalizer.errors == 'ignore':
+                        return line
+                    raise MalformedRecord(f"invalid JSONL record: {error}") from None
+                value = record.get(self.field)
+                if isinstance(value, str):
+                    record[self.field] = self.normalizer.normalize(value)
+                body = json.dumps(record, ensure_ascii=False)
+        else:
+            body = self.normalizer.normalize(body)
+
+        return (body + ending).encode('utf-8')
+
+    def normalize_lines(self, lines):
+        """
+        Normalize a batch of encoded lines.
+
+        Returns:
+            tuple: ``(output lines, Counter of matches per category)``
+
+        Raises:
+            MalformedRecord: With ``line`` set to the index in ``lines``
+                plus one and ``output`` to the lines normalized before it
+        """
+        with self.normalizer.collect_stats() as stats:
+            output = []
+            for index, line in enumerate(lines):
+                try:
+                    output.append(self.normalize_line(line))
+                except MalformedRecord as error:
+                    error.line = index + 1
+                    error.output = output
+                    raise
+        return output, stats.matches
+
+
+def iter_batches(stream, batch_lines, stats):
+    """
+    Read encoded lines from ``stream`` in batches.
+
+    Args:
+        stream: Binary file object
+        batch_lines (int): Lines per batch
+        stats (dict): Updated with the number of lines and bytes read
+    """
+    batch = []
+    for line in stream:
+        stats['lines'] += 1
+        stats['bytes'] += len(line)
+        batch.append(line)
+        if len(batch) >= batch_lines:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def format_report(stats, counts, elapsed):
+    """
+    Format the throughput report.
+
+    Args:
+        stats (dict): Lines and bytes read
+        counts (Counter): Matches per category
+        elapsed (float): Wall time in seconds
+
+    Returns:
+        str: Report text
+    """
+    elapsed = max(elapsed, 1e-9)
+    megabytes = stats['bytes'] / 1e6
+    lines = [
+        f"lines: {stats['lines']} ({stats['lines'] / elapsed:.1f} lines/s)",
+        f"input: {megabytes:.2f} MB ({megabytes / elapsed:.2f} MB/s)",
+        f"elapsed: {elapsed:.2f} s",
+        "matches: " + ", ".join(
+            f"{category}={counts.get(category, 0)}"
+            for category in ('currency', 'date', 'time', 'number')
+        ),
+    ]
+    return "\n".join(lines)
+
+
+def build_parser():
+    """Build the argument parser for the ``verbalize`` command."""
+    parser = argparse.ArgumentParser(
+        prog='verbalize',
+        description='Normalize a text corpus for speech applications.',
+    )
+    parser.add_argument('input', nargs='?', default='-',
+                        help="input file (default: stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file (default: stdout)")
+    parser.add_argument('-l', '--language', default='sw', choices=available_languages(),
+                        help="language of the corpus (default: sw)")
+    parser.add_argument('-f', '--format', default='text', choices=FORMATS,
+                        help="input format (default: text)")
+    parser.add_argument('--field', default='text',
+                        help="JSONL field to normalize (default: text)")
+    parser.add_argument('--column', action='append',
+                        help="TSV/CSV column to normalize, as a zero-based index or, with "
+                             "--header, a name; repeat for several columns (default: 0)")
+    parser.add_argument('--header', action='store_true',
+                        help="the first TSV/CSV record is a header and is copied through")
+    parser.add_argument('--keep-original', action='store_true',
+                        help="append the original text of normalized TSV/CSV columns")
+    parser.add_argument('--delimiter',
+                        help="TSV/CSV field delimiter (default: tab for tsv, comma for csv)")
+    parser.add_argument('--quotechar',
+                        help="TSV/CSV quote character, '' for none (default: none for tsv, "
+                             "'\"' for csv)")
+    parser.add_argument('--errors', default='warn', choices=('ignore', 'warn', 'raise'),
+                        help="what to do with expressions that cannot be verbalized (default: warn)")
+    parser.add_argument('--cache-db', metavar='PATH',
+                        help="persist results in this SQLite database and reuse them across runs")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="worker processes (default: 1)")
+    parser.add_argument('--batch-lines', type=int, default=1000,
+                        help="lines or records sent to a worker at a time (default: 1000)")
+    order = parser.add_mutually_exclusive_group()
+    order.add_argument('--ordered', dest='ordered', action='store_true', default=True,
+                       help="keep the input order (default)")
+    order.add_argument('--unordered', dest='ordered', action='store_false',
+                       help="write batches as soon as they are done")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="do not print the throughput report")
+    return parser
+
+
+def main(argv=None):
+    """
+    Entry point for the ``verbalize`` command.
+
+    Args:
+        argv (list, optional): Arguments (default: sys.argv[1:])
+
+    Returns:
+        int: Exit status
+    """
+    args = build_parser().parse_args(argv)
+    if args.workers < 1:
+        raise SystemExit("verbalize: --workers must be at least 1")
+    if args.batch_lines < 1:
+        raise SystemExit("verbalize: --batch-lines must be at least 1")
+
+    normalizer = get_verbalizer_class(args.language)(errors=args.errors)
+    if args.cache_db:
+        normalizer.enable_disk_cache(args.cache_db)
+    src = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    dst = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+
+    stats = {'lines': 0, 'bytes': 0}
+    start = time.perf_counter()
+    try:
+        if args.format in DIALECTS:
+            try:
+                stats = normalize_manifest(
+                    normalizer, src, dst, args.column or [0], dialect=args.format,
+                    delimiter=args.delimiter, quotechar=args.quotechar, header=args.header,
+                    keep_original=args.keep_original, workers=args.workers,
+                    batch_rows=args.batch_lines, ordered=args.ordered,
+                )
+            except ValueError as error:
+                raise SystemExit(f"verbalize: {error}")
+            counts = stats['matches']
+        else:
+            records = RecordNormalizer(normalizer, args.format, args.field)
+            try:
+                counts = run_batches(records, iter_batches(src, args.batch_lines, stats), dst,
+                                     workers=args.workers, ordered=args.ordered)
+            except MalformedRecord as error:
+                raise SystemExit(f"verbalize: line {error.line}: {error}")
+    finally:
+        dst.flush()
+        if normalizer.disk_cache is not None:
+            normalizer.disable_disk_cache()
+        if src is not sys.stdin.buffer:
+            src.close()
+        if dst is not sys.stdout.buffer:
+            dst.close()
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        print(format_report(stats, counts, elapsed), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
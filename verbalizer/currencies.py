@@ -0,0 +1,143 @@
+"""
+Currency codes and the regexes that detect them.
+
+A language pack names the currencies it has words for, with their symbols
+and local forms (``KSh``, ``₦``, ``$``), and may also ask for every code of
+a code table such as ISO 4217. Hundreds of forms in a plain alternation
+``KES|TZS|...`` make the regex engine try each of them in turn wherever a
+word starts. :func:`trie_regex` instead merges the forms into a prefix tree,
+so at most one branch per character is followed and detection cost stays
+flat as the table grows; :func:`currency_regex` adds the word boundaries for
+prefix (``KES 500``, ``$5``) and suffix (``500 KES``, ``5€``) position.
+
+Which currency a detected form stands for is then one lookup in the pack's
+``currency_index`` (form -> code).
+"""
+
+import re
+from itertools import product
+
+
+# Active ISO 4217 codes, including funds and precious metals
+ISO_4217 = (
+    'AED', 'AFN', 'ALL', 'AMD', 'AOA', 'ARS', 'AUD', 'AWG', 'AZN', 'BAM', 'BBD', 'BDT',
+    'BGN', 'BHD', 'BIF', 'BMD', 'BND', 'BOB', 'BOV', 'BRL', 'BSD', 'BTN', 'BWP', 'BYN',
+    'BZD', 'CAD', 'CDF', 'CHE', 'CHF', 'CHW', 'CLF', 'CLP', 'CNY', 'COP', 'COU', 'CRC',
+    'CUP', 'CVE', 'CZK', 'DJF', 'DKK', 'DOP', 'DZD', 'EGP', 'ERN', 'ETB', 'EUR', 'FJD',
+    'FKP', 'GBP', 'GEL', 'GHS', 'GIP', 'GMD', 'GNF', 'GTQ', 'GYD', 'HKD', 'HNL', 'HTG',
+    'HUF', 'IDR', 'ILS', 'INR', 'IQD', 'IRR', 'ISK', 'JMD', 'JOD', 'JPY', 'KES', 'KGS',
+    'KHR', 'KMF', 'KPW', 'KRW', 'KWD', 'KYD', 'KZT', 'LAK', 'LBP', 'LKR', 'LRD', 'LSL',
+    'LYD', 'MAD', 'MDL', 'MGA', 'MKD', 'MMK', 'MNT', 'MOP', 'MRU', 'MUR', 'MVR', 'MWK',
+    'MXN', 'MXV', 'MYR', 'MZN', 'NAD', 'NGN', 'NIO', 'NOK', 'NPR', 'NZD', 'OMR', 'PAB',
+    'PEN', 'PGK', 'PHP', 'PKR', 'PLN', 'PYG', 'QAR', 'RON', 'RSD', 'RUB', 'RWF', 'SAR',
+    'SBD', 'SCR', 'SDG', 'SEK', 'SGD', 'SHP', 'SLE', 'SOS', 'SRD', 'SSP', 'STN', 'SVC',
+    'SYP', 'SZL', 'THB', 'TJS', 'TMT', 'TND', 'TOP', 'TRY', 'TTD', 'TWD', 'TZS', 'UAH',
+    'UGX', 'USD', 'USN', 'UYI', 'UYU', 'UYW', 'UZS', 'VED', 'VES', 'VND', 'VUV', 'WST',
+    'XAF', 'XAG', 'XAU', 'XBA', 'XBB', 'XBC', 'XBD', 'XCD', 'XCG', 'XDR', 'XOF', 'XPD',
+    'XPF', 'XPT', 'XSU', 'XTS', 'XUA', 'XXX', 'YER', 'ZAR', 'ZMW', 'ZWG',
+)
+
+# Code tables a pack can ask for by name
+CODE_TABLES = {
+    'iso4217': ISO_4217,
+}
+
+_WORD_CHAR = re.compile(r'\w')
+
+
+def trie_regex(forms):
+    """
+    Build a regex matching any of the forms, factored as a prefix tree.
+
+    ``['KES', 'KSh', 'KShs']`` gives ``K(?:ES|Shs?)``. Longer forms are
+    tried first, like a longest-first alternation.
+
+    Args:
+        forms (iterable): Strings to match literally
+
+    Returns:
+        str: Regex source, or '' if there are no forms
+    """
+    trie = {}
+    for form in forms:
+        if not form:
+            continue
+        node = trie
+        for char in form:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return _node_regex(trie)[0]
+
+
+def _node_regex(node):
+    """Return ``(regex, atomic)`` for the forms below a trie node."""
+    branches = []
+    chars = []
+    for char in sorted(key for key in node if key):
+        child = node[char]
+        if list(child) == ['']:
+            # Forms ending here share one character class
+            chars.append(char)
+        else:
+            branches.append((re.escape(char) + _node_regex(child)[0], False))
+    if len(chars) == 1:
+        branches.append((re.escape(chars[0]), True))
+    elif chars:
+        branches.append((f"[{''.join(re.escape(char) for char in chars)}]", True))
+
+    if not branches:
+        return '', True
+    if len(branches) == 1:
+        regex, atomic = branches[0]
+    else:
+        regex, atomic = f"(?:{'|'.join(regex for regex, _ in branches)})", True
+    if '' in node:
+        regex, atomic = (f"{regex}?" if atomic else f"(?:{regex})?"), True
+    return regex, atomic
+
+
+def currency_regex(codes, forms, side=None, any_case=False):
+    """
+    Build the alternation of a pack's currency forms.
+
+    Codes are matched in upper and in title case (``KES``, ``Kes``), or in
+    any case, by listing every spelling, which keeps the whole tree literal:
+    the pattern needs no IGNORECASE flag, under which the engine compares
+    characters much more slowly.
+
+    Args:
+        codes (iterable): Codes matched in upper and title case
+        forms (iterable): Symbols and other forms matched exactly
+        side (str, optional): 'prefix' for forms before the amount, which
+            need a boundary before them, or 'suffix' for forms after it,
+            which need one after; None adds no boundaries
+        any_case (bool): Match the codes in any case (``kes``, ``kES``)
+
+    Returns:
+        str: A non-capturing group
+    """
+    forms = set(forms).union(*(_case_variants(code, any_case) for code in codes))
+    if side is None:
+        return f"(?:{trie_regex(forms)})"
+
+    alternatives = []
+    for word in (True, False):
+        body = trie_regex(form for form in forms if _word_edge(form, side) == word)
+        if not body:
+            continue
+        # \b for an edge that is a word character, \B for a symbol
+        boundary = r'\b' if word else r'\B'
+        alternatives.append(f"{boundary}(?:{body})" if side == 'prefix' else f"(?:{body}){boundary}")
+    return f"(?:{'|'.join(alternatives)})"
+
+
+def _word_edge(form, side):
+    """Return True if the form starts ('prefix') or ends ('suffix') with a word character."""
+    return _WORD_CHAR.match(form[0] if side == 'prefix' else form[-1]) is not None
+
+
+def _case_variants(code, any_case=False):
+    """Return the upper and title case spellings of a code, or all of them."""
+    if any_case:
+        return {''.join(chars) for chars in product(*({char.lower(), char.upper()} for char in code))}
+    return {code.upper(), code.title()}
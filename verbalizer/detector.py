@@ -0,0 +1,646 @@
+"""
+Pattern detection utilities.
+
+The Detector finds every currency, date, time and number expression in a
+text in one left-to-right sweep and writes the output once, instead of
+running one regex substitution pass per category.
+
+The sweep is a single regex: the categories' patterns joined into one
+alternation with a named group each, in priority order. Its leftmost-first
+matches are what the categories applied one after another would find,
+unless a higher-priority expression starts inside an accepted one or two
+expressions of different categories touch, where a replacement can change
+what its neighbour matches. Texts where that happens are handed to an exact
+merge of one regex cursor per category.
+"""
+
+import re
+from functools import cached_property, lru_cache
+from itertools import chain
+
+from .spans import SpanList
+
+# The parser is only used to read the possible first characters of each
+# pattern for the combined pattern's guard (see _combine); without the guard
+# the single pass is no faster than the exact merge.
+try:
+    from re import _constants as sre
+    from re import _parser as sre_parse
+except ImportError:  # Python 3.10
+    import sre_constants as sre
+    import sre_parse
+
+
+# Categories in the order they claim text. A higher-priority match wins
+# over any overlapping lower-priority one, exactly as if each category had
+# been substituted over the whole text in this order.
+PRIORITY = ('currency', 'date', 'time', 'number')
+
+# Whitespace that no match contains and whose regex boundaries do not depend
+# on the other side, so text can be split after it and normalized piecewise
+# with the same result: a run between two non-digits, or between two digits
+# unless a time's trailing \s* could take it. Whitespace between a digit and
+# anything else can join an amount to its currency or a time to AM/PM.
+SAFE_BREAK = re.compile(r'(?<=[^\s\d])\s+(?=[^\s\d])|(?<=\d)(?<!:\d\d)\s+(?=\d)')
+
+_WORD_CHAR = re.compile(r'\w')
+
+# Flags that can be scoped to part of a pattern
+_SCOPED_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's', re.VERBOSE: 'x'}
+_SCOPED_MASK = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+
+# Character class escapes of the parser's categories
+_CLASS_CATEGORIES = {
+    sre.CATEGORY_DIGIT: r'\d', sre.CATEGORY_NOT_DIGIT: r'\D',
+    sre.CATEGORY_SPACE: r'\s', sre.CATEGORY_NOT_SPACE: r'\S',
+    sre.CATEGORY_WORD: r'\w', sre.CATEGORY_NOT_WORD: r'\W',
+}
+
+# Numbered or named backreferences, which a combined pattern would renumber
+_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+
+def _is_word(char):
+    """Return True if ``char`` counts as a word character for ``\\b``."""
+    return bool(char) and _WORD_CHAR.match(char) is not None
+
+
+class _Replay:
+    """A ``replace`` callback that reuses the replacements already made."""
+
+    __slots__ = ('_done', '_replace')
+
+    def __init__(self, spans, replace, failed=None):
+        self._done = {(category, start, end): replacement for start, end, category, replacement in spans}
+        if failed is not None:
+            self._done[failed] = None
+        self._replace = replace
+
+    def __call__(self, category, match):
+        key = (category, match.start(), match.end())
+        if key in self._done:
+            return self._done[key]
+        return self._replace(category, match)
+
+
+class _ShiftedMatch:
+    """A match on a local copy of the text, reporting offsets in the source."""
+
+    __slots__ = ('_match', '_shift')
+
+    def __init__(self, match, shift):
+        self._match = match
+        self._shift = shift
+
+    def start(self, group=0):
+        return self._match.start(group) + self._shift
+
+    def end(self, group=0):
+        return self._match.end(group) + self._shift
+
+    def span(self, group=0):
+        return self.start(group), self.end(group)
+
+    def __getitem__(self, group):
+        return self._match[group]
+
+    def __getattr__(self, name):
+        return getattr(self._match, name)
+
+
+# Positions where a match that cannot start inside a word may start
+_EDGE = re.compile(r'\b|\W')
+
+
+def _parse(pattern):
+    """Return the items of the parse tree of a compiled regex, or None."""
+    try:
+        return list(sre_parse.parse(pattern.pattern, pattern.flags))
+    except (re.error, TypeError, ValueError):
+        return None
+
+
+def _items_start_at_edge(items):
+    """
+    Return True if every match of a parsed sequence starts at a word
+    boundary or at a non-word character, i.e. never between two word
+    characters. False when in doubt.
+    """
+    for op, arg in items:
+        if op is sre.AT:
+            if arg in (sre.AT_BOUNDARY, sre.AT_BEGINNING_STRING):
+                return True
+            if arg is not sre.AT_NON_BOUNDARY:
+                return False
+        elif op in (sre.ASSERT, sre.ASSERT_NOT):
+            continue
+        elif op is sre.LITERAL:
+            return not _is_word(chr(arg))
+        elif op is sre.IN:
+            return all(item == sre.LITERAL and not _is_word(chr(value)) for item, value in arg)
+        elif op is sre.SUBPATTERN:
+            return _items_start_at_edge(list(arg[-1]))
+        elif op is sre.BRANCH:
+            return all(_items_start_at_edge(list(branch)) for branch in arg[1])
+        elif op in (sre.MAX_REPEAT, sre.MIN_REPEAT):
+            return arg[0] > 0 and _items_start_at_edge(list(arg[2]))
+        else:
+            return False
+    return False
+
+
+def _first_chars(items):
+    """
+    Return character class items covering the first character of every
+    match of a parsed sequence, or None if that cannot be told.
+    """
+    for op, arg in items:
+        if op is sre.AT or op in (sre.ASSERT, sre.ASSERT_NOT):
+            continue
+        if op is sre.LITERAL:
+            return {re.escape(chr(arg))}
+        if op is sre.IN:
+            chars = set()
+            for item, value in arg:
+                if item is sre.LITERAL:
+                    chars.add(re.escape(chr(value)))
+                elif item is sre.RANGE:
+                    chars.add(f'{re.escape(chr(value[0]))}-{re.escape(chr(value[1]))}')
+                elif item is sre.CATEGORY and value in _CLASS_CATEGORIES:
+                    chars.add(_CLASS_CATEGORIES[value])
+                else:
+                    return None
+            return chars
+        if op is sre.SUBPATTERN:
+            return _first_chars(list(arg[-1]))
+        if op is sre.BRANCH:
+            chars = set()
+            for branch in arg[1]:
+                first = _first_chars(list(branch))
+                if first is None:
+                    return None
+                chars |= first
+            return chars
+        if op in (sre.MAX_REPEAT, sre.MIN_REPEAT) and arg[0] > 0:
+            return _first_chars(list(arg[2]))
+        return None
+    return None
+
+
+@lru_cache(maxsize=None)
+def pattern_hints(pattern):
+    """
+    Analyze a pattern for the combined pattern of a Detector.
+
+    The result is plain data, so language packs can cache it with their
+    compiled tables and spare every process the parse.
+
+    Args:
+        pattern: Compiled regex
+
+    Returns:
+        tuple: ``(first_chars, starts_at_edge)``: the sorted character class
+        items every match starts with, or None if unknown, and whether every
+        match starts at a word boundary or at a non-word character
+    """
+    items = _parse(pattern)
+    if items is None:
+        return None, False
+    first = _first_chars(items)
+    return None if first is None else tuple(sorted(first)), _items_start_at_edge(items)
+
+
+def _combine(patterns, first_chars):
+    """
+    Join patterns into one alternation with a named group per pattern.
+
+    Args:
+        patterns (list): Compiled regexes, highest priority first
+        first_chars (list): Per pattern, the character class items its
+            matches can start with, or None if unknown (see :func:`_first_chars`)
+
+    Flags that differ between the patterns are scoped to their own group.
+    When the possible first characters of every pattern are known, the
+    alternation is guarded by a lookahead on them: the engine then rejects
+    most positions with one set test instead of trying each alternative.
+
+    Returns:
+        Compiled regex with groups ``_0``, ``_1``, ..., or None if the
+        patterns cannot be combined without changing what they match
+        (named groups, backreferences or incompatible flags)
+    """
+    if not patterns:
+        return None
+    common = patterns[0].flags
+    for pattern in patterns:
+        common &= pattern.flags
+    alternatives = []
+    first = set()
+    for level, (pattern, chars) in enumerate(zip(patterns, first_chars)):
+        if pattern.groupindex or _BACKREFERENCE.search(pattern.pattern):
+            return None
+        extra = pattern.flags & ~common
+        if extra & ~_SCOPED_MASK:
+            return None
+        letters = ''.join(letter for flag, letter in _SCOPED_FLAGS.items() if extra & flag)
+        source = f'(?{letters}:{pattern.pattern})' if letters else pattern.pattern
+        alternatives.append(f'(?P<_{level}>{source})')
+        if first is not None:
+            first = None if chars is None or extra & re.IGNORECASE else first | chars
+    combined = '|'.join(alternatives)
+    if first:
+        combined = f"(?=[{''.join(sorted(first))}])(?:{combined})"
+    try:
+        return re.compile(combined, common)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _plan(patterns, hints):
+    """
+    Build the combined pattern for patterns in priority order.
+
+    Cached, as every normalizer of a language shares its patterns and large
+    patterns take a while to compile.
+
+    Args:
+        patterns (tuple): Compiled regexes, highest priority first
+        hints (tuple): Their :func:`pattern_hints`
+
+    Returns:
+        tuple: ``(combined, levels, edges)``, or None if the patterns cannot
+        be combined. ``levels`` maps the combined pattern's group indexes to
+        levels; per level, ``edges`` tells whether the patterns above it can
+        only start at an edge, so that only the edges inside a match need
+        checking.
+    """
+    combined = _combine(patterns, [None if first is None else set(first) for first, _ in hints])
+    if combined is None:
+        return None
+    levels = [None] * (combined.groups + 1)
+    for name, index in combined.groupindex.items():
+        levels[index] = int(name[1:])
+    edges = tuple(all(edge for _, edge in hints[:level]) for level in range(len(patterns)))
+    return combined, tuple(levels), edges
+
+
+class Detector:
+    """
+    Prioritized single-pass scanner built from a language's patterns.
+
+    The common case is one combined regex (see the module docstring). The
+    exact path keeps one regex cursor per category over the source text;
+    the cursors advance together from left to right. A lower-priority
+    category only looks at the gaps left between accepted higher-priority
+    spans, and regex boundaries at the edges of those gaps are evaluated
+    against the replacement text, so the result is identical to applying
+    the categories one after another.
+    """
+
+    def __init__(self, patterns, priority=PRIORITY, safe_break=SAFE_BREAK, hints=None):
+        """
+        Build a detector.
+
+        Args:
+            patterns (dict): Mapping of category name to compiled regex
+            priority (tuple): Category names from highest to lowest priority.
+                Categories missing from ``patterns`` are skipped; categories
+                not listed are appended after the listed ones.
+            safe_break: Compiled regex for places where text may be split
+                without changing the result (see :meth:`last_break`)
+            hints (dict, optional): Mapping of category name to the
+                :func:`pattern_hints` of its pattern, e.g. cached by a
+                language pack; missing ones are computed on first use
+        """
+        order = [c for c in priority if c in patterns]
+        order += [c for c in patterns if c not in order]
+        self.order = tuple((category, patterns[category]) for category in order)
+        self.safe_break = safe_break
+        self.hints = hints or {}
+
+    @cached_property
+    def _compiled(self):
+        """The combined pattern, its levels and edges, built on first use; see :func:`_plan`."""
+        return _plan(
+            tuple(pattern for _, pattern in self.order),
+            tuple(self.hints.get(category) or pattern_hints(pattern) for category, pattern in self.order),
+        )
+
+    def last_break(self, text, window=4096):
+        """
+        Find the last offset where ``text`` can be split safely.
+
+        Normalizing ``text[:offset]`` and ``text[offset:]`` separately gives
+        the same result as normalizing ``text`` as a whole.
+
+        Args:
+            text (str): Input text
+            window (int): Size of the tail searched first
+
+        Returns:
+            int: Split offset, or 0 if there is none
+        """
+        start = max(0, len(text) - window)
+        while True:
+            offset = 0
+            for match in self.safe_break.finditer(text, start):
+                offset = match.end()
+            if offset or not start:
+                return offset
+            start = 0
+
+    def scan(self, text, replace):
+        """
+        Yield the accepted spans of ``text`` in order.
+
+        Args:
+            text (str): Input text
+            replace (callable): ``replace(category, match)`` returning the
+                replacement string, or None to leave the match untouched
+
+        Yields:
+            tuple: ``(start, end, category, replacement)`` in source offsets
+        """
+        if not self.order:
+            return iter(())
+        if self._compiled is not None:
+            return self._scan_combined(text, replace)
+        return self._scan_level(text, len(self.order) - 1, replace)
+
+    def _scan_combined(self, text, replace):
+        """
+        Find and verbalize the expressions of ``text`` with the combined pattern.
+
+        The exact path takes over, reusing the replacements already made,
+        wherever the combined pattern may have found something else:
+
+        - a higher-priority expression starts inside the one found, which
+          would have claimed that text first
+        - an expression is left untouched, so the categories below it see
+          its text
+        - an expression starts right where a higher-priority replacement
+          ends, and the replacement changes the word boundary there
+        - a higher-priority replacement follows an expression across
+          whitespace and changes what that expression matches
+
+        Returns:
+            iterator: Accepted spans, see :meth:`scan`
+        """
+        order = self.order
+        combined, levels, edges = self._compiled
+        last_level = len(order) - 1
+        spans = []
+        previous_level = last_level
+        previous_end = -1
+        for match in combined.finditer(text):
+            level = levels[match.lastindex]
+            start, end = match.span()
+            found = None
+            if level:
+                # A match of word characters has no edge inside
+                if end - start > 1 and not (edges[level] and text[start:end].isalnum()):
+                    if any(self._higher_at(text, pos, level) for pos in self._inner(text, start, end, edges[level])):
+                        return self._scan_level(text, last_level, _Replay(spans, replace))
+                if start == previous_end and previous_level < level \
+                        and _is_word(spans[-1][3][-1:]) != _is_word(text[start - 1]):
+                    if level != last_level:
+                        return self._scan_level(text, last_level, _Replay(spans, replace))
+                    found = self._rematch_after(text, start, end, spans[-1][3][-1:])
+                    if found is None:
+                        return self._scan_level(text, last_level, _Replay(spans, replace))
+                    if not found:
+                        continue
+                    start = found.start()
+            category, pattern = order[level]
+            replacement = replace(category, found or pattern.match(text, start))
+            if replacement is None:
+                if level == last_level:
+                    continue
+                return self._scan_level(text, last_level, _Replay(spans, replace, (category, start, end)))
+            if spans and level < previous_level and not text[previous_end:start].strip() \
+                    and not self._still_matches(text, spans, previous_level, start, replacement):
+                spans.append((start, end, category, replacement))
+                return self._scan_level(text, last_level, _Replay(spans, replace))
+            spans.append((start, end, category, replacement))
+            previous_level = level
+            previous_end = end
+        return iter(spans)
+
+    def _rematch_after(self, text, start, end, before):
+        """
+        Re-run the lowest-priority pattern right after a replacement.
+
+        Args:
+            text (str): Source text
+            start (int): Start of the combined pattern's match
+            end (int): Its end
+            before (str): Last character of the replacement before it
+
+        Returns:
+            The match to verbalize, which ends at ``end``, False if there is
+            none and the scan can go on after ``end``, or None if the exact
+            path must decide
+        """
+        pattern = self.order[-1][1]
+        local = before + text[start:]
+        found = pattern.match(local, len(before))
+        if found is not None:
+            # A replacement right after it would change its end as well
+            if found.end() != len(before) + end - start or self._higher_at(text, end, len(self.order) - 1):
+                return None
+            return _ShiftedMatch(found, start - len(before))
+        # The exact path searches again from the next character; a match
+        # found inside this one is taken as it is in the source
+        following = pattern.search(text, start + 1)
+        if following is None or following.start() >= end:
+            return False
+        if following.end() != end:
+            return None
+        return following
+
+    def _still_matches(self, text, spans, level, limit, after):
+        """
+        Check the last span against a replacement that follows it across whitespace.
+
+        Args:
+            text (str): Source text
+            spans (list): Spans accepted so far; the last is of ``level``
+            level (int): Level of the last span
+            limit (int): Start of the following replacement
+            after (str): The following replacement
+
+        Returns:
+            bool: True if the pattern still matches the same text once the
+            replacement is made
+        """
+        start, end = spans[-1][:2]
+        if len(spans) > 1 and spans[-2][1] == start:
+            before = spans[-2][3][-1:]
+        else:
+            before = text[start - 1:start]
+        found = self.order[level][1].match(before + text[start:limit] + after, len(before))
+        return found is not None and found.end() == len(before) + end - start
+
+    def _higher_at(self, text, pos, level):
+        """
+        Check whether a pattern above ``level`` matches at ``pos``.
+
+        The alternatives of the combined pattern are in priority order, so
+        the first one matching at ``pos`` is above ``level`` if any is.
+        """
+        found = self._compiled[0].match(text, pos)
+        return found is not None and self._compiled[1][found.lastindex] < level
+
+    @staticmethod
+    def _inner(text, start, end, edges_only):
+        """Yield the positions inside ``text[start:end]`` where a match may start."""
+        if not edges_only:
+            yield from range(start + 1, end)
+            return
+        edge = _EDGE.search(text, start + 1, end)
+        while edge is not None and edge.start() < end:
+            yield edge.start()
+            edge = _EDGE.search(text, edge.start() + 1, end)
+
+    def sub(self, text, replace):
+        """
+        Replace every accepted span of ``text`` in a single pass.
+
+        Args:
+            text (str): Input text
+            replace (callable): See :meth:`scan`
+
+        Returns:
+            str: Text with all spans replaced
+        """
+        pieces = []
+        last = 0
+        for start, end, _, replacement in self.scan(text, replace):
+            pieces.append(text[last:start])
+            pieces.append(replacement)
+            last = end
+        if not pieces:
+            return text
+        pieces.append(text[last:])
+        return ''.join(pieces)
+
+    def sub_with_spans(self, text, replace):
+        """
+        Replace every accepted span of ``text`` and record the alignment.
+
+        Args:
+            text (str): Input text
+            replace (callable): See :meth:`scan`
+
+        Returns:
+            tuple: ``(normalized text, SpanList)``
+        """
+        spans = SpanList(text, (category for category, _ in self.order))
+        pieces = []
+        last = 0
+        out_pos = 0
+        for start, end, category, replacement in self.scan(text, replace):
+            pieces.append(text[last:start])
+            pieces.append(replacement)
+            out_pos += start - last
+            spans.append(start, end, out_pos, out_pos + len(replacement), category)
+            out_pos += len(replacement)
+            last = end
+        pieces.append(text[last:])
+        return ''.join(pieces), spans
+
+    def _scan_level(self, text, level, replace):
+        """
+        Merge the spans of ``self.order[level]`` with all higher levels.
+
+        The text this level sees is the source with every higher-priority
+        span already replaced; matches are searched for in the source and
+        only re-checked against that view at the edges of a gap.
+        """
+        category, pattern = self.order[level]
+        if level:
+            higher = self._scan_level(text, level - 1, replace)
+        else:
+            higher = ()
+
+        pos = 0
+        # Character preceding ``pos`` in this level's view of the text, or
+        # None while it is the same as in the source.
+        context = None
+        matches = pattern.finditer(text)
+        match = next(matches, None)
+
+        for span in chain(higher, (None,)):
+            if span is None:
+                limit = len(text)
+            else:
+                limit = span[0]
+
+            while match is not None:
+                start = match.start()
+                if start >= limit:
+                    break
+                end = match.end()
+                found = match
+                # Only the edges of a gap can differ from the source: its
+                # start, and its end for a match that reaches it across
+                # whitespace (\s*, \b or a lookahead may look past the match)
+                near_end = span is not None and not text[end:limit].strip()
+                if end > limit or near_end or (start == pos and context is not None):
+                    before = context if start == pos and context is not None else text[start - 1:start]
+                    if end > limit or near_end or _is_word(before) != _is_word(text[start - 1:start]):
+                        after = span[3] if span is not None else ''
+                        found, end = self._rematch(pattern, text, start, limit, before, after)
+                        if found is None:
+                            matches = pattern.finditer(text, start + 1)
+                            match = next(matches, None)
+                            continue
+
+                # A single substitution pass keeps scanning its own input,
+                # so the boundary after this match is judged on the source.
+                replacement = replace(category, found)
+                if replacement is not None:
+                    yield (start, end, category, replacement)
+                pos = end
+                context = None
+                if end != match.end():
+                    matches = pattern.finditer(text, end)
+                match = next(matches, None)
+
+            if span is None:
+                break
+            yield span
+            pos = span[1]
+            context = span[3][-1:] or None
+            # Skip the matches swallowed by the span; only a match that
+            # straddles its end needs a fresh search.
+            while match is not None and match.end() <= pos:
+                match = next(matches, None)
+            if match is not None and match.start() < pos:
+                matches = pattern.finditer(text, pos)
+                match = next(matches, None)
+
+    @staticmethod
+    def _rematch(pattern, text, start, limit, before, after):
+        """
+        Re-run ``pattern`` at ``start`` against this level's view of the text.
+
+        Args:
+            pattern: Compiled regex
+            text (str): Source text
+            start (int): Source offset to match at
+            limit (int): Source offset where the next replaced span begins
+            before (str): Character preceding ``start`` in this view
+            after (str): Replacement text of the span at ``limit``
+
+        Returns:
+            tuple: ``(match, end)`` with ``end`` in source offsets, or
+            ``(None, -1)`` if nothing matches inside the gap
+        """
+        local = before + text[start:limit] + after
+        found = pattern.match(local, len(before))
+        if found is None or found.end() > len(local) - len(after):
+            return None, -1
+        shift = start - len(before)
+        return _ShiftedMatch(found, shift), found.end() + shift
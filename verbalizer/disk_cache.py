@@ -0,0 +1,388 @@
+"""
+Persistent normalization cache in a local SQLite database.
+
+Entries are keyed on a hash of (language, library version, configuration
+fingerprint, text), so one database can be shared by different languages and
+by every job and process that normalizes the same corpora. When the version
+or the language's patterns and tables change, the language's old entries are
+dropped the next time the cache is opened.
+
+Reads go straight to the database; writes are buffered and inserted in
+batches, one transaction per batch. The database runs in WAL mode, so many
+processes can read while one of them writes.
+"""
+
+import hashlib
+import os
+import threading
+import time
+import weakref
+
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Buffered entries written per transaction
+DEFAULT_BATCH_SIZE = 1000
+
+# Last-use times, in microseconds, are refreshed on read at most this often
+# so that rerunning a corpus stays read-only
+TOUCH_INTERVAL = 24 * 3600 * 1000000
+
+# Fraction of the size cap freed when the cap is exceeded
+EVICT_FRACTION = 0.1
+
+# Approximate storage per entry besides its value: key, row and index overhead
+ENTRY_OVERHEAD = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS namespaces (
+    id INTEGER PRIMARY KEY,
+    language TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (language, name)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,
+    namespace INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    used INTEGER NOT NULL,
+    matches TEXT NOT NULL DEFAULT ''
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+CREATE INDEX IF NOT EXISTS entries_namespace ON entries (namespace);
+"""
+
+# Serializes the per-process setup of caches first used by several threads
+# at once
+_setup_lock = threading.Lock()
+
+
+def _encode_matches(matches):
+    """Encode ``(category, count)`` pairs as ``category:count,...``."""
+    return ','.join(f"{category}:{count}" for category, count in matches)
+
+
+def _decode_matches(encoded):
+    """Decode the pairs written by :func:`_encode_matches`."""
+    if not encoded:
+        return ()
+    return tuple((category, int(count)) for category, _, count in
+                 (item.rpartition(':') for item in encoded.split(',')))
+
+
+def _flush_ref(ref):
+    """Flush a cache at process exit, if it is still alive."""
+    cache = ref()
+    if cache is not None:
+        cache.flush()
+
+
+class DiskCache:
+    """
+    SQLite-backed cache of normalized texts for one language configuration.
+
+    Instances can be pickled to worker processes; each process and thread
+    opens its own connection on first use. Buffered writes are flushed when
+    ``batch_size`` entries are pending, on :meth:`flush` or :meth:`close`,
+    and when the process exits.
+
+    Args:
+        path (str): Database file
+        language (str): Language identifier
+        namespace (str): Version and configuration of the language; entries
+            of the same language under any other namespace are deleted
+        max_bytes (int): Cap on the approximate size of the stored entries
+        batch_size (int): Buffered entries written per transaction
+    """
+
+    def __init__(self, path, language, namespace, max_bytes=DEFAULT_MAX_BYTES,
+                 batch_size=DEFAULT_BATCH_SIZE):
+        self.path = os.fspath(path)
+        self.language = language
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._prefix = f"{language}\0{namespace}\0".encode('utf-8')
+        self._pending = {}
+        self._touched = set()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._namespace_id = None
+        self._pid = None
+        self._finalizer = None
+
+    def __reduce__(self):
+        # Pending writes and connections stay with this process
+        return (type(self), (self.path, self.language, self.namespace,
+                             self.max_bytes, self.batch_size))
+
+    def _key(self, text):
+        return hashlib.blake2b(self._prefix + text.encode('utf-8', 'surrogatepass'),
+                               digest_size=16).digest()
+
+    def _setup(self):
+        """Start afresh on first use in this process, or in a forked copy."""
+        # sqlite3 and multiprocessing are imported on first use to keep
+        # ``import verbalizer`` light
+        from multiprocessing.util import Finalize
+
+        with _setup_lock:
+            pid = os.getpid()
+            if self._pid == pid:
+                return
+            self._local = threading.local()
+            self._pending = {}
+            self._touched = set()
+            self._lock = threading.Lock()
+            self._namespace_id = None
+            self._finalizer = Finalize(self, _flush_ref, args=(weakref.ref(self),), exitpriority=10)
+            # Published last: other threads skip the setup once they see it
+            self._pid = pid
+
+    def _connect(self):
+        """Return this thread's connection, opening the database if needed."""
+        if self._pid != os.getpid():
+            self._setup()
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            if self._namespace_id is None:
+                self._namespace_id = self._open_namespace(conn)
+        return conn
+
+    def _open_namespace(self, conn):
+        """Create the schema, drop stale namespaces and return this namespace's id."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in SCHEMA.split(';'):
+                if statement.strip():
+                    conn.execute(statement)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            if 'matches' not in columns:
+                # Databases written before match counts were stored
+                conn.execute("ALTER TABLE entries ADD COLUMN matches TEXT NOT NULL DEFAULT ''")
+            conn.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('bytes', 0)")
+            stale = [row[0] for row in conn.execute(
+                "SELECT id FROM namespaces WHERE language = ? AND name != ?",
+                (self.language, self.namespace),
+            )]
+            for namespace_id in stale:
+                self._add_bytes(conn, -self._entry_bytes(conn, "namespace = ?", (namespace_id,)))
+                conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace_id,))
+                conn.execute("DELETE FROM namespaces WHERE id = ?", (namespace_id,))
+            conn.execute(
+                "INSERT OR IGNORE INTO namespaces (language, name) VALUES (?, ?)",
+                (self.language, self.namespace),
+            )
+            namespace_id = conn.execute(
+                "SELECT id FROM namespaces WHERE language = ? AND name = ?",
+                (self.language, self.namespace),
+            ).fetchone()[0]
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return namespace_id
+
+    def get(self, text):
+        """
+        Look up the normalized form of a text.
+
+        Returns:
+            str or None: Cached result, or None on a miss
+        """
+        entry = self.get_entry(text)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, text):
+        """
+        Look up the normalized form of a text and the matches found in it.
+
+        Returns:
+            tuple or None: ``(result, ((category, count), ...))``, or None
+            on a miss
+        """
+        conn = self._connect()
+        key = self._key(text)
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return pending[0], _decode_matches(pending[1])
+        row = conn.execute("SELECT value, used, matches FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if time.time_ns() // 1000 - row[1] > TOUCH_INTERVAL:
+            with self._lock:
+                self._touched.add(key)
+        return row[0], _decode_matches(row[2])
+
+    def put(self, text, result, matches=()):
+        """
+        Buffer a result; it is written with the next batch.
+
+        Args:
+            text (str): Input text
+            result (str): Normalized text
+            matches (iterable): ``(category, count)`` pairs found in the text
+        """
+        self._connect()
+        with self._lock:
+            self._pending[self._key(text)] = (result, _encode_matches(matches))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write buffered entries in one transaction and enforce the size cap."""
+        if self._pid != os.getpid():
+            return
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            touched, self._touched = self._touched, set()
+        if not pending and not touched:
+            return
+        conn = self._connect()
+        now = time.time_ns() // 1000
+        namespace_id = self._namespace_id
+        rows = [(key, namespace_id, value, now, matches)
+                for key, (value, matches) in pending.items()]
+        batch_bytes = sum(len(value.encode('utf-8', 'surrogatepass')) + len(matches)
+                          for value, matches in pending.values())
+        batch_bytes += ENTRY_OVERHEAD * len(rows)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO entries (key, namespace, value, used, matches) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            inserted = conn.total_changes - before
+            if inserted:
+                # Keys already present hold the same value; count only new rows
+                self._add_bytes(conn, batch_bytes * inserted // len(rows))
+            conn.executemany(
+                "UPDATE entries SET used = ? WHERE key = ?",
+                [(now, key) for key in touched],
+            )
+            if rows:
+                self._evict(conn, batch_bytes // len(rows))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _add_bytes(conn, delta):
+        conn.execute("UPDATE meta SET value = value + ? WHERE name = 'bytes'", (delta,))
+
+    @staticmethod
+    def _entry_bytes(conn, where, params):
+        """Approximate size of the entries selected by ``where``."""
+        return conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(CAST(value AS BLOB)) + LENGTH(matches)), 0) + COUNT(*) * ? "
+            "FROM entries WHERE " + where,
+            (ENTRY_OVERHEAD,) + tuple(params),
+        ).fetchone()[0]
+
+    def size(self):
+        """
+        Return the approximate size of the stored entries.
+
+        Returns:
+            int: Bytes counted against ``max_bytes``
+        """
+        conn = self._connect()
+        return conn.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+
+    def _evict(self, conn, entry_bytes):
+        """
+        Delete the least recently used entries while over the size cap.
+
+        Runs inside the caller's transaction.
+
+        Args:
+            conn: Connection with an open transaction
+            entry_bytes (int): Typical size of one entry
+        """
+        size = conn.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+        if size <= self.max_bytes:
+            return
+        target = int(self.max_bytes * (1 - EVICT_FRACTION))
+        oldest = "key IN (SELECT key FROM entries ORDER BY used LIMIT ?)"
+        while size > target:
+            rows = max(1, -(-(size - target) // max(1, entry_bytes)))
+            freed = self._entry_bytes(conn, oldest, (rows,))
+            deleted = conn.execute("DELETE FROM entries WHERE " + oldest, (rows,)).rowcount
+            if not deleted:
+                freed = size
+            self.evictions += deleted
+            self._add_bytes(conn, -freed)
+            size -= freed
+
+    def clear(self):
+        """Delete every entry of this language configuration."""
+        conn = self._connect()
+        with self._lock:
+            self._pending.clear()
+            self._touched.clear()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            where = "namespace = ?"
+            self._add_bytes(conn, -self._entry_bytes(conn, where, (self._namespace_id,)))
+            conn.execute("DELETE FROM entries WHERE " + where, (self._namespace_id,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        """Flush buffered entries and close this thread's connection."""
+        self.flush()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups that were hits (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self):
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: ``path``, ``bytes``, ``max_bytes``, ``pending``, ``hits``,
+            ``misses``, ``evictions`` and ``hit_rate``
+        """
+        return {
+            'path': self.path,
+            'bytes': self.size(),
+            'max_bytes': self.max_bytes,
+            'pending': len(self._pending),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }
+
+    def __repr__(self):
+        return f"DiskCache(path={self.path!r}, language={self.language!r})"
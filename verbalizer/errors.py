@@ -0,0 +1,55 @@
+"""
+Error policies for expressions that cannot be verbalized.
+
+- ``'warn'``: leave the expression as it is and emit a UserWarning (default)
+- ``'ignore'``: leave the expression as it is, silently
+- ``'collect'``: leave the expression as it is and return a list of
+  Failure records together with the result
+- ``'raise'``: raise NormalizationError
+"""
+
+from collections import namedtuple
+
+
+ERROR_POLICIES = ('ignore', 'collect', 'warn', 'raise')
+
+
+# One expression that could not be verbalized
+Failure = namedtuple('Failure', ['offset', 'category', 'reason'])
+
+
+class NormalizationError(ValueError):
+    """
+    Raised under the ``'raise'`` policy when an expression cannot be verbalized.
+
+    Attributes:
+        offset (int): Offset of the expression in the input text
+        category (str): Pattern category of the expression
+        text (str): The expression
+        reason (str): Why verbalization failed
+    """
+
+    def __init__(self, offset, category, text, reason):
+        super().__init__(f"Failed to normalize {category} '{text}' at offset {offset}: {reason}")
+        self.offset = offset
+        self.category = category
+        self.text = text
+        self.reason = reason
+
+
+def check_policy(errors):
+    """
+    Validate an error policy name.
+
+    Args:
+        errors (str): Policy name
+
+    Returns:
+        str: The policy name
+
+    Raises:
+        ValueError: If the policy is unknown
+    """
+    if errors not in ERROR_POLICIES:
+        raise ValueError(f"Unknown error policy '{errors}'. Expected one of {ERROR_POLICIES}")
+    return errors
@@ -0,0 +1,242 @@
+"""
+Incremental normalization of a document that is being edited.
+
+An IncrementalNormalizer holds a document split at safe points (see
+Detector.last_break) into pieces of about ``piece_chars`` characters, each
+with its normalized form. An edit only re-normalizes the pieces it touches,
+merged with a neighbour when the edit removes the safe point between them,
+so its cost depends on the size of the edit rather than of the document:
+
+    from verbalizer import get_verbalizer
+
+    document = get_verbalizer('sw').incremental("Nina KES 15")
+    document.edit(11, 0, "00")    # -> (14, 6, 'elfu moja na mi'), the change to the output
+    document.output               # == normalize("Nina KES 1500")
+
+Since normalizing the pieces separately is the same as normalizing the
+whole text, ``output`` always equals ``normalize(text)``.
+"""
+
+from .errors import check_policy
+from .stream import split_text
+
+
+# Target characters per piece: smaller pieces make edits cheaper, larger
+# ones make the bookkeeping per edit cheaper
+DEFAULT_PIECE_CHARS = 512
+
+# Characters before a piece boundary inspected to tell whether it is still a
+# safe point; longer runs of whitespace merge the pieces instead
+BREAK_CONTEXT = 64
+
+
+def _common_prefix(a, b):
+    """Return the length of the common prefix of two strings."""
+    # Binary search over slice comparisons, which run in C
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class _Offsets:
+    """
+    Offsets of consecutive pieces from their lengths, as a Fenwick tree.
+
+    Changing a length and finding the piece at an offset take O(log n),
+    where a plain list of offsets has to be shifted after every edit.
+    """
+
+    __slots__ = ('_tree', '_top')
+
+    def __init__(self, pieces):
+        tree = [0]
+        tree.extend(map(len, pieces))
+        size = len(tree) - 1
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        self._tree = tree
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+
+    def __len__(self):
+        return len(self._tree) - 1
+
+    def start(self, index):
+        """Return the offset of piece ``index``, or the total length for ``len(self)``."""
+        tree = self._tree
+        total = 0
+        while index:
+            total += tree[index]
+            index &= index - 1
+        return total
+
+    def add(self, index, delta):
+        """Add ``delta`` to the length of piece ``index``."""
+        tree = self._tree
+        index += 1
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def find(self, offset):
+        """Return the index of the last piece starting at or before ``offset``."""
+        tree = self._tree
+        index = 0
+        step = self._top
+        while step:
+            if index + step < len(tree) and tree[index + step] <= offset:
+                index += step
+                offset -= tree[index]
+            step >>= 1
+        return min(index, len(tree) - 2)
+
+
+class IncrementalNormalizer:
+    """
+    A document and its normalized form, kept up to date edit by edit.
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        text (str): Initial document
+        errors (str, optional): Error policy ('ignore', 'warn' or 'raise');
+            defaults to the normalizer's policy
+        piece_chars (int): Target characters per piece
+
+    Raises:
+        ValueError: For the 'collect' policy, whose failure offsets would be
+            relative to pieces
+    """
+
+    def __init__(self, normalizer, text='', errors=None, piece_chars=DEFAULT_PIECE_CHARS):
+        errors = normalizer.errors if errors is None else check_policy(errors)
+        if errors == 'collect':
+            raise ValueError("IncrementalNormalizer does not support errors='collect'")
+        self.normalizer = normalizer
+        self.errors = errors
+        self.piece_chars = piece_chars
+        self.reset(text)
+
+    def reset(self, text=''):
+        """
+        Replace the whole document.
+
+        Args:
+            text (str): New document
+        """
+        self._sources, self._outputs = self._normalize_region(text)
+        self._starts = _Offsets(self._sources)
+        self._out_starts = _Offsets(self._outputs)
+
+    @property
+    def text(self):
+        """The current document."""
+        return ''.join(self._sources)
+
+    @property
+    def output(self):
+        """The normalized document, equal to ``normalize(text)``."""
+        return ''.join(self._outputs)
+
+    def __len__(self):
+        return self._starts.start(len(self._starts))
+
+    def _normalize_region(self, text):
+        """
+        Split text at safe points and normalize every piece.
+
+        Returns:
+            tuple: ``(sources, outputs)``, two lists with at least one piece
+        """
+        normalize = self.normalizer.normalize
+        pieces = split_text(self.normalizer.detector, text, self.piece_chars)
+        sources = [piece for _, piece in pieces]
+        return sources, [normalize(piece, self.errors) for piece in sources]
+
+    def _breaks_before(self, text, following):
+        """Return True if ``text`` may still be normalized apart from ``following``."""
+        tail = text[-BREAK_CONTEXT:] + following[:1]
+        split = len(tail) - 1
+        breaks = self.normalizer.detector.safe_break.finditer(tail)
+        return any(match.end() == split for match in breaks)
+
+    def edit(self, offset, deleted=0, inserted=''):
+        """
+        Apply an edit and update the normalized document.
+
+        Args:
+            offset (int): Position of the edit in the current document
+            deleted (int): Characters removed at ``offset``
+            inserted (str): Text inserted at ``offset``
+
+        Returns:
+            tuple: ``(offset, deleted, inserted)`` describing the same kind
+            of edit on ``output``, kept as small as possible
+
+        Raises:
+            ValueError: If the edit falls outside the document
+        """
+        if offset < 0 or deleted < 0 or offset + deleted > len(self):
+            raise ValueError(
+                f"Edit ({offset}, {deleted}) is outside the document of {len(self)} characters"
+            )
+        sources = self._sources
+        starts = self._starts
+        end = offset + deleted
+
+        # The pieces the edit touches; an edit at the start of a piece can
+        # remove the safe point before it, so the previous piece joins in
+        first = starts.find(offset)
+        start = starts.start(first)
+        if first and offset == start:
+            first -= 1
+            start -= len(sources[first])
+        last = starts.find(end - 1) if deleted else first
+        region = ''.join(sources[first:last + 1])
+        region = region[:offset - start] + inserted + region[end - start:]
+
+        # The edit may also remove the safe point after the region
+        while last + 1 < len(sources) and not self._breaks_before(region, sources[last + 1]):
+            last += 1
+            region += sources[last]
+
+        new_sources, new_outputs = self._normalize_region(region)
+        if len(new_sources) == 1 and not new_sources[0] and len(sources) > last - first + 1:
+            new_sources, new_outputs = [], []
+
+        out_start = self._out_starts.start(first)
+        old_outputs = self._outputs[first:last + 1]
+        old_output = ''.join(old_outputs)
+        new_output = ''.join(new_outputs)
+
+        if len(new_sources) == len(old_outputs):
+            # Same pieces, new lengths: update the offsets in place
+            for index, (old_source, source, old, new) in enumerate(
+                    zip(sources[first:last + 1], new_sources, old_outputs, new_outputs), first):
+                starts.add(index, len(source) - len(old_source))
+                self._out_starts.add(index, len(new) - len(old))
+            sources[first:last + 1] = new_sources
+            self._outputs[first:last + 1] = new_outputs
+        else:
+            # Pieces split or merged, which happens once every few hundred
+            # keystrokes at the default piece size
+            sources[first:last + 1] = new_sources
+            self._outputs[first:last + 1] = new_outputs
+            self._starts = _Offsets(sources)
+            self._out_starts = _Offsets(self._outputs)
+        return self._patch(out_start, old_output, new_output)
+
+    @staticmethod
+    def _patch(offset, old, new):
+        """Describe replacing ``old`` by ``new`` at ``offset``, trimming the common ends."""
+        prefix = _common_prefix(old, new)
+        suffix = _common_prefix(old[prefix:][::-1], new[prefix:][::-1])
+        return offset + prefix, len(old) - prefix - suffix, new[prefix:len(new) - suffix]
+
+    def __repr__(self):
+        return f"IncrementalNormalizer({len(self)} chars, {len(self._sources)} pieces)"
@@ -1,7 +1,14 @@
 """
 Language-specific normalizers.
+
+Each language lives in its own subpackage and is imported on first use.
 """
 
-from .swahili import SwahiliVerbalizer
+__all__ = ['SwahiliVerbalizer']
+
 
-__all__ = ['SwahiliVerbalizer']
\ No newline at end of file
+def __getattr__(name):
+    if name == 'SwahiliVerbalizer':
+        from .swahili import SwahiliVerbalizer
+        return SwahiliVerbalizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
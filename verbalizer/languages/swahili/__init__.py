@@ -5,11 +5,15 @@ Main verbalizer class for Swahili language.
 """
 
 from ...base import BaseNormalizer
-from .config import PATTERNS
-from .number import verbalize_number as verbalize_number_sw
-from .currency import verbalize_currency as verbalize_currency_sw
-from .time import verbalize_time as verbalize_time_sw
-from .date import parse_and_verbalize_date as verbalize_date_sw
+from .config import PACK, PATTERNS
+from .number import (
+    DEFAULT_LEADING_ZERO_DIGITS, DEFAULT_MAX_CARDINAL_DIGITS, NumberReading,
+    verbalize_number as verbalize_number_sw,
+)
+from .currency import currency_code, verbalize_currency as verbalize_currency_sw
+from .time import TIME_TABLE, verbalize_time_parts
+from .date import DEFAULT_YEAR_RANGE, date_table, verbalize_date_parts
+from .inverse import inverse_normalize as inverse_normalize_sw
 
 
 class SwahiliVerbalizer(BaseNormalizer):
@@ -18,19 +22,59 @@ class SwahiliVerbalizer(BaseNormalizer):
     
     Handles verbalization of:
     - Numbers (integers and decimals)
-    - Currency (KES, TZS, NGN, RWF)
+    - Currency (ISO 4217 codes and symbols such as KSh, ₦ and $,
+      before or after the amount)
     - Time (12h and 24h formats)
     - Dates (DD/MM/YYYY format)
     """
     
-    def __init__(self):
-        """Initialize Swahili verbalizer."""
-        super().__init__()
+    def __init__(self, errors='warn', year_range=DEFAULT_YEAR_RANGE, eager_tables=False,
+                 max_cardinal_digits=DEFAULT_MAX_CARDINAL_DIGITS,
+                 leading_zero_digits=DEFAULT_LEADING_ZERO_DIGITS):
+        """
+        Initialize Swahili verbalizer.
+        
+        Args:
+            errors (str): Policy for expressions that cannot be verbalized:
+                'ignore', 'collect', 'warn' or 'raise'
+            year_range (tuple): First and last year, inclusive, served from
+                the date lookup table; other years are computed
+            eager_tables (bool): Build the time and date lookup tables now
+                instead of on first use
+            max_cardinal_digits (int): Longer digit runs are read digit by
+                digit (at most 36)
+            leading_zero_digits (int): Digit runs of at least this length
+                starting with 0, such as phone numbers, are read digit by
+                digit; 0, the default, disables the rule
+        """
+        super().__init__(errors=errors)
+        self.number_reading = NumberReading(max_cardinal_digits, leading_zero_digits)
+        self.date_table = date_table(*year_range)
+        if eager_tables:
+            TIME_TABLE.build()
+            self.date_table.build()
+    
+    def _output_settings(self):
+        """Return the number reading rules and year range."""
+        reading = self.number_reading
+        return {
+            'max_cardinal_digits': reading.max_cardinal_digits,
+            'leading_zero_digits': reading.leading_zero_digits,
+            'year_range': (self.date_table.first_year, self.date_table.last_year),
+        }
     
     def _get_patterns(self):
         """Return Swahili-specific regex patterns."""
         return PATTERNS
     
+    def _get_pattern_hints(self):
+        """Return the detector hints cached with the Swahili pack."""
+        return PACK.pattern_hints
+    
+    def _get_warmup_texts(self):
+        """Return the warm-up sentences of the Swahili pack."""
+        return PACK.warmup
+    
     def verbalize_number(self, number_str):
         """
         Convert a number string to Swahili words.
@@ -41,21 +85,23 @@ class SwahiliVerbalizer(BaseNormalizer):
         Returns:
             str: Verbalized number in Swahili
         """
-        return verbalize_number_sw(number_str)
+        return verbalize_number_sw(number_str, self.number_reading)
     
     def verbalize_currency(self, match):
         """
         Convert a currency amount to Swahili words.
         
         Args:
-            match: Regex match object with groups (currency_code, amount)
+            match: Regex match object with groups (currency, amount) for
+                the prefix form and (amount, currency) for the suffix form
             
         Returns:
             str: Verbalized currency in Swahili
         """
-        currency_code = match.group(1).upper()
-        amount = match.group(2)
-        return verbalize_currency_sw(currency_code, amount)
+        form, amount = match.group(1, 2)
+        if form is None:
+            amount, form = match.group(3, 4)
+        return verbalize_currency_sw(currency_code(form), amount, self.number_reading)
     
     def verbalize_time(self, match):
         """
@@ -67,19 +113,13 @@ class SwahiliVerbalizer(BaseNormalizer):
         Returns:
             str: Verbalized time in Swahili
         """
-        # Reconstruct the time string from match groups
-        hours = match.group(1)
-        minutes = match.group(2)
-        seconds = match.group(3) if match.group(3) else ""
-        period = match.group(4) if match.group(4) else ""
-        
-        time_str = f"{hours}:{minutes}"
-        if seconds:
-            time_str += f":{seconds}"
-        if period:
-            time_str += f" {period}"
-        
-        return verbalize_time_sw(time_str)
+        hours, minutes, seconds, period = match.groups()
+        return verbalize_time_parts(
+            int(hours),
+            int(minutes),
+            int(seconds) if seconds else None,
+            period.upper() if period else None,
+        )
     
     def verbalize_date(self, match):
         """
@@ -91,5 +131,21 @@ class SwahiliVerbalizer(BaseNormalizer):
         Returns:
             str: Verbalized date in Swahili
         """
-        date_str = match.group()
-        return verbalize_date_sw(date_str)
\ No newline at end of file
+        day, month, year = match.groups()
+        return verbalize_date_parts(int(day), int(month), int(year), self.date_table)
+    
+    def inverse_normalize(self, text):
+        """
+        Write spoken numbers, amounts, times and dates in digits again.
+        
+        The reverse of normalize, e.g. for speech recognition output:
+        "shilingi elfu moja na mia tano" becomes "KES 1500" (see
+        verbalizer.languages.swahili.inverse).
+        
+        Args:
+            text (str): Text with expressions in words
+            
+        Returns:
+            str: Text with them in digits
+        """
+        return inverse_normalize_sw(text)
@@ -6,72 +6,66 @@ Swahili currency verbalization.
 Handles conversion of currency amounts to Swahili words.
 """
 
-from .number import number_to_words
+from .config import PACK
+from .number import CONJUNCTION, DEFAULT_READING, number_to_words, verbalize_integer, verbalize_number
 
 
-# Currency definitions
-CURRENCIES = {
-    'KES': {
-        'name': 'shilingi',
-        'singular': 'shilingi',
-        'plural': 'shilingi',
-        'subunit': 'senti',
-        'symbol': 'KES'
-    },
-    'TZS': {
-        'name': 'shilingi',
-        'singular': 'shilingi',
-        'plural': 'shilingi',
-        'subunit': 'senti',
-        'symbol': 'TZS'
-    },
-    'NGN': {
-        'name': 'naira',
-        'singular': 'naira',
-        'plural': 'naira',
-        'subunit': 'kobo',
-        'symbol': 'NGN'
-    },
-    'RWF': {
-        'name': 'faranga',
-        'singular': 'faranga',
-        'plural': 'faranga',
-        'subunit': 'santim',
-        'symbol': 'RWF'
-    },
-}
+# Currency definitions: code -> name, singular, plural, subunit and symbols
+CURRENCIES = PACK.currencies
 
+# Every detected form (code, symbol or local form) -> currency code
+CURRENCY_INDEX = PACK.currency_index
 
-def verbalize_currency(currency_code, amount_str):
+
+def currency_code(form):
+    """
+    Look up the currency a detected form stands for.
+    
+    Args:
+        form (str): Code or symbol as written, e.g. 'Kes', 'KSh' or '$'
+        
+    Returns:
+        str: Currency code, or the form in upper case if it is unknown
+    """
+    code = CURRENCY_INDEX.get(form)
+    if code is None:
+        # Codes are also matched in other cases
+        code = CURRENCY_INDEX.get(form.upper(), form.upper())
+    return code
+
+
+def verbalize_currency(currency_code, amount_str, reading=DEFAULT_READING):
     """
     Convert a currency amount to Swahili words.
     
     Args:
-        currency_code (str): Currency code (KES, TZS, NGN, RWF)
+        currency_code (str): Currency code (KES, TZS, NGN, RWF, ...)
         amount_str (str): Amount as string (can include decimals)
+        reading (NumberReading): Longest amount read as a cardinal; longer
+            amounts are read digit by digit
         
     Returns:
         str: Verbalized currency amount
     """
     if currency_code not in CURRENCIES:
-        return f"{currency_code} {amount_str}"
+        # A code without Swahili words is kept, followed by the amount
+        return f"{currency_code} {verbalize_number(amount_str, reading)}"
     
     currency = CURRENCIES[currency_code]
     
     # Parse amount
     if '.' in amount_str:
         main_amount, sub_amount = amount_str.split('.')
-        main_amount = int(main_amount)
         sub_amount = int(sub_amount)
     else:
-        main_amount = int(amount_str)
+        main_amount = amount_str
         sub_amount = 0
     
-    # Verbalize main amount
-    result = f"{currency['name']} {number_to_words(main_amount)}"
+    # Verbalize main amount; a leading zero does not make it an identifier
+    result = f"{currency['name']} {verbalize_integer(main_amount, reading, leading_zeros=False)}"
     
     # Verbalize subunit if present
     if sub_amount > 0:
-        result += f" na {currency['subunit']} {number_to_words(sub_amount)}"
+        result += f"{CONJUNCTION}{currency['subunit']} {number_to_words(sub_amount)}"
     
     return result
\ No newline at end of file
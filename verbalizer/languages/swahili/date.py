@@ -5,26 +5,31 @@ Swahili date verbalization.
 
 Handles conversion of dates to Swahili words.
 Format: DD/MM/YYYY
+
+Dates are looked up in a table of "tarehe ... mwezi wa ... mwaka" prefixes
+for every day of the year, compiled with the language pack, plus a table of
+years over a configurable range, built on first use; years outside the range
+go through the computed path.
 """
 
+from functools import lru_cache
+
+from .config import PACK
 from .number import number_to_words
 
 
-# Month names in Swahili
-MONTHS = {
-    1: "Januari",
-    2: "Februari",
-    3: "Machi",
-    4: "Aprili",
-    5: "Mei",
-    6: "Juni",
-    7: "Julai",
-    8: "Agosti",
-    9: "Septemba",
-    10: "Oktoba",
-    11: "Novemba",
-    12: "Desemba",
-}
+# Years covered by the date tables by default, inclusive
+DEFAULT_YEAR_RANGE = (1900, 2100)
+
+
+# Month names in Swahili, 1-12
+MONTHS = PACK.months
+
+# "tarehe", "mwezi wa", "mwaka" and "mwezi"
+DAY = PACK.date_words['day']
+MONTH = PACK.date_words['month']
+YEAR = PACK.date_words['year']
+MONTH_NUMBER = PACK.date_words['month_number']
 
 
 def verbalize_date(day, month, year):
@@ -43,22 +48,138 @@ def verbalize_date(day, month, year):
     day_words = number_to_words(day)
     
     # Month name
-    month_name = MONTHS.get(month, f"mwezi {number_to_words(month)}")
+    month_name = MONTHS.get(month, f"{MONTH_NUMBER} {number_to_words(month)}")
     
     # Year
     year_words = number_to_words(year)
     
     # Format: "tarehe [day] mwezi wa [month] mwaka [year]"
-    return f"tarehe {day_words} mwezi wa {month_name} mwaka {year_words}"
+    return f"{DAY} {day_words} {MONTH} {month_name} {YEAR} {year_words}"
+
+
+class DateTable:
+    """
+    Lookup table resolving a (day, month, year) straight to its words.
+    
+    The tables are built on the first lookup, or up front with :meth:`build`.
+    Use :func:`date_table` to share one table per year range.
+    
+    Args:
+        first_year (int): First year covered
+        last_year (int): Last year covered, inclusive
+    """
+    
+    def __init__(self, first_year=DEFAULT_YEAR_RANGE[0], last_year=DEFAULT_YEAR_RANGE[1]):
+        if first_year > last_year:
+            raise ValueError(f"Invalid year range: {first_year}-{last_year}")
+        self.first_year = first_year
+        self.last_year = last_year
+        self._prefixes = None
+        self._years = None
+    
+    def __reduce__(self):
+        # Unpickles to the shared table of the receiving process
+        return (date_table, (self.first_year, self.last_year))
+    
+    @property
+    def built(self):
+        """Whether the tables have been built."""
+        return self._prefixes is not None
+    
+    def build(self):
+        """
+        Build the tables now, e.g. at startup in a latency-sensitive server.
+        
+        Returns:
+            DateTable: self
+        """
+        if self._prefixes is None:
+            years = {
+                year: number_to_words(year)
+                for year in range(self.first_year, self.last_year + 1)
+            }
+            # Day and month prefixes come compiled with the language pack
+            prefixes = PACK.date_prefixes
+            # Publish the years first: readers check the prefixes only
+            self._years = years
+            self._prefixes = prefixes
+        return self
+    
+    def lookup(self, day, month, year):
+        """
+        Look a validated date up.
+        
+        Args:
+            day (int): Day of month (1-31)
+            month (int): Month (1-12)
+            year (int): Year
+            
+        Returns:
+            str or None: Verbalized date, or None outside the year range
+        """
+        prefixes = self._prefixes
+        if prefixes is None:
+            prefixes = self.build()._prefixes
+        year_words = self._years.get(year)
+        if year_words is None:
+            return None
+        return prefixes[(month - 1) * 31 + day - 1] + year_words
+
+
+@lru_cache(maxsize=None)
+def date_table(first_year=DEFAULT_YEAR_RANGE[0], last_year=DEFAULT_YEAR_RANGE[1]):
+    """
+    Return the shared DateTable for a year range.
+    
+    Args:
+        first_year (int): First year covered
+        last_year (int): Last year covered, inclusive
+        
+    Returns:
+        DateTable: Table, built on first lookup
+    """
+    return DateTable(first_year, last_year)
 
 
-def parse_and_verbalize_date(date_str):
+def verbalize_date_parts(day, month, year, table=None):
+    """
+    Validate parsed date components and convert them to Swahili words.
+    
+    Args:
+        day (int): Day of month
+        month (int): Month
+        year (int): Year
+        table (DateTable, optional): Lookup table (default: the table for
+            DEFAULT_YEAR_RANGE)
+        
+    Returns:
+        str: Verbalized date in Swahili
+    """
+    # Basic validation
+    if not (1 <= day <= 31):
+        raise ValueError(f"Invalid day: {day}")
+    if not (1 <= month <= 12):
+        raise ValueError(f"Invalid month: {month}")
+    if year < 0:
+        raise ValueError(f"Invalid year: {year}")
+    
+    if table is None:
+        table = date_table()
+    words = table.lookup(day, month, year)
+    if words is None:
+        words = verbalize_date(day, month, year)
+    return words
+
+
+def parse_and_verbalize_date(date_str, table=None):
     """
     Parse a date string and convert to Swahili words.
     Expected format: DD/MM/YYYY
     
     Args:
         date_str (str): Date string in DD/MM/YYYY format
+        table (DateTable, optional): Lookup table (default: the table for
+            DEFAULT_YEAR_RANGE)
         
     Returns:
         str: Verbalized date in Swahili
@@ -72,12 +193,4 @@ def parse_and_verbalize_date(date_str):
     month = int(parts[1])
     year = int(parts[2])
     
-    # Basic validation
-    if not (1 <= day <= 31):
-        raise ValueError(f"Invalid day: {day}")
-    if not (1 <= month <= 12):
-        raise ValueError(f"Invalid month: {month}")
-    if year < 0:
-        raise ValueError(f"Invalid year: {year}")
-    
-    return verbalize_date(day, month, year)
\ No newline at end of file
+    return verbalize_date_parts(day, month, year, table)
@@ -0,0 +1,351 @@
+# verbalizer/languages/swahili/inverse.py
+
+"""
+Swahili inverse text normalization.
+
+Turns spoken forms back into digits, e.g. in speech recognition output;
+the reverse of number_to_words, verbalize_currency, verbalize_time and
+verbalize_date:
+
+    "shilingi elfu moja na mia tano"                -> "KES 1500"
+    "saa kumi na nne na dakika thelathini"          -> "14:30"
+    "tarehe tano mwezi wa Machi mwaka elfu mbili"   -> "05/03/2000"
+
+The words come from the same tables as the forward direction (ONES, TENS,
+the scales, CURRENCIES, MONTHS, ...). A word trie labels every word, or
+phrase such as "mwezi wa", in one pass; small state machines, one per kind
+of expression, then read the labels left to right. A failed expression only
+rereads the few words of the numbers inside it, so the text is read in
+linear time, without backtracking over word sequences.
+
+Some spoken forms have more than one written form. The parser picks one
+that reads back to the same words:
+- "elfu mia tano na ishirini" is 520000 or 500020; the group read so far
+  is extended (520000)
+- currencies sharing a name ("shilingi") give the first one in the pack
+- two or more digit words in a row ("sifuri saba moja") are a digit string
+"""
+
+import re
+
+from .currency import CURRENCIES
+from .date import DAY, MONTH, MONTHS, YEAR
+from .number import CONJUNCTION, DECIMAL_POINT, HUNDRED, NEGATIVE, ONES, SCALES, TENS
+from .time import HOUR, MINUTE, PERIOD_WORDS, SECOND
+
+
+# Word labels
+(_ONE, _TEN, _HUNDRED, _SCALE, _JOIN, _POINT, _NEGATIVE, _CURRENCY, _SUBUNIT,
+ _HOUR, _MINUTE, _SECOND, _PERIOD, _DAY, _MONTH_WORD, _MONTH, _YEAR) = range(17)
+
+# Labels that can start a number
+_NUMBER_START = frozenset((_ONE, _TEN, _HUNDRED, _SCALE, _NEGATIVE))
+
+# States of the group being read by _Parser.cardinal: expecting a group,
+# after "mia", then complete groups: closed, open to "na" + a unit, or open
+# to "na" + tens or a unit
+_START, _MIA, _CLOSED, _TENS, _HUNDREDS = range(5)
+
+_WORD = re.compile(r'\w+')
+
+
+def _build_trie():
+    """
+    Map every word and phrase of the tables to its label.
+
+    Returns:
+        dict: Nested by case-folded word; the key None holds the label
+        ``(kind, value)`` of the phrase ending there
+    """
+    phrases = {}
+
+    def add(words, kind, value=None):
+        # The first label wins, e.g. the first currency with a name
+        phrases.setdefault(tuple(words.casefold().split()), (kind, value))
+
+    for value, word in ONES.items():
+        add(word, _ONE, value)
+    for value, word in TENS.items():
+        add(word, _TEN, value)
+    add(HUNDRED, _HUNDRED)
+    for scale, word in SCALES:
+        add(word, _SCALE, scale)
+    add(CONJUNCTION, _JOIN)
+    add(DECIMAL_POINT, _POINT)
+    add(NEGATIVE, _NEGATIVE)
+    for code, currency in CURRENCIES.items():
+        add(currency['name'], _CURRENCY, code)
+        add(currency['subunit'], _SUBUNIT, currency['subunit'])
+    add(HOUR, _HOUR)
+    add(MINUTE, _MINUTE)
+    add(SECOND, _SECOND)
+    for period, word in PERIOD_WORDS.items():
+        add(word, _PERIOD, period)
+    add(DAY, _DAY)
+    add(MONTH, _MONTH_WORD)
+    add(YEAR, _YEAR)
+    for number, name in MONTHS.items():
+        add(name, _MONTH, number)
+
+    trie = {}
+    for words, label in phrases.items():
+        node = trie
+        for word in words:
+            node = node.setdefault(word, {})
+        node[None] = label
+    return trie
+
+
+WORD_TRIE = _build_trie()
+
+
+class _Parser:
+    """
+    Labelled words of one text and the state machines reading them.
+
+    Readers take the index of a word and return ``(end, result)``, with
+    ``end`` the index after the last word read, or None.
+
+    Args:
+        text (str): Input text
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.kinds = []
+        self.values = []
+        self.starts = []
+        self.ends = []
+        words = [(match.group().casefold(), match.start(), match.end())
+                 for match in _WORD.finditer(text)]
+        i = 0
+        while i < len(words):
+            # Longest phrase of the trie starting at this word
+            node = WORD_TRIE
+            label, length = (None, None), 1
+            j = i
+            while j < len(words) and words[j][0] in node:
+                if j > i and not text[words[j - 1][2]:words[j][1]].isspace():
+                    break
+                node = node[words[j][0]]
+                j += 1
+                if None in node:
+                    label, length = node[None], j - i
+            self.kinds.append(label[0])
+            self.values.append(label[1])
+            self.starts.append(words[i][1])
+            self.ends.append(words[i + length - 1][2])
+            i += length
+        # Whether each word is followed by the next with only spaces between
+        self.linked = [text[end:start].isspace()
+                       for end, start in zip(self.ends, self.starts[1:])] + [False]
+        self.size = len(self.kinds)
+
+    def kind(self, i):
+        return self.kinds[i] if i < self.size else None
+
+    def joined(self, i, kind):
+        """Whether word ``i`` is "na", between word ``i - 1`` and a word of ``kind``."""
+        return (self.kind(i) == _JOIN and self.kind(i + 1) == kind
+                and self.linked[i - 1] and self.linked[i])
+
+    def run(self):
+        """Return the text with every expression written in digits."""
+        readers = {_CURRENCY: self.currency, _HOUR: self.time, _DAY: self.date}
+        pieces = []
+        last = 0
+        i = 0
+        while i < self.size:
+            kind = self.kinds[i]
+            reader = readers.get(kind)
+            if reader is None and kind in _NUMBER_START:
+                reader = self.number
+            found = reader(i) if reader is not None else None
+            if found is None:
+                i += 1
+                continue
+            end, written = found
+            pieces.append(self.text[last:self.starts[i]])
+            pieces.append(written)
+            last = self.ends[end - 1]
+            i = end
+        pieces.append(self.text[last:])
+        return ''.join(pieces)
+
+    def cardinal(self, i):
+        """
+        Read a number as number_to_words writes it.
+
+        The state is the value of the scales read so far, the current scale
+        and the group counting it. A group is complete after a unit, tens or
+        hundreds; "na" then either extends it ("mia moja na tano") or starts
+        the group of a smaller scale ("elfu moja na mia tano"). The longest
+        complete number is returned.
+
+        Returns:
+            tuple: ``(end, value)`` or None
+        """
+        kinds, values, linked = self.kinds, self.values, self.linked
+        if self.kind(i) == _ONE and values[i] == 0:
+            return i + 1, 0
+
+        total = 0
+        scale = 1
+        group = 0
+        state = _START
+        best = None
+        j = i
+        while j < self.size:
+            kind, value = kinds[j], values[j]
+            if j > i and state in (_START, _MIA) and not linked[j - 1]:
+                break
+            if state == _START:
+                if kind == _SCALE and j == i:
+                    scale = value
+                elif kind == _ONE and value:
+                    group, state = value, _CLOSED
+                elif kind == _TEN:
+                    group, state = value, _TENS
+                elif kind == _HUNDRED:
+                    state = _MIA
+                else:
+                    break
+                j += 1
+                continue
+            if state == _MIA:
+                if kind != _ONE or not value:
+                    break
+                group, state = 100 * value, _HUNDREDS
+                j += 1
+                continue
+
+            # A complete group
+            best = (j, total + group * scale)
+            if kind != _JOIN or j + 1 >= self.size or not (linked[j - 1] and linked[j]):
+                break
+            kind, value = kinds[j + 1], values[j + 1]
+            if kind == _ONE and value and state != _CLOSED:
+                group, state = group + value, _CLOSED
+            elif kind == _TEN and state == _HUNDREDS:
+                group, state = group + value, _TENS
+            elif kind == _SCALE and value < scale:
+                total, group, scale, state = total + group * scale, 0, value, _START
+            elif scale > 1 and (kind in (_TEN, _HUNDRED) or kind == _ONE and value):
+                # The units group after the scaled ones; read from "na"
+                total, group, scale, state = total + group * scale, 0, 1, _START
+                j += 1
+                continue
+            else:
+                break
+            j += 2
+        else:
+            if state not in (_START, _MIA):
+                best = (j, total + group * scale)
+        return best
+
+    def integer(self, i):
+        """
+        Read a cardinal or a digit string.
+
+        Returns:
+            tuple: ``(end, digits)`` or None
+        """
+        if self.kind(i) == _ONE:
+            j = i + 1
+            while self.kind(j) == _ONE and self.linked[j - 1]:
+                j += 1
+            if j - i > 1:
+                return j, ''.join(str(value) for value in self.values[i:j])
+        found = self.cardinal(i)
+        return found and (found[0], str(found[1]))
+
+    def number(self, i):
+        """Read a number as verbalize_number writes it, with sign and decimals."""
+        sign = ''
+        if self.kinds[i] == _NEGATIVE:
+            if not self.linked[i]:
+                return None
+            sign, i = '-', i + 1
+        found = self.integer(i)
+        if found is None:
+            return None
+        j, digits = found
+        if (self.kind(j) == _POINT and self.kind(j + 1) == _ONE
+                and self.linked[j - 1] and self.linked[j]):
+            k = j + 2
+            while self.kind(k) == _ONE and self.linked[k - 1]:
+                k += 1
+            digits += '.' + ''.join(str(value) for value in self.values[j + 1:k])
+            j = k
+        return j, sign + digits
+
+    def currency(self, i):
+        """Read "[name] [amount] na [subunit] [amount]" as "[code] [amount]"."""
+        code = self.values[i]
+        found = self.integer(i + 1) if self.linked[i] else None
+        if found is None:
+            return None
+        j, amount = found
+        if (self.joined(j, _SUBUNIT) and self.values[j + 1] == CURRENCIES[code]['subunit']
+                and self.linked[j + 1]):
+            cents = self.cardinal(j + 2)
+            if cents is not None and 0 < cents[1] < 100:
+                j, amount = cents[0], f"{amount}.{cents[1]:02d}"
+        return j, f"{code} {amount}"
+
+    def time(self, i):
+        """Read "saa [hours] na dakika [minutes] na sekunde [seconds] [period]"."""
+        found = self.cardinal(i + 1) if self.linked[i] else None
+        if found is None or found[1] > 23:
+            return None
+        j, hours = found
+        parts = {_MINUTE: 0, _SECOND: 0}
+        for unit in parts:
+            if self.joined(j, unit) and self.linked[j + 1]:
+                part = self.cardinal(j + 2)
+                if part is not None and 0 < part[1] < 60:
+                    j, parts[unit] = part
+        period = None
+        if self.kind(j) == _PERIOD and self.linked[j - 1]:
+            period = self.values[j]
+            j += 1
+            # The forward direction reads the hour on the 24-hour clock
+            if hours > 12:
+                hours -= 12
+            elif hours == 0:
+                hours = 12
+        written = f"{hours}:{parts[_MINUTE]:02d}"
+        if parts[_SECOND]:
+            written += f":{parts[_SECOND]:02d}"
+        if period is not None:
+            written += f" {period}"
+        return j, written
+
+    def date(self, i):
+        """Read "tarehe [day] mwezi wa [month] mwaka [year]" as DD/MM/YYYY."""
+        found = self.cardinal(i + 1) if self.linked[i] else None
+        if found is None or not 1 <= found[1] <= 31:
+            return None
+        j, day = found
+        if not (self.kind(j) == _MONTH_WORD and self.kind(j + 1) == _MONTH
+                and self.kind(j + 2) == _YEAR and all(self.linked[j - 1:j + 3])):
+            return None
+        year = self.cardinal(j + 3)
+        if year is None or year[1] > 9999:
+            return None
+        return year[0], f"{day:02d}/{self.values[j + 1]:02d}/{year[1]:04d}"
+
+
+def inverse_normalize(text):
+    """
+    Write the spoken numbers, amounts, times and dates of a text in digits.
+
+    Args:
+        text (str): Swahili text, e.g. a speech recognition hypothesis
+
+    Returns:
+        str: Text with the expressions written as the forward direction
+        reads them, e.g. "KES 1500" for "shilingi elfu moja na mia tano";
+        everything else is kept as it is
+    """
+    return _Parser(text).run()
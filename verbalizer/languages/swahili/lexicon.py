@@ -0,0 +1,115 @@
+# verbalizer/languages/swahili/lexicon.py
+
+"""
+Swahili lexicon files.
+
+Precomputed word forms for processes that need them without recomputing,
+including ones not written in Python. The file layout is described in
+verbalizer.lexicon; the sections are:
+
+- 'number': number_to_words over a range of integers (0-1,000,000 by default)
+- 'year': the years of DD/MM/YYYY dates, 0-9999
+- 'time': the words of every minute of the day, keyed hours * 60 + minutes
+
+The tag is a hash of the language pack, so a file built from another
+version of the words is refused by :func:`open_lexicon`.
+
+Usage:
+    python -m verbalizer.languages.swahili.lexicon sw.lex --numbers 0 1000000
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+
+from ...lexicon import Lexicon, write_lexicon
+from .config import PACK
+from .number import verbalize_numbers_array
+
+
+# Numbers covered by default, inclusive
+DEFAULT_NUMBER_RANGE = (0, 1000000)
+
+# Every year a DD/MM/YYYY date can have
+YEAR_RANGE = (0, 9999)
+
+PACK_PATH = os.path.join(os.path.dirname(__file__), 'sw.json')
+
+
+def lexicon_tag():
+    """
+    Return the tag of lexicons built from the current language pack.
+
+    Returns:
+        bytes: 32 hex digits of the pack's SHA-256
+    """
+    with open(PACK_PATH, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:32].encode('ascii')
+
+
+def build_lexicon(path, numbers=DEFAULT_NUMBER_RANGE, years=True, times=True):
+    """
+    Precompute Swahili word forms into a lexicon file.
+
+    Args:
+        path (str): Output file
+        numbers (tuple): First and last number, inclusive
+        years (bool): Add the 'year' section
+        times (bool): Add the 'time' section
+
+    Returns:
+        str: The path
+    """
+    first, last = numbers
+    if first > last:
+        raise ValueError(f"Invalid number range: {first}-{last}")
+    sections = {'number': (first, verbalize_numbers_array(range(first, last + 1)))}
+    if years:
+        sections['year'] = (YEAR_RANGE[0], verbalize_numbers_array(range(YEAR_RANGE[0], YEAR_RANGE[1] + 1)))
+    if times:
+        sections['time'] = (0, PACK.clock)
+    write_lexicon(path, sections, tag=lexicon_tag())
+    return path
+
+
+def open_lexicon(path):
+    """
+    Map a Swahili lexicon file.
+
+    Args:
+        path (str): Lexicon file
+
+    Returns:
+        Lexicon: The mapped file
+
+    Raises:
+        ValueError: If the file is not a lexicon, or was built from another
+            version of the language pack
+    """
+    lexicon = Lexicon(path)
+    if lexicon.tag != lexicon_tag():
+        lexicon.close()
+        raise ValueError(f"{path}: built from another version of the Swahili pack; rebuild it")
+    return lexicon
+
+
+def main(argv=None):
+    """Entry point for ``python -m verbalizer.languages.swahili.lexicon``."""
+    parser = argparse.ArgumentParser(description="Build a Swahili lexicon file.")
+    parser.add_argument('output', help="lexicon file to write")
+    parser.add_argument('--numbers', type=int, nargs=2, metavar=('FIRST', 'LAST'),
+                        default=DEFAULT_NUMBER_RANGE,
+                        help="numbers to cover, inclusive (default: 0 1000000)")
+    parser.add_argument('--no-years', dest='years', action='store_false',
+                        help="leave out the years 0-9999")
+    parser.add_argument('--no-times', dest='times', action='store_false',
+                        help="leave out the minutes of the day")
+    args = parser.parse_args(argv)
+    build_lexicon(args.output, tuple(args.numbers), args.years, args.times)
+    print(f"{args.output}: {os.path.getsize(args.output)} bytes", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,135 +4,189 @@
 Swahili number verbalization.
 
 Handles conversion of numbers to Swahili words.
+
+Digit runs are read as cardinals up to a configurable length; longer runs,
+and runs with a leading zero such as phone numbers (0712345678), are read
+digit by digit. Digit reading works on the string directly, so its cost is
+linear in the length of the run and no big int is ever built.
 """
 
+from functools import lru_cache
+
+from .config import PACK
+
+
 # Basic digits 0-9
-ONES = {
-    0: "sifuri",
-    1: "moja",
-    2: "mbili",
-    3: "tatu",
-    4: "nne",
-    5: "tano",
-    6: "sita",
-    7: "saba",
-    8: "nane",
-    9: "tisa",
-}
+ONES = PACK.ones
 
 # Tens 10-90
-TENS = {
-    10: "kumi",
-    20: "ishirini",
-    30: "thelathini",
-    40: "arobaini",
-    50: "hamsini",
-    60: "sitini",
-    70: "sabini",
-    80: "themanini",
-    90: "tisini",
-}
+TENS = PACK.tens
+
+# Scales, largest first, composed in three-digit groups
+SCALES = PACK.scales
 
 # Scale words
-HUNDRED = "mia"
-THOUSAND = "elfu"
-MILLION = "milioni"
-BILLION = "bilioni"
+HUNDRED = PACK.hundred
+THOUSAND, MILLION, BILLION, TRILLION, QUADRILLION, QUINTILLION = (
+    word for _, word in reversed(SCALES)
+)
+
+# Joins the groups of a number ("elfu moja na mia mbili")
+CONJUNCTION = PACK.join
+
+# Prefix of negative numbers and separator of decimal digits
+NEGATIVE = PACK.negative
+DECIMAL_POINT = PACK.decimal_point
+
+
+# Size of the memo for whole values passed to number_to_words
+NUMBER_CACHE_SIZE = 8192
+
+# Longest digit run read as a cardinal by default; up to 999 trillion
+DEFAULT_MAX_CARDINAL_DIGITS = 15
+
+# Runs of at least this many digits starting with 0 are read digit by digit;
+# off by default, as short runs such as 007 or the 000 of 1,000 are cardinals
+DEFAULT_LEADING_ZERO_DIGITS = 0
+
+# Upper bound for max_cardinal_digits: above it cardinals stop being
+# readable and int conversion stops being cheap
+MAX_CARDINAL_DIGITS = 36
 
 
+# Word forms of 0-999, the building block of every larger number
+GROUP_WORDS = PACK.group_words
+
+
+@lru_cache(maxsize=NUMBER_CACHE_SIZE)
 def number_to_words(n):
     """
     Convert an integer to Swahili words.
     
+    Numbers are composed from the precomputed 0-999 table in three-digit
+    groups. Results for whole values are memoized in a bounded LRU cache;
+    use ``number_to_words.cache_info()`` for hit/miss statistics and
+    ``number_to_words.cache_clear()`` to empty it.
+    
     Args:
-        n (int): Number to convert (0 to 999,999,999,999)
+        n (int): Number to convert
         
     Returns:
         str: Swahili word representation
     """
-    if n == 0:
-        return ONES[0]
-    
     if n < 0:
-        return "hasi " + number_to_words(-n)
+        return NEGATIVE + number_to_words(-n)
     
-    # Handle billions
-    if n >= 1_000_000_000:
-        billions = n // 1_000_000_000
-        remainder = n % 1_000_000_000
-        
-        if billions == 1:
-            result = f"{BILLION} moja"
-        else:
-            result = f"{BILLION} {number_to_words(billions)}"
-        
-        if remainder > 0:
-            result += f" na {number_to_words(remainder)}"
-        return result
-    
-    # Handle millions
-    if n >= 1_000_000:
-        millions = n // 1_000_000
-        remainder = n % 1_000_000
-        
-        if millions == 1:
-            result = f"{MILLION} moja"
-        else:
-            result = f"{MILLION} {number_to_words(millions)}"
-        
-        if remainder > 0:
-            result += f" na {number_to_words(remainder)}"
-        return result
-    
-    # Handle thousands
-    if n >= 1000:
-        thousands = n // 1000
-        remainder = n % 1000
-        
-        if thousands == 1:
-            result = f"{THOUSAND} moja"
-        else:
-            result = f"{THOUSAND} {number_to_words(thousands)}"
-        
-        if remainder > 0:
-            result += f" na {number_to_words(remainder)}"
-        return result
-    
-    # Handle hundreds
-    if n >= 100:
-        hundreds = n // 100
-        remainder = n % 100
-        
-        if hundreds == 1:
-            result = f"{HUNDRED} moja"
-        else:
-            result = f"{HUNDRED} {number_to_words(hundreds)}"
+    if n < 1000:
+        return GROUP_WORDS[n]
+    
+    parts = []
+    
+    # Above the largest scale the count is itself read as a number
+    (scale, word), *smaller = SCALES
+    count, n = divmod(n, scale)
+    if count:
+        parts.append(f"{word} {number_to_words(count)}")
+    
+    for scale, word in smaller:
+        count, n = divmod(n, scale)
+        if count:
+            parts.append(f"{word} {GROUP_WORDS[count]}")
+    
+    if n:
+        parts.append(GROUP_WORDS[n])
+    
+    return CONJUNCTION.join(parts)
+
+
+class NumberReading:
+    """
+    Rule for reading a digit run as a cardinal or digit by digit.
+    
+    Args:
+        max_cardinal_digits (int): Longest run read as a cardinal, at most
+            MAX_CARDINAL_DIGITS
+        leading_zero_digits (int): Runs of at least this many digits that
+            start with 0 are read digit by digit; 0 disables the rule
+    """
+    
+    __slots__ = ('max_cardinal_digits', 'leading_zero_digits')
+    
+    def __init__(self, max_cardinal_digits=DEFAULT_MAX_CARDINAL_DIGITS,
+                 leading_zero_digits=DEFAULT_LEADING_ZERO_DIGITS):
+        if not 1 <= max_cardinal_digits <= MAX_CARDINAL_DIGITS:
+            raise ValueError(
+                f"max_cardinal_digits must be between 1 and {MAX_CARDINAL_DIGITS}, "
+                f"got {max_cardinal_digits}"
+            )
+        self.max_cardinal_digits = max_cardinal_digits
+        self.leading_zero_digits = leading_zero_digits
+    
+    def __reduce__(self):
+        return (type(self), (self.max_cardinal_digits, self.leading_zero_digits))
+    
+    def reads_digits(self, digits, leading_zeros=True):
+        """
+        Decide how to read a digit run.
         
-        if remainder > 0:
-            result += f" na {number_to_words(remainder)}"
-        return result
-    
-    # Handle 10-99
-    if n >= 10:
-        tens_digit = (n // 10) * 10
-        ones_digit = n % 10
+        Args:
+            digits (str): ASCII digits
+            leading_zeros (bool): Apply the leading-zero rule
+            
+        Returns:
+            bool: True to read digit by digit
+        """
+        length = len(digits)
+        if length > self.max_cardinal_digits:
+            return True
+        return (leading_zeros and 0 < self.leading_zero_digits <= length
+                and digits[0] == '0')
+
+
+DEFAULT_READING = NumberReading()
+
+# Word for each digit character
+DIGIT_WORDS = PACK.digit_words
+
+
+def read_digits(digits):
+    """
+    Read a digit string digit by digit, in linear time.
+    
+    Args:
+        digits (str): ASCII digits
         
-        if ones_digit == 0:
-            return TENS[tens_digit]
-        else:
-            return f"{TENS[tens_digit]} na {ONES[ones_digit]}"
+    Returns:
+        str: Space-separated digit words
+    """
+    return " ".join(map(DIGIT_WORDS.__getitem__, digits))
+
+
+def verbalize_integer(digits, reading=DEFAULT_READING, leading_zeros=True):
+    """
+    Convert a run of digits to Swahili words.
     
-    # Handle 1-9
-    return ONES[n]
+    Args:
+        digits (str): ASCII digits
+        reading (NumberReading): Cardinal or digit-by-digit rule
+        leading_zeros (bool): Apply the leading-zero rule
+        
+    Returns:
+        str: Verbalized number in Swahili
+    """
+    if reading.reads_digits(digits, leading_zeros):
+        return read_digits(digits)
+    return number_to_words(int(digits))
 
 
-def verbalize_number(number_str):
+def verbalize_number(number_str, reading=DEFAULT_READING):
     """
     Convert a number string to Swahili words.
     Handles integers and decimals.
     
     Args:
         number_str (str): String representation of a number
+        reading (NumberReading): When to read digit by digit
         
     Returns:
         str: Verbalized number in Swahili
@@ -142,15 +196,130 @@ def verbalize_number(number_str):
     # Handle decimal numbers
     if '.' in number_str:
         integer_part, decimal_part = number_str.split('.')
+        # Decimal digits are always read separately
+        return (f"{verbalize_integer(integer_part, reading)}{DECIMAL_POINT}"
+                f"{read_digits(decimal_part)}")
+    
+    # Handle integers
+    return verbalize_integer(number_str, reading)
+
+
+# Object-array tables for verbalize_numbers_array, built on first use
+_array_tables = None
+
+
+def _build_array_tables(np):
+    """
+    Build the group tables used by the NumPy path of verbalize_numbers_array.
+    
+    Args:
+        np: The numpy module
         
-        result = number_to_words(int(integer_part))
-        result += " nukta"
+    Returns:
+        tuple: Units table, then ``(alone, joined)`` tables per scale from
+        thousands up; each maps a group value 0-999 to its words, with '' for
+        0, and ``joined`` ends in the conjunction that links the smaller groups
+    """
+    units = np.array(("",) + GROUP_WORDS[1:], dtype=object)
+    scales = []
+    for _, word in reversed(SCALES):
+        alone = ("",) + tuple(f"{word} {group}" for group in GROUP_WORDS[1:])
+        scales.append((np.array(alone, dtype=object),
+                       np.array([f"{words}{CONJUNCTION}" for words in alone], dtype=object)))
+    return units, tuple(scales)
+
+
+def _verbalize_array(np, values):
+    """
+    Verbalize an integer array with vectorized group arithmetic.
+    
+    Repeated values are verbalized once. Each unique value is split into
+    three-digit groups, every group is looked up in a 1000-entry table, and
+    the groups are joined smallest first so that only values with a non-zero
+    group pay for a concatenation.
+    
+    Args:
+        np: The numpy module
+        values (numpy.ndarray): Integer array of at most 64 bits
         
-        # Read each decimal digit separately
-        for digit in decimal_part:
-            result += f" {ONES[int(digit)]}"
+    Returns:
+        numpy.ndarray: Object array of words with the shape of ``values``
+    """
+    global _array_tables
+    if _array_tables is None:
+        _array_tables = _build_array_tables(np)
+    units, scales = _array_tables
+    
+    flat, inverse = np.unique(values.ravel(), return_inverse=True)
+    magnitude = flat.astype(np.uint64)
+    negative = None
+    if np.issubdtype(flat.dtype, np.signedinteger):
+        negative = flat < 0
+        if negative.any():
+            # -(x + 1) + 1 also holds the magnitude of the smallest value
+            magnitude[negative] = (-(flat[negative] + 1)).astype(np.uint64) + 1
+        else:
+            negative = None
+    
+    group = magnitude % 1000
+    magnitude //= 1000
+    words = units[group]
+    nonzero_below = group != 0
+    # A uint64 has at most seven groups, so every count is below 1000
+    for alone_table, joined_table in scales:
+        group = magnitude % 1000
+        magnitude //= 1000
+        nonzero = group != 0
+        joined = nonzero & nonzero_below
+        words[joined] = joined_table[group[joined]] + words[joined]
+        alone = nonzero & ~nonzero_below
+        words[alone] = alone_table[group[alone]]
+        nonzero_below |= nonzero
+    
+    words[~nonzero_below] = ONES[0]
+    if negative is not None:
+        words[negative] = NEGATIVE + words[negative]
+    return words[inverse].reshape(values.shape)
+
+
+def verbalize_numbers_array(values):
+    """
+    Convert many integers to Swahili words at once.
+    
+    With NumPy installed, integer arrays of up to 64 bits are split into
+    three-digit groups with vectorized arithmetic and assembled from table
+    lookups, which is much faster than calling ``number_to_words`` in a
+    loop. Without NumPy, or for Python ints beyond 64 bits, each value goes
+    through ``number_to_words``. Either way the words match
+    ``number_to_words`` element for element.
+    
+    Args:
+        values: NumPy integer array, or an iterable of ints
         
-        return result
+    Returns:
+        numpy.ndarray or list: An object array with the input's shape for
+        NumPy arrays, otherwise a list of strings
+        
+    Raises:
+        TypeError: If a NumPy array does not hold integers
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
     
-    # Handle integers
-    return number_to_words(int(number_str))
\ No newline at end of file
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype == object:
+            words = [number_to_words(int(value)) for value in values.ravel()]
+            return np.array(words, dtype=object).reshape(values.shape)
+        if not np.issubdtype(values.dtype, np.integer):
+            raise TypeError(f"Expected an integer array, got dtype {values.dtype}")
+        return _verbalize_array(np, values)
+    
+    values = list(values)
+    if np is not None and values:
+        array = np.asarray(values)
+        # Python ints beyond 64 bits give an object array
+        if np.issubdtype(array.dtype, np.integer):
+            return _verbalize_array(np, array).tolist()
+    return [number_to_words(int(value)) for value in values]
@@ -6,9 +6,23 @@ Swahili time verbalization.
 Handles conversion of time expressions to Swahili words.
 In Swahili, time is counted from sunrise (7 AM = saa moja, 1 PM = saa saba, etc.)
 For simplicity and clarity in TTS, we'll use the standard clock hours with 'saa' prefix.
+
+Times of day are looked up in a table of all 1,440 minutes plus a table of
+seconds, compiled with the language pack; anything outside the clock (e.g.
+"25:75") goes through the computed path.
 """
 
-from .number import number_to_words
+from .config import PACK
+from .number import CONJUNCTION, number_to_words
+
+
+# Suffix for 12-hour times
+PERIOD_WORDS = PACK.periods
+
+# "saa", "dakika" and "sekunde"
+HOUR = PACK.time_words['hour']
+MINUTE = PACK.time_words['minute']
+SECOND = PACK.time_words['second']
 
 
 def verbalize_time_24h(hours, minutes, seconds=None):
@@ -23,13 +37,13 @@ def verbalize_time_24h(hours, minutes, seconds=None):
     Returns:
         str: Verbalized time in Swahili
     """
-    result = f"saa {number_to_words(hours)}"
+    result = f"{HOUR} {number_to_words(hours)}"
     
     if minutes > 0:
-        result += f" na dakika {number_to_words(minutes)}"
+        result += f"{CONJUNCTION}{MINUTE} {number_to_words(minutes)}"
     
     if seconds is not None and seconds > 0:
-        result += f" na sekunde {number_to_words(seconds)}"
+        result += f"{CONJUNCTION}{SECOND} {number_to_words(seconds)}"
     
     return result
 
@@ -55,19 +69,16 @@ def verbalize_time_12h(hours, minutes, period, seconds=None):
     else:
         hours_24 = hours
     
-    result = f"saa {number_to_words(hours_24)}"
+    result = f"{HOUR} {number_to_words(hours_24)}"
     
     if minutes > 0:
-        result += f" na dakika {number_to_words(minutes)}"
+        result += f"{CONJUNCTION}{MINUTE} {number_to_words(minutes)}"
     
     if seconds is not None and seconds > 0:
-        result += f" na sekunde {number_to_words(seconds)}"
+        result += f"{CONJUNCTION}{SECOND} {number_to_words(seconds)}"
     
     # Optionally add period indicator
-    if period.upper() == 'AM':
-        result += " asubuhi"
-    else:
-        result += " jioni"
+    result += PERIOD_WORDS['AM' if period.upper() == 'AM' else 'PM']
     
     return result
 
@@ -97,8 +108,98 @@ def verbalize_time(time_str):
     minutes = int(parts[1]) if len(parts) > 1 else 0
     seconds = int(parts[2]) if len(parts) > 2 else None
     
-    # Verbalize based on format
+    return verbalize_time_parts(hours, minutes, seconds, period)
+
+
+class TimeTable:
+    """
+    Lookup table resolving a time of day straight to its words.
+    
+    Holds "saa ... na dakika ..." for every minute of the day and
+    " na sekunde ..." for every second; a time with seconds or a period
+    is one or two concatenations away. The tables come compiled with the
+    language pack and are attached on the first lookup, or up front with
+    :meth:`build`.
+    """
+    
+    def __init__(self):
+        self._clock = None
+        self._seconds = None
+    
+    @property
+    def built(self):
+        """Whether the tables have been attached."""
+        return self._clock is not None
+    
+    def build(self):
+        """
+        Attach the tables now, e.g. at startup in a latency-sensitive server.
+        
+        Returns:
+            TimeTable: self
+        """
+        if self._clock is None:
+            # Publish the seconds first: readers check the clock only
+            self._seconds = PACK.seconds
+            self._clock = PACK.clock
+        return self
+    
+    def lookup(self, hours, minutes, seconds=None, period=None):
+        """
+        Look a time up.
+        
+        Args:
+            hours (int): Hour as written
+            minutes (int): Minutes
+            seconds (int, optional): Seconds
+            period (str, optional): 'AM' or 'PM'
+            
+        Returns:
+            str or None: Verbalized time, or None outside the tables
+        """
+        clock = self._clock
+        if clock is None:
+            clock = self.build()._clock
+        if period is not None:
+            if period == 'PM' and hours != 12:
+                hours += 12
+            elif period == 'AM' and hours == 12:
+                hours = 0
+        if hours >= 24 or minutes >= 60:
+            return None
+        words = clock[hours * 60 + minutes]
+        if seconds:
+            if seconds >= 60:
+                return None
+            words += self._seconds[seconds]
+        if period is not None:
+            words += PERIOD_WORDS[period]
+        return words
+
+
+# Shared by every verbalizer; the time domain has no configuration
+TIME_TABLE = TimeTable()
+
+
+def verbalize_time_parts(hours, minutes, seconds=None, period=None):
+    """
+    Convert parsed time components to Swahili words.
+    
+    Uses TIME_TABLE and falls back to the computed path for components
+    outside the clock.
+    
+    Args:
+        hours (int): Hour as written
+        minutes (int): Minutes
+        seconds (int, optional): Seconds
+        period (str, optional): 'AM' or 'PM', upper case
+        
+    Returns:
+        str: Verbalized time in Swahili
+    """
+    words = TIME_TABLE.lookup(hours, minutes, seconds, period)
+    if words is not None:
+        return words
     if period:
         return verbalize_time_12h(hours, minutes, period, seconds)
-    else:
-        return verbalize_time_24h(hours, minutes, seconds)
\ No newline at end of file
+    return verbalize_time_24h(hours, minutes, seconds)
@@ -0,0 +1,222 @@
+"""
+Memory-mapped lexicons of precomputed word forms.
+
+A lexicon file holds sections of consecutive integer keys, such as the
+numbers 0-1,000,000 or the 1,440 minutes of the day, each with the words
+for its keys. The layout is simple enough to read from any language; all
+integers are little-endian:
+
+    header    magic b"VLEX", version (u16), section count (u16),
+              blob offset (u64), blob size (u64), tag (32 bytes)
+    sections  per section: name (16 bytes, ASCII, NUL-padded), first key
+              (i64), count (u64), index offset (u64)
+    indexes   per section: count + 1 offsets (u32) into the blob; the
+              words for key ``first + i`` are blob[offsets[i]:offsets[i + 1]]
+    blob      the words of every section, UTF-8, back to back
+
+The tag records what the words were built from, e.g. the hash of a language
+pack, so that a reader can refuse a stale file.
+
+:class:`Lexicon` maps the file instead of reading it: a lookup reads two
+offsets and one slice, in constant time, and pages are loaded by the
+operating system as they are touched and shared by every process that maps
+the same file.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+
+MAGIC = b'VLEX'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHHQQ32s')
+_SECTION = struct.Struct('<16sqQQ')
+
+# Offsets are u32, so the blob is limited to 4 GiB
+MAX_BLOB_SIZE = 2 ** 32 - 1
+
+
+def write_lexicon(path, sections, tag=b''):
+    """
+    Write a lexicon file.
+
+    The file is written to a temporary file and renamed, so readers never
+    see a partial lexicon.
+
+    Args:
+        path (str): Output file
+        sections (dict): Section name -> ``(first, words)``, where ``words``
+            is an iterable of strings for the keys ``first``, ``first + 1``,
+            and so on
+        tag (bytes): Up to 32 bytes identifying the source of the words
+
+    Raises:
+        ValueError: If a name or the tag is too long, or the words exceed
+            the format's 4 GiB
+    """
+    if len(tag) > 32:
+        raise ValueError(f"Lexicon tag is longer than 32 bytes: {tag!r}")
+    blob = bytearray()
+    indexes = []
+    for name, (first, words) in sections.items():
+        if len(name.encode('ascii')) > 16:
+            raise ValueError(f"Lexicon section name is longer than 16 characters: {name!r}")
+        offsets = array('I', [0])
+        for word in words:
+            blob += word.encode('utf-8')
+            if len(blob) > MAX_BLOB_SIZE:
+                raise ValueError("Lexicon words exceed 4 GiB")
+            offsets.append(len(blob))
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        indexes.append((name, first, offsets.tobytes()))
+
+    position = _HEADER.size + _SECTION.size * len(indexes)
+    table = []
+    for name, first, offsets in indexes:
+        table.append(_SECTION.pack(name.encode('ascii'), first, len(offsets) // 4 - 1, position))
+        position += len(offsets)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(indexes), position, len(blob), tag))
+            f.writelines(table)
+            f.writelines(offsets for _, _, offsets in indexes)
+            f.write(blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class Lexicon:
+    """
+    Read-only view of a lexicon file.
+
+    Safe to share between threads. Pickles as its path, so a worker process
+    maps the file again instead of copying it.
+
+    Args:
+        path (str): Lexicon file
+
+    Raises:
+        ValueError: If the file is not a lexicon
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path}: empty lexicon file") from None
+        self._views = []
+        try:
+            magic, version, count, blob, blob_size, tag = _HEADER.unpack_from(self._map)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a version {VERSION} lexicon file")
+            if blob + blob_size > len(self._map):
+                raise ValueError(f"{path}: truncated lexicon file")
+            self.tag = tag.rstrip(b'\0')
+            self._blob = blob
+            self.sections = {}
+            for i in range(count):
+                name, first, size, index = _SECTION.unpack_from(
+                    self._map, _HEADER.size + i * _SECTION.size)
+                if index + 4 * (size + 1) > blob:
+                    raise ValueError(f"{path}: corrupt lexicon section table")
+                self.sections[name.rstrip(b'\0').decode('ascii')] = (
+                    first, size, self._offsets(index, size + 1))
+        except (struct.error, ValueError):
+            self.close()
+            raise
+
+    def _offsets(self, index, count):
+        """Return a sequence of the ``count`` u32 offsets at ``index``."""
+        if sys.byteorder == 'little':
+            view = memoryview(self._map)[index:index + 4 * count].cast('I')
+            self._views.append(view)
+            return view
+        # Big-endian hosts decode the offsets once
+        return array('I', struct.unpack_from(f'<{count}I', self._map, index))
+
+    def __reduce__(self):
+        return (type(self), (self.path,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmap the file."""
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._map.close()
+
+    def range(self, section):
+        """
+        Return the keys a section covers.
+
+        Args:
+            section (str): Section name
+
+        Returns:
+            range: Its keys, empty if the section does not exist
+        """
+        first, size, _ = self.sections.get(section, (0, 0, 0))
+        return range(first, first + size)
+
+    def get(self, section, key):
+        """
+        Look the words for a key up.
+
+        Args:
+            section (str): Section name, e.g. 'number'
+            key (int): Key
+
+        Returns:
+            str or None: The words, or None if the section does not cover
+            the key
+        """
+        found = self.sections.get(section)
+        if found is None:
+            return None
+        first, size, offsets = found
+        key -= first
+        if not 0 <= key < size:
+            return None
+        blob = self._blob
+        return self._map[blob + offsets[key]:blob + offsets[key + 1]].decode('utf-8')
+
+    def lookup(self, section):
+        """
+        Return a function looking keys up in one section, for hot loops.
+
+        Args:
+            section (str): Section name
+
+        Returns:
+            callable: ``key -> str or None``, like :meth:`get`
+        """
+        first, size, offsets = self.sections.get(section, (0, 0, None))
+        data = self._map
+        blob = self._blob
+
+        def get(key):
+            key -= first
+            if not 0 <= key < size:
+                return None
+            return data[blob + offsets[key]:blob + offsets[key + 1]].decode('utf-8')
+
+        return get
@@ -0,0 +1,413 @@
+"""
+Streaming normalization of TSV/CSV speech manifests.
+
+Manifests (audio path, duration, transcript, ...) are read record by record
+and normalized in batches, so memory use stays the same however large the
+file is. Only the chosen columns are rewritten: every other cell, every
+delimiter and every line ending is copied byte for byte, and a rewritten
+cell keeps its original quoting.
+
+    from verbalizer import get_verbalizer
+    from verbalizer.manifest import normalize_manifest
+
+    normalize_manifest(get_verbalizer('sw'), 'train.csv', 'train.norm.csv',
+                       columns=['transcript'], dialect='csv', header=True)
+"""
+
+import os
+
+from .batch import run_batches
+
+# Dialect -> (delimiter, quote character or '' for no quoting). TSV manifests
+# usually carry raw quotes in transcripts, so TSV quoting is off by default
+DIALECTS = {
+    'tsv': ('\t', ''),
+    'csv': (',', '"'),
+}
+
+DEFAULT_BATCH_ROWS = 1000
+
+# Longest record, in bytes; guards against an unterminated quote swallowing
+# the rest of the file
+MAX_RECORD_BYTES = 16 * 1024 * 1024
+
+ORIGINAL_SUFFIX = '_original'
+
+
+def _ends_quoted(line, delimiter, quotechar, quoted):
+    """
+    Scan one physical line of a record.
+
+    Works on str and on bytes alike, since the delimiter and quote character
+    are ASCII.
+
+    Args:
+        line: The line
+        delimiter: Field delimiter, of the same type as ``line``
+        quotechar: Quote character, of the same type as ``line``
+        quoted (bool): Whether the line starts inside a quoted field
+
+    Returns:
+        bool: Whether the line ends inside a quoted field
+    """
+    pos = 0
+    length = len(line)
+    while pos < length:
+        if quoted:
+            end = line.find(quotechar, pos)
+            if end < 0:
+                return True
+            if line[end + 1:end + 2] == quotechar:
+                pos = end + 2
+                continue
+            quoted = False
+            pos = end + 1
+        elif line[pos:pos + 1] == quotechar:
+            quoted = True
+            pos += 1
+            continue
+        end = line.find(delimiter, pos)
+        if end < 0:
+            return quoted
+        pos = end + 1
+    return quoted
+
+
+def iter_records(stream, delimiter='\t', quotechar='', stats=None):
+    """
+    Read records from a binary stream.
+
+    A record is one line, or several when a quoted field spans line breaks.
+
+    Args:
+        stream: Binary file object
+        delimiter (str): Field delimiter
+        quotechar (str): Quote character, or '' for no quoting
+        stats (dict, optional): Updated with the ``lines`` (records) and
+            ``bytes`` read
+
+    Yields:
+        bytes: Raw records, including their line endings
+
+    Raises:
+        ValueError: If a quoted field is not closed within MAX_RECORD_BYTES
+    """
+    if stats is None:
+        stats = {'lines': 0, 'bytes': 0}
+    delimiter = delimiter.encode('ascii')
+    quote = quotechar.encode('ascii')
+    parts = []
+    size = 0
+    quoted = False
+    for line in stream:
+        stats['bytes'] += len(line)
+        if quote and (quoted or quote in line):
+            quoted = _ends_quoted(line, delimiter, quote, quoted)
+            if quoted:
+                parts.append(line)
+                size += len(line)
+                if size > MAX_RECORD_BYTES:
+                    raise ValueError(
+                        f"Unterminated quoted field in record {stats['lines'] + 1}"
+                    )
+                continue
+        stats['lines'] += 1
+        if parts:
+            parts.append(line)
+            line = b''.join(parts)
+            parts = []
+            size = 0
+        yield line
+    if parts:
+        # A quote left open at the end of the file: pass the rest through
+        stats['lines'] += 1
+        yield b''.join(parts)
+
+
+def split_fields(body, delimiter='\t', quotechar=''):
+    """
+    Split a record into its raw cells, quotes included.
+
+    Args:
+        body (str): Record without its line ending
+        delimiter (str): Field delimiter
+        quotechar (str): Quote character, or '' for no quoting
+
+    Returns:
+        list: Raw cell strings; joining them with ``delimiter`` gives ``body``
+    """
+    if not quotechar or quotechar not in body:
+        return body.split(delimiter)
+    cells = []
+    start = pos = 0
+    quoted = False
+    length = len(body)
+    while True:
+        if quoted:
+            end = body.find(quotechar, pos)
+            if end < 0:
+                break
+            if body[end + 1:end + 2] == quotechar:
+                pos = end + 2
+                continue
+            quoted = False
+            pos = end + 1
+        elif body[pos:pos + 1] == quotechar:
+            quoted = True
+            pos += 1
+            continue
+        end = body.find(delimiter, pos)
+        if end < 0:
+            break
+        cells.append(body[start:end])
+        start = pos = end + 1
+        if pos == length:
+            break
+    cells.append(body[start:])
+    return cells
+
+
+def unquote(cell, quotechar=''):
+    """
+    Return the value of a raw cell.
+
+    Returns:
+        tuple: ``(value, quoted)``
+    """
+    if quotechar and len(cell) >= 2 and cell[0] == quotechar and cell[-1] == quotechar:
+        return cell[1:-1].replace(quotechar * 2, quotechar), True
+    return cell, False
+
+
+def quote(value, quotechar='', delimiter='\t', quoted=False):
+    """
+    Encode a value as a raw cell.
+
+    Args:
+        value (str): Cell value
+        quotechar (str): Quote character, or '' for no quoting
+        delimiter (str): Field delimiter
+        quoted (bool): Whether the original cell was quoted; unquoted cells
+            are only quoted when the value needs it
+
+    Returns:
+        str: Raw cell
+    """
+    if not quotechar:
+        return value
+    if quoted or quotechar in value or delimiter in value or '\n' in value or '\r' in value:
+        return quotechar + value.replace(quotechar, quotechar * 2) + quotechar
+    return value
+
+
+class ManifestNormalizer:
+    """
+    Normalize chosen columns of raw manifest records and count matches.
+
+    Has the same ``normalize_lines`` interface as the CLI's record
+    normalizer, so batches can be spread over the same worker pool.
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        columns (list): Zero-based indexes of the columns to normalize
+        delimiter (str): Field delimiter
+        quotechar (str): Quote character, or '' for no quoting
+        keep_original (bool): Append the original cell of every normalized
+            column to the record
+    """
+
+    def __init__(self, normalizer, columns, delimiter='\t', quotechar='', keep_original=False):
+        self.normalizer = normalizer
+        self.columns = list(columns)
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.keep_original = keep_original
+
+    def normalize_cells(self, cells):
+        """
+        Normalize the chosen cells of a split record in place.
+
+        Args:
+            cells (list): Raw cells
+
+        Returns:
+            list: ``cells``, with original cells appended if requested
+        """
+        normalize = self.normalizer.normalize
+        originals = []
+        for column in self.columns:
+            if column < len(cells):
+                cell = cells[column]
+                value, quoted = unquote(cell, self.quotechar)
+                cells[column] = quote(normalize(value), self.quotechar, self.delimiter, quoted)
+            else:
+                cell = ''
+            originals.append(cell)
+        if self.keep_original:
+            cells.extend(originals)
+        return cells
+
+    def normalize_line(self, line):
+        """
+        Normalize one raw record.
+
+        Args:
+            line (bytes): Input record, including its line ending
+
+        Returns:
+            bytes: Output record with the same line ending
+        """
+        text = line.decode('utf-8')
+        body = text.rstrip('\r\n')
+        if not body:
+            return line
+        cells = split_fields(body, self.delimiter, self.quotechar)
+        ending = text[len(body):]
+        return (self.delimiter.join(self.normalize_cells(cells)) + ending).encode('utf-8')
+
+    def normalize_lines(self, lines):
+        """
+        Normalize a batch of raw records.
+
+        Returns:
+            tuple: ``(output records, Counter of matches per category)``
+        """
+        with self.normalizer.collect_stats() as stats:
+            lines = [self.normalize_line(line) for line in lines]
+        return lines, stats.matches
+
+
+def resolve_columns(columns, header_cells=None, quotechar=''):
+    """
+    Turn column names and indexes into zero-based indexes.
+
+    Args:
+        columns (iterable): Column indexes (int, or str of digits) or header
+            names
+        header_cells (list, optional): Raw header cells
+        quotechar (str): Quote character of the header
+
+    Returns:
+        list: Column indexes
+
+    Raises:
+        ValueError: If a name is given without a header, or is not in it
+    """
+    names = None
+    if header_cells is not None:
+        names = [unquote(cell, quotechar)[0] for cell in header_cells]
+    indexes = []
+    for column in columns:
+        if isinstance(column, int) or column.isdigit():
+            indexes.append(int(column))
+        elif names is None:
+            raise ValueError(f"Column '{column}' is a name, but the manifest has no header")
+        elif column not in names:
+            raise ValueError(f"Column '{column}' is not in the header: {', '.join(names)}")
+        else:
+            indexes.append(names.index(column))
+    return indexes
+
+
+def header_line(line, columns, delimiter='\t', quotechar='', keep_original=False):
+    """
+    Return the header record for the output.
+
+    The header is copied through, with ``<name>_original`` cells appended
+    when the original text is kept.
+
+    Args:
+        line (bytes): Input header record
+
+    Returns:
+        bytes: Output header record
+    """
+    if not keep_original:
+        return line
+    text = line.decode('utf-8')
+    body = text.rstrip('\r\n')
+    cells = split_fields(body, delimiter, quotechar)
+    for column in columns:
+        name = unquote(cells[column], quotechar) if column < len(cells) else (str(column), False)
+        cells.append(quote(name[0] + ORIGINAL_SUFFIX, quotechar, delimiter, name[1]))
+    return (delimiter.join(cells) + text[len(body):]).encode('utf-8')
+
+
+def _batches(records, batch_rows):
+    """Group records into lists of ``batch_rows``."""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_rows:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def normalize_manifest(normalizer, src, dst, columns, dialect='tsv', delimiter=None,
+                       quotechar=None, header=False, keep_original=False, workers=1,
+                       batch_rows=DEFAULT_BATCH_ROWS, ordered=True):
+    """
+    Stream a TSV/CSV manifest through the normalizer.
+
+    Records are read incrementally and normalized in batches of
+    ``batch_rows``, inline or over ``workers`` processes with a bounded
+    number of batches in flight, so memory use does not grow with the file.
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        src: Input path, or a binary file object opened for reading
+        dst: Output path, or a binary file object opened for writing
+        columns (iterable): Columns to normalize, as zero-based indexes or,
+            with a header, names
+        dialect (str): 'tsv' (tab-separated, no quoting) or 'csv'
+            (comma-separated, double quotes)
+        delimiter (str, optional): Override the dialect's delimiter
+        quotechar (str, optional): Override the dialect's quote character;
+            '' turns quoting off
+        header (bool): The first record is a header; it is copied through
+        keep_original (bool): Append the original text of every normalized
+            column as an extra column, named ``<name>_original`` in the header
+        workers (int): Worker processes; 1 runs inline
+        batch_rows (int): Records per batch
+        ordered (bool): Keep the input order
+
+    Returns:
+        dict: ``lines`` (records read, header included), ``bytes`` read and
+        ``matches`` (Counter of matches per category)
+
+    Raises:
+        ValueError: For an unknown dialect or column
+    """
+    options = dict(columns=columns, dialect=dialect, delimiter=delimiter, quotechar=quotechar,
+                   header=header, keep_original=keep_original, workers=workers,
+                   batch_rows=batch_rows, ordered=ordered)
+    if isinstance(src, (str, os.PathLike)):
+        with open(src, 'rb') as stream:
+            return normalize_manifest(normalizer, stream, dst, **options)
+    if isinstance(dst, (str, os.PathLike)):
+        with open(dst, 'wb') as out:
+            return normalize_manifest(normalizer, src, out, **options)
+
+    if dialect not in DIALECTS:
+        raise ValueError(f"Unknown dialect '{dialect}'. Use one of: {', '.join(DIALECTS)}")
+    default_delimiter, default_quotechar = DIALECTS[dialect]
+    delimiter = default_delimiter if delimiter is None else delimiter
+    quotechar = default_quotechar if quotechar is None else quotechar
+
+    stats = {'lines': 0, 'bytes': 0}
+    records = iter_records(src, delimiter, quotechar, stats)
+    header_cells = None
+    if header:
+        first = next(records, None)
+        if first is not None:
+            header_cells = split_fields(first.decode('utf-8').rstrip('\r\n'), delimiter, quotechar)
+    indexes = resolve_columns(columns, header_cells, quotechar)
+    if header_cells is not None:
+        dst.write(header_line(first, indexes, delimiter, quotechar, keep_original))
+    manifest = ManifestNormalizer(normalizer, indexes, delimiter, quotechar, keep_original)
+    stats['matches'] = run_batches(manifest, _batches(records, batch_rows), dst,
+                                   workers=workers, ordered=ordered)
+    dst.flush()
+    return stats
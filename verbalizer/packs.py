@@ -0,0 +1,476 @@
+"""
+Declarative language packs.
+
+A language pack is a JSON file holding a language's words and pattern
+fragments: digits, tens, scale words, currencies, months, time and date
+words, and the detection regexes. :func:`compile_pack` turns it into
+ready-to-use lookup tables (every number from 0 to 999, every minute of the
+day, every day of the year, ...) and :func:`load_pack` caches the compiled
+tables on disk, keyed on a hash of the pack's content, so later imports only
+read them back.
+
+Phrases follow the scale-first order of Swahili and related languages:
+"mia tano na elfu mbili", "saa kumi na dakika tano". A pack only supplies the
+words.
+
+Pack layout::
+
+    {
+      "language": "sw",
+      "numbers": {"ones": [10 words], "tens": [words for 10-90],
+                  "hundred": "mia", "scales": [["elfu", 3], ["milioni", 6]],
+                  "conjunction": "na", "negative": "hasi",
+                  "decimal_point": "nukta"},
+      "currencies": {"KES": {"name": "shilingi", "subunit": "senti",
+                             "symbols": ["KSh", "Ksh"]}},
+      "currency_codes": "iso4217",
+      "months": [12 names],
+      "time": {"hour": "saa", "minute": "dakika", "second": "sekunde",
+               "periods": {"AM": "asubuhi", "PM": "jioni"}},
+      "date": {"day": "tarehe", "month": "mwezi wa", "year": "mwaka",
+               "month_number": "mwezi"},
+      "fragments": {"amount": "\\\\d+(?:\\\\.\\\\d{1,2})?"},
+      "patterns": {"currency": {"regex": "({currency_prefix})\\\\s*({amount})\\\\b"}},
+      "warmup": ["Nina KES 1500.50 saa 14:30"]
+    }
+
+In a pattern, ``{name}`` is replaced by the fragment ``name``.
+``{currency_codes}`` matches any currency form: the pack's codes in any
+case, their ``symbols`` and, with ``currency_codes``, every code of that
+table exactly (see verbalizer.currencies). ``{currency_prefix}`` and
+``{currency_suffix}`` match them with the word boundary they need before or
+after an amount; ``{currency_suffix}`` leaves out the table codes the pack
+has no words for, which would only be moved in front of the amount
+(``20 ALL``), and takes the pack's codes in upper or title case only, as
+after a number a lower-case word is mostly not a currency (``5 zar``).
+
+The optional ``warmup`` sentences are what a server normalizes before it
+takes traffic (see BaseNormalizer.warmup). The compiled ``currency_index`` maps every form to its code.
+
+The detector re-runs a pattern at the edges of higher-priority spans with
+one character of context, so lookbehinds may look at most one character
+back, and a pattern may look past the end of its match only across
+whitespace.
+"""
+
+import hashlib
+import marshal
+import os
+import re
+import sys
+
+from .detector import pattern_hints
+
+# Version of the compiled layout
+PACK_FORMAT = 3
+
+# Modules whose code shapes the compiled tables. Their source and the
+# library version are part of the cache key, so changing the compiler
+# recompiles packs without a PACK_FORMAT bump
+COMPILER_MODULES = ('packs.py', 'currencies.py', 'detector.py')
+
+# Compiled builds kept per language and interpreter; older ones are deleted
+# when a new one is written. Two cover switching between two installs that
+# share the cache directory.
+KEPT_BUILDS = 2
+
+CACHE_DIR_ENV = 'VERBALIZER_CACHE_DIR'
+
+# Fragment reference in a pattern; compiled on first use by the re cache
+_FRAGMENT = r'\{([A-Za-z_]\w*)\}'
+
+# Plain ints: marshal does not take RegexFlag
+_FLAGS = {'IGNORECASE': int(re.IGNORECASE), 'MULTILINE': int(re.MULTILINE), 'VERBOSE': int(re.VERBOSE)}
+
+# Largest scale: three-digit groups up to 10^18
+MAX_SCALE_EXPONENT = 18
+
+# Tables only needed by the time and date lookups; a cached pack keeps them
+# marshalled until first use, which keeps importing a language cheap
+LAZY_TABLES = ('clock', 'seconds', 'date_prefixes')
+
+
+class PackError(ValueError):
+    """A language pack is malformed."""
+
+
+def pack_cache_dir():
+    """
+    Return the directory holding compiled packs.
+
+    ``$VERBALIZER_CACHE_DIR`` if set, otherwise ``verbalizer/packs`` under
+    ``$XDG_CACHE_HOME`` or ``~/.cache``.
+
+    Returns:
+        str: Directory path; it may not exist yet
+    """
+    path = os.environ.get(CACHE_DIR_ENV)
+    if path:
+        return path
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'verbalizer', 'packs')
+
+
+def _require(section, key, kind, where):
+    """Return ``section[key]``, checking that it is present and of ``kind``."""
+    if not isinstance(section, dict) or key not in section:
+        raise PackError(f"Missing '{key}' in {where}")
+    value = section[key]
+    if not isinstance(value, kind):
+        raise PackError(f"'{key}' in {where} must be a {kind.__name__}")
+    return value
+
+
+def _words(section, key, count, where):
+    """Return a list of exactly ``count`` strings."""
+    words = _require(section, key, list, where)
+    if len(words) != count or not all(isinstance(word, str) for word in words):
+        raise PackError(f"'{key}' in {where} must list {count} words")
+    return words
+
+
+def _group_words(ones, tens, hundred, join):
+    """Words for every number from 0 to 999."""
+    words = list(ones)
+    for n in range(10, 100):
+        tens_words = tens[n // 10 - 1]
+        words.append(tens_words if n % 10 == 0 else f"{tens_words}{join}{ones[n % 10]}")
+    for n in range(100, 1000):
+        hundreds, remainder = divmod(n, 100)
+        result = f"{hundred} {words[hundreds]}"
+        if remainder:
+            result += f"{join}{words[remainder]}"
+        words.append(result)
+    return tuple(words)
+
+
+def _patterns(spec, currencies, table):
+    """Expand pattern fragments into ``{category: (regex, flags)}``."""
+    from .currencies import currency_regex
+
+    symbols = [symbol for currency in currencies.values() for symbol in currency['symbols']]
+    forms = symbols + [code for code in table if code not in currencies]
+    fragments = dict(spec.get('fragments', {}))
+    fragments['currency_codes'] = currency_regex(currencies, forms, any_case=True)
+    fragments['currency_prefix'] = currency_regex(currencies, forms, 'prefix', any_case=True)
+    fragments['currency_suffix'] = currency_regex(currencies, symbols, 'suffix')
+
+    def expand(match):
+        name = match.group(1)
+        if name not in fragments:
+            raise PackError(f"Unknown pattern fragment '{name}'")
+        return fragments[name]
+
+    patterns = {}
+    for category, pattern in _require(spec, 'patterns', dict, 'the pack').items():
+        regex = re.sub(_FRAGMENT, expand, _require(pattern, 'regex', str, f"pattern '{category}'"))
+        flags = 0
+        for flag in pattern.get('flags', ()):
+            if flag not in _FLAGS:
+                raise PackError(f"Unknown flag '{flag}' in pattern '{category}'")
+            flags |= _FLAGS[flag]
+        try:
+            re.compile(regex, flags)
+        except re.error as error:
+            raise PackError(f"Invalid pattern '{category}': {error}") from None
+        patterns[category] = (regex, flags)
+    return patterns
+
+
+def compile_pack(spec):
+    """
+    Compile a parsed language pack into lookup tables.
+
+    The result holds only plain data (strings, numbers, tuples and dicts),
+    so it can be cached with marshal; regexes are kept as ``(source, flags)``.
+    The large tables are flat tuples, which load several times faster than
+    dicts with tuple keys: ``clock[hours * 60 + minutes]`` and
+    ``date_prefixes[(month - 1) * 31 + day - 1]``.
+
+    Args:
+        spec (dict): Parsed pack
+
+    Returns:
+        dict: Compiled tables, see LanguagePack
+
+    Raises:
+        PackError: If the pack is malformed
+    """
+    if not isinstance(spec, dict):
+        raise PackError("A language pack must be a JSON object")
+    language = _require(spec, 'language', str, 'the pack')
+
+    numbers = _require(spec, 'numbers', dict, 'the pack')
+    ones = _words(numbers, 'ones', 10, 'numbers')
+    tens = _words(numbers, 'tens', 9, 'numbers')
+    hundred = _require(numbers, 'hundred', str, 'numbers')
+    join = f" {_require(numbers, 'conjunction', str, 'numbers')} "
+    scales = _require(numbers, 'scales', list, 'numbers')
+    exponents = [scale[1] if isinstance(scale, list) and len(scale) == 2 else None for scale in scales]
+    if not scales or exponents != list(range(3, 3 * len(scales) + 1, 3)) or exponents[-1] > MAX_SCALE_EXPONENT:
+        raise PackError(f"'scales' in numbers must be [word, exponent] pairs for 10^3, 10^6, ... "
+                        f"up to 10^{MAX_SCALE_EXPONENT}")
+    group_words = _group_words(ones, tens, hundred, join)
+
+    # Imported here: cached packs never need the code tables
+    from .currencies import CODE_TABLES
+
+    currencies = {}
+    currency_index = {}
+    for code, currency in _require(spec, 'currencies', dict, 'the pack').items():
+        where = f"currency '{code}'"
+        name = _require(currency, 'name', str, where)
+        symbols = currency.get('symbols', [])
+        if not isinstance(symbols, list) or not all(isinstance(symbol, str) and symbol for symbol in symbols):
+            raise PackError(f"'symbols' in {where} must be a list of strings")
+        currencies[code] = {
+            'name': name,
+            'singular': currency.get('singular', name),
+            'plural': currency.get('plural', name),
+            'subunit': _require(currency, 'subunit', str, where),
+            'symbol': currency.get('symbol', code),
+            'symbols': tuple(symbols),
+        }
+        currency_index[code] = code
+        for symbol in symbols:
+            if currency_index.setdefault(symbol, code) != code:
+                raise PackError(f"Symbol '{symbol}' is used by both {currency_index[symbol]} and {code}")
+    table = spec.get('currency_codes')
+    if table is not None and table not in CODE_TABLES:
+        raise PackError(f"Unknown currency code table '{table}'")
+    table = CODE_TABLES[table] if table else ()
+    for code in table:
+        currency_index.setdefault(code, code)
+
+    months = dict(enumerate(_words(spec, 'months', 12, 'the pack'), start=1))
+
+    time = _require(spec, 'time', dict, 'the pack')
+    hour = _require(time, 'hour', str, 'time')
+    minute = _require(time, 'minute', str, 'time')
+    second = _require(time, 'second', str, 'time')
+    periods = _require(time, 'periods', dict, 'time')
+    if set(periods) != {'AM', 'PM'}:
+        raise PackError("'periods' in time must give the AM and PM words")
+    clock = []
+    for hours in range(24):
+        hour_words = f"{hour} {group_words[hours]}"
+        clock.append(hour_words)
+        clock.extend(f"{hour_words}{join}{minute} {group_words[minutes]}" for minutes in range(1, 60))
+
+    date = _require(spec, 'date', dict, 'the pack')
+    day = _require(date, 'day', str, 'date')
+    month = _require(date, 'month', str, 'date')
+    year = _require(date, 'year', str, 'date')
+    date_prefixes = tuple(
+        f"{day} {group_words[d]} {month} {name} {year} "
+        for name in months.values()
+        for d in range(1, 32)
+    )
+    patterns = _patterns(spec, currencies, table)
+    warmup = spec.get('warmup', [])
+    if not isinstance(warmup, list) or not all(isinstance(text, str) for text in warmup):
+        raise PackError("'warmup' must be a list of strings")
+
+    return {
+        'language': language,
+        'ones': dict(enumerate(ones)),
+        'tens': {10 * (i + 1): word for i, word in enumerate(tens)},
+        'hundred': hundred,
+        'join': join,
+        'negative': f"{_require(numbers, 'negative', str, 'numbers')} ",
+        'decimal_point': f" {_require(numbers, 'decimal_point', str, 'numbers')} ",
+        'scales': tuple((10 ** exponent, word) for word, exponent in reversed(scales)),
+        'group_words': group_words,
+        'digit_words': {str(digit): word for digit, word in enumerate(ones)},
+        'currencies': currencies,
+        'currency_index': currency_index,
+        'months': months,
+        'time_words': {'hour': hour, 'minute': minute, 'second': second},
+        'periods': {period: f" {word}" for period, word in periods.items()},
+        'clock': tuple(clock),
+        'seconds': ("",) + tuple(f"{join}{second} {group_words[s]}" for s in range(1, 60)),
+        'date_words': {'day': day, 'month': month, 'year': year,
+                       'month_number': date.get('month_number', month)},
+        'date_prefixes': date_prefixes,
+        'patterns': patterns,
+        'warmup': tuple(warmup),
+        'pattern_hints': {
+            category: pattern_hints(re.compile(regex, flags)) for category, (regex, flags) in patterns.items()
+        },
+    }
+
+
+class LanguagePack:
+    """
+    A compiled language pack.
+
+    Every table of :func:`compile_pack` is an attribute; ``patterns`` maps
+    each category to its compiled regex and ``pattern_hints`` to the
+    Detector's analysis of it. The LAZY_TABLES of a cached pack
+    are unmarshalled on first access.
+
+    Args:
+        tables (dict): Output of compile_pack, or all but the LAZY_TABLES
+        source_hash (str): Content hash of the pack file
+        cached (bool): Whether the tables were read from the disk cache
+        lazy (bytes, optional): The marshalled LAZY_TABLES
+    """
+
+    def __init__(self, tables, source_hash=None, cached=False, lazy=None):
+        self.__dict__.update(tables)
+        self.patterns = {
+            category: re.compile(regex, flags) for category, (regex, flags) in tables['patterns'].items()
+        }
+        self.source_hash = source_hash
+        self.cached = cached
+        self._lazy = lazy
+
+    def __getattr__(self, name):
+        # Only reached for attributes not set yet: the lazy tables
+        lazy = self.__dict__.get('_lazy')
+        if lazy is None or name not in LAZY_TABLES:
+            raise AttributeError(f"'LanguagePack' object has no attribute '{name}'")
+        self.__dict__.update(marshal.loads(lazy))
+        self._lazy = None
+        return self.__dict__[name]
+
+    def __repr__(self):
+        return f"LanguagePack(language={self.language!r}, cached={self.cached})"
+
+
+def _dump_tables(tables):
+    """Marshal compiled tables, the LAZY_TABLES as a nested blob."""
+    eager = {name: table for name, table in tables.items() if name not in LAZY_TABLES}
+    lazy = marshal.dumps({name: tables[name] for name in LAZY_TABLES})
+    return marshal.dumps((PACK_FORMAT, eager, lazy))
+
+
+_compiler_digest = None
+
+
+def _compiler_hash():
+    """Return a hash of the library version and the COMPILER_MODULES' source, once per process."""
+    global _compiler_digest
+    if _compiler_digest is None:
+        from . import __version__
+
+        digest = hashlib.sha256(__version__.encode('utf-8'))
+        package = os.path.dirname(os.path.abspath(__file__))
+        for name in COMPILER_MODULES:
+            try:
+                with open(os.path.join(package, name), 'rb') as f:
+                    digest.update(f.read())
+            except OSError:
+                # Installed without sources: the version has to do
+                pass
+        _compiler_digest = digest.hexdigest()
+    return _compiler_digest
+
+
+def _cache_prefix(language):
+    return f"{language}-{sys.implementation.cache_tag}-"
+
+
+def _cache_path(cache_dir, language, source_hash):
+    return os.path.join(cache_dir, f"{_cache_prefix(language)}{source_hash}.marshal")
+
+
+def _prune_cache(cache_dir, language, keep):
+    """
+    Delete all but the ``keep`` newest builds of a language for this interpreter.
+
+    Builds named by earlier releases, without the interpreter tag, are
+    deleted as well.
+    """
+    stale = re.compile(
+        rf"{re.escape(language)}-(?:{re.escape(sys.implementation.cache_tag)}-)?[0-9a-f]{{32}}\.marshal"
+    )
+    prefix = _cache_prefix(language)
+    builds = []
+    for name in os.listdir(cache_dir):
+        if not stale.fullmatch(name):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            if not name.startswith(prefix):
+                os.unlink(path)
+            else:
+                builds.append((os.stat(path).st_mtime_ns, path))
+        except OSError:
+            pass
+    builds.sort(reverse=True)
+    for _, path in builds[keep:]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def load_pack(path, cache_dir=None):
+    """
+    Load a language pack, compiling it only when its tables are not cached.
+
+    Compiled tables are stored as ``<language>-<hash>.marshal`` in the cache
+    directory. The hash covers the pack's bytes, PACK_FORMAT, the library
+    version, the source of the COMPILER_MODULES and the Python version, so
+    editing the pack or the compiler, or upgrading either one recompiles it. Writing a build deletes
+    the language's builds beyond the KEPT_BUILDS newest. An unwritable cache
+    directory only costs the compilation.
+
+    Args:
+        path (str): Pack file
+        cache_dir (str or False, optional): Cache directory (default:
+            pack_cache_dir()); False disables the cache
+
+    Returns:
+        LanguagePack: The compiled pack
+
+    Raises:
+        PackError: If the pack is malformed
+    """
+    with open(path, 'rb') as f:
+        source = f.read()
+    digest = hashlib.sha256(source)
+    digest.update(f"\0{PACK_FORMAT}\0{marshal.version}\0{sys.version_info[:2]}\0{_compiler_hash()}".encode('ascii'))
+    source_hash = digest.hexdigest()[:32]
+    language = os.path.splitext(os.path.basename(path))[0]
+    if cache_dir is None:
+        cache_dir = pack_cache_dir()
+
+    if cache_dir is not False:
+        cache_path = _cache_path(cache_dir, language, source_hash)
+        try:
+            # One read: marshal.load on a file reads object by object
+            with open(cache_path, 'rb') as f:
+                layout, tables, lazy = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        else:
+            if layout == PACK_FORMAT:
+                return LanguagePack(tables, source_hash, cached=True, lazy=lazy)
+
+    # json is only needed to compile; cached loads skip importing it
+    import json
+
+    try:
+        spec = json.loads(source)
+    except ValueError as error:
+        raise PackError(f"{path}: {error}") from None
+    tables = compile_pack(spec)
+
+    if cache_dir is not False:
+        # Written to a temporary file and renamed, so concurrent readers
+        # never see a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_dump_tables(tables))
+            os.replace(tmp_path, cache_path)
+            _prune_cache(cache_dir, language, KEPT_BUILDS)
+        except (OSError, ValueError):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return LanguagePack(tables, source_hash)
@@ -0,0 +1,337 @@
+"""
+Partial matching for the detector's patterns.
+
+Python's ``re`` can say whether a text matches, but not whether it could
+still grow into a match once more text arrives: ``KES 15`` may become
+``KES 1500.50`` and ``14:`` may become ``14:30 PM``. A PartialMatcher
+compiles the patterns' parse trees into one nondeterministic automaton and
+runs it over a text once, reporting for every position the leftmost start of
+a match that could still be in progress there.
+
+The automaton accepts a superset of the patterns' prefixes (bounded repeats
+may be relaxed), so it can only over-report, never miss an expression in
+progress. The text a lookaround inspects counts as part of the expression:
+``(?<!X)`` and ``(?<=X)`` may be preceded by ``X``, and ``(?!X)`` and
+``(?=X)`` may go on through ``X``, which keeps that text in the same piece
+as the match. Patterns using anchors, backreferences or other constructs
+that cannot be modelled are marked as unsupported, and callers fall back to
+the detector's safe breaks.
+"""
+
+import itertools
+import re
+
+from .detector import _is_word
+
+try:
+    from re import _constants as sre
+    from re import _parser as sre_parse
+except ImportError:  # Python 3.10
+    import sre_constants as sre
+    import sre_parse
+
+
+# Bounded repeats up to this count are unrolled; longer ones become loops
+MAX_UNROLL = 32
+
+# Cached transitions, per set of states and character
+MAX_CACHED = 65536
+
+_CATEGORIES = {
+    sre.CATEGORY_DIGIT: (r'\d', False),
+    sre.CATEGORY_NOT_DIGIT: (r'\d', True),
+    sre.CATEGORY_SPACE: (r'\s', False),
+    sre.CATEGORY_NOT_SPACE: (r'\s', True),
+    sre.CATEGORY_WORD: (r'\w', False),
+    sre.CATEGORY_NOT_WORD: (r'\w', True),
+}
+
+_REPEATS = (sre.MAX_REPEAT, sre.MIN_REPEAT) + tuple(
+    getattr(sre, name) for name in ('POSSESSIVE_REPEAT',) if hasattr(sre, name)
+)
+
+# Node kinds
+_CHAR, _SPLIT, _BOUNDARY, _MATCH = range(4)
+
+
+class Unsupported(Exception):
+    """A pattern uses a construct the automaton cannot model."""
+
+
+def _char_test(items, ignorecase):
+    """Return a one-character predicate for the items of a character set."""
+    negate = False
+    tests = []
+    for op, arg in items:
+        if op is sre.NEGATE:
+            negate = True
+        elif op is sre.LITERAL:
+            tests.append(chr(arg).__eq__)
+        elif op is sre.RANGE:
+            low, high = arg
+            tests.append(lambda c, low=low, high=high: low <= ord(c) <= high)
+        elif op is sre.CATEGORY:
+            if arg not in _CATEGORIES:
+                raise Unsupported(f"category {arg}")
+            regex, inverted = _CATEGORIES[arg]
+            match = re.compile(regex).match
+            tests.append((lambda c, match=match: match(c) is None) if inverted else match)
+        else:
+            raise Unsupported(f"set item {op}")
+
+    def test(c):
+        if ignorecase:
+            found = any(t(v) for v in {c, c.lower(), c.upper()} for t in tests)
+        else:
+            found = any(t(c) for t in tests)
+        return found != negate
+
+    return test
+
+
+def _lookbehinds_first(items):
+    """
+    Move lookbehinds before the assertions next to them.
+
+    Assertions in a row all test the same position, so their order does not
+    matter to ``re``; but the text a lookbehind inspects comes before that
+    position, and ``\\b(?<!X)`` has to be modelled as ``(?<!X)\\b`` for ``X``
+    to be read before the boundary is checked.
+    """
+    result = []
+    for zero_width, run in itertools.groupby(items, key=_is_assertion):
+        run = list(run)
+        if zero_width:
+            # Stable, so each kind keeps its order
+            run.sort(key=lambda item: not _is_lookbehind(item))
+        result.extend(run)
+    return result
+
+
+def _is_assertion(item):
+    op, _ = item
+    return op in (sre.ASSERT, sre.ASSERT_NOT, sre.AT)
+
+
+def _is_lookbehind(item):
+    op, arg = item
+    return op in (sre.ASSERT, sre.ASSERT_NOT) and arg[0] < 0
+
+
+class PartialMatcher:
+    """
+    Automaton recognizing every prefix of a match of any of the patterns.
+
+    Args:
+        patterns (iterable): Compiled regexes
+    """
+
+    def __init__(self, patterns):
+        self.nodes = []
+        self.supported = True
+        self._cache = {}
+        match = self.final = self._node(_MATCH)
+        entries = []
+        for pattern in patterns:
+            if pattern.flags & (re.ASCII | re.LOCALE | re.MULTILINE):
+                self.supported = False
+                continue
+            try:
+                tree = sre_parse.parse(pattern.pattern, pattern.flags)
+                entries.append(self._compile(list(tree), match,
+                                             bool(pattern.flags & re.IGNORECASE),
+                                             bool(pattern.flags & re.DOTALL)))
+            except Unsupported:
+                self.supported = False
+        self.start = self._node(_SPLIT, entries)
+        # States from which a match may end without consuming more text
+        self._final = {node for node in range(len(self.nodes)) if self._ends(node)}
+
+    def _node(self, kind, arg=None, out=None):
+        self.nodes.append([kind, arg, out])
+        return len(self.nodes) - 1
+
+    def _compile(self, items, out, ignorecase, dotall):
+        """Compile a sequence of parse items ending in ``out``; returns the entry node."""
+        for op, arg in reversed(_lookbehinds_first(items)):
+            out = self._compile_item(op, arg, out, ignorecase, dotall)
+        return out
+
+    def _compile_item(self, op, arg, out, ignorecase, dotall):
+        if op is sre.LITERAL:
+            return self._node(_CHAR, _char_test([(op, arg)], ignorecase), out)
+        if op is sre.NOT_LITERAL:
+            test = _char_test([(sre.NEGATE, None), (sre.LITERAL, arg)], ignorecase)
+            return self._node(_CHAR, test, out)
+        if op is sre.IN:
+            return self._node(_CHAR, _char_test(arg, ignorecase), out)
+        if op is sre.ANY:
+            return self._node(_CHAR, (lambda c: True) if dotall else '\n'.__ne__, out)
+        if op is sre.SUBPATTERN:
+            _, add_flags, del_flags, items = arg
+            if add_flags & (re.ASCII | re.LOCALE | re.MULTILINE):
+                raise Unsupported("inline flags")
+            ignorecase = ((ignorecase or bool(add_flags & re.IGNORECASE))
+                          and not del_flags & re.IGNORECASE)
+            dotall = (dotall or bool(add_flags & re.DOTALL)) and not del_flags & re.DOTALL
+            return self._compile(list(items), out, ignorecase, dotall)
+        if op is sre.BRANCH:
+            return self._node(_SPLIT, [self._compile(list(items), out, ignorecase, dotall)
+                                       for items in arg[1]])
+        if op in _REPEATS:
+            low, high, items = arg
+            items = list(items)
+            if high is sre.MAXREPEAT or high > MAX_UNROLL:
+                loop = self._node(_SPLIT, [])
+                self.nodes[loop][1] = [self._compile(items, loop, ignorecase, dotall), out]
+                entry = loop
+                low = min(low, MAX_UNROLL)
+            else:
+                entry = out
+                for _ in range(high - low):
+                    entry = self._node(_SPLIT, [self._compile(items, entry, ignorecase, dotall), out])
+                    out = entry
+            for _ in range(low):
+                entry = self._compile(items, entry, ignorecase, dotall)
+            return entry
+        if op in (sre.ASSERT, sre.ASSERT_NOT):
+            direction, items = arg
+            if direction < 0:
+                # The looked-at text may come first
+                context = self._compile(list(items), out, ignorecase, dotall)
+            else:
+                # ... or follow, as the end of the expression
+                context = self._compile(list(items), self.final, ignorecase, dotall)
+            return self._node(_SPLIT, [context, out])
+        if op is sre.AT:
+            if arg in (sre.AT_BOUNDARY, sre.AT_NON_BOUNDARY):
+                return self._node(_BOUNDARY, arg is sre.AT_BOUNDARY, out)
+        raise Unsupported(f"{op} {arg}")
+
+    def _ends(self, node):
+        """Return True if the final node can be reached from ``node`` by empty transitions."""
+        nodes = self.nodes
+        seen = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            kind, arg, out = nodes[node]
+            if kind == _MATCH:
+                return True
+            if kind == _SPLIT:
+                stack.extend(arg)
+            elif kind == _BOUNDARY:
+                # Whether the boundary holds depends on the next character
+                stack.append(out)
+        return False
+
+    def _reachable(self, node, before, after):
+        """
+        Follow the empty transitions from a node.
+
+        Args:
+            node (int): Starting node
+            before (str): Character before the position, or ''
+            after (str): Character after it
+
+        Returns:
+            list: The character-consuming nodes reached
+        """
+        nodes = self.nodes
+        seen = set()
+        found = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            kind, arg, out = nodes[node]
+            if kind == _CHAR:
+                found.append(node)
+            elif kind == _SPLIT:
+                stack.extend(arg)
+            elif kind == _BOUNDARY:
+                if (_is_word(before) != _is_word(after)) == arg:
+                    stack.append(out)
+        return found
+
+    def _moves(self, sources, before, char):
+        """
+        Work out the transitions on one character.
+
+        Returns:
+            tuple: ``(target, sources)`` pairs: the states reached, each with
+            the source states that lead to it
+        """
+        nodes = self.nodes
+        targets = {}
+        for source in sources:
+            for node in self._reachable(source, before, char):
+                if nodes[node][1](char):
+                    targets.setdefault(nodes[node][2], []).append(source)
+        return tuple((target, tuple(found)) for target, found in targets.items())
+
+    def step(self, states, pos, before, char):
+        """
+        Consume one character.
+
+        Transitions are cached per set of states, so the automaton soon runs
+        as a lazily built deterministic one.
+
+        Args:
+            states (dict): State -> leftmost start of the match it belongs
+                to, before ``char``
+            pos (int): Offset of ``char``
+            before (str): Character before ``char``, or '' at the start
+            char (str): The character
+
+        Returns:
+            dict: The states after ``char``; empty if no match can be in
+            progress any more
+        """
+        key = (frozenset(states), _is_word(before), char)
+        moves = self._cache.get(key)
+        if moves is None:
+            moves = self._moves(list(states) + [self.start], before, char)
+            if len(self._cache) < MAX_CACHED:
+                self._cache[key] = moves
+        origins = dict(states)
+        # A new match can start at every position
+        origins[self.start] = pos
+        return {target: min(origins[source] for source in sources) for target, sources in moves}
+
+    def ended(self, states):
+        """
+        Find a match that may end after the current character.
+
+        Args:
+            states (dict): States returned by :meth:`step`
+
+        Returns:
+            int: Leftmost start of such a match, or None
+        """
+        final = self._final.intersection(states)
+        return min(states[state] for state in final) if final else None
+
+    def scan(self, text):
+        """
+        Find where matches could be in progress.
+
+        Args:
+            text (str): Text seen so far; more may follow
+
+        Returns:
+            list: ``len(text) + 1`` entries; entry ``i`` is the leftmost
+            start of a possible match that has consumed ``text[i - 1]``, or
+            None
+        """
+        states = {}
+        live = [None]
+        for pos, char in enumerate(text):
+            states = self.step(states, pos, text[pos - 1] if pos else '', char)
+            live.append(min(states.values()) if states else None)
+        return live
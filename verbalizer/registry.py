@@ -0,0 +1,167 @@
+"""
+Lazy language registry.
+
+Languages are registered by import path and only imported the first time
+they are used, so ``import verbalizer`` stays cheap however many languages
+are installed:
+
+    from verbalizer import get_verbalizer
+    verbalizer = get_verbalizer("sw")
+
+Third-party packages can add languages through the ``verbalizer.languages``
+entry point group, e.g. in their pyproject.toml:
+
+    [project.entry-points."verbalizer.languages"]
+    ha = "my_package.hausa:HausaVerbalizer"
+"""
+
+import importlib
+import threading
+
+
+ENTRY_POINT_GROUP = 'verbalizer.languages'
+
+# Language code -> class or "module:attribute" import path
+_languages = {
+    'sw': 'verbalizer.languages.swahili:SwahiliVerbalizer',
+}
+
+# Alternative names -> language code
+_aliases = {
+    'swahili': 'sw',
+}
+
+_instances = {}
+_lock = threading.Lock()
+_entry_points_loaded = False
+
+
+def register_language(code, target, aliases=()):
+    """
+    Register a language.
+
+    Args:
+        code (str): Language code, e.g. 'sw'
+        target: The normalizer class, or its ``"module:attribute"`` path to
+            import on first use
+        aliases (iterable): Alternative names for the language
+    """
+    code = code.lower()
+    with _lock:
+        _languages[code] = target
+        for alias in aliases:
+            _aliases[alias.lower()] = code
+        for key in [key for key in _instances if key[0] == code]:
+            del _instances[key]
+
+
+def _load_entry_points():
+    """Register the languages advertised by installed packages, once."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    # importlib.metadata is slow to import; only pay for it when needed
+    from importlib.metadata import entry_points
+    with _lock:
+        if _entry_points_loaded:
+            return
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            code = entry_point.name.lower()
+            if code not in _languages:
+                _languages[code] = entry_point.value
+        # Set last, so other threads never see a half-loaded registry
+        _entry_points_loaded = True
+
+
+def _resolve(name):
+    """Return the registered code for a language name or alias."""
+    key = name.lower()
+    key = _aliases.get(key, key)
+    if key not in _languages:
+        _load_entry_points()
+    if key not in _languages:
+        raise ValueError(
+            f"Unknown language '{name}'. Available: {', '.join(available_languages())}"
+        )
+    return key
+
+
+def available_languages():
+    """
+    List the registered languages, without importing them.
+
+    Returns:
+        list: Sorted language codes and aliases
+    """
+    _load_entry_points()
+    return sorted(set(_languages) | set(_aliases))
+
+
+def get_verbalizer_class(language):
+    """
+    Return the normalizer class for a language, importing it if needed.
+
+    Args:
+        language (str): Language code or alias
+
+    Returns:
+        type: A BaseNormalizer subclass
+
+    Raises:
+        ValueError: If the language is not registered
+    """
+    code = _resolve(language)
+    target = _languages[code]
+    if isinstance(target, str):
+        module_name, _, attribute = target.partition(':')
+        target = getattr(importlib.import_module(module_name), attribute)
+        _languages[code] = target
+    return target
+
+
+def _freeze(value):
+    """Return a hashable equivalent of lists, tuples, sets and dicts, recursively."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def get_verbalizer(language, **config):
+    """
+    Return a shared normalizer instance for a language and configuration.
+
+    The language is imported on first use and one instance is kept per
+    language and set of keyword arguments, so repeated calls are cheap. Lists
+    and tuples with the same items select the same instance; a configuration
+    that cannot be hashed even so gets a new instance on every call.
+    Create the class directly (see :func:`get_verbalizer_class`) for an
+    instance of your own to modify, e.g. with caches or statistics.
+
+    Args:
+        language (str): Language code or alias, e.g. 'sw' or 'swahili'
+        **config: Keyword arguments for the normalizer, e.g. ``errors='ignore'``
+
+    Returns:
+        BaseNormalizer: The shared instance
+
+    Raises:
+        ValueError: If the language is not registered
+    """
+    key = (_resolve(language), _freeze(config))
+    try:
+        hash(key)
+    except TypeError:
+        # A setting such as an open file cannot be part of the key
+        return get_verbalizer_class(language)(**config)
+    instance = _instances.get(key)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(key)
+            if instance is None:
+                instance = get_verbalizer_class(language)(**config)
+                _instances[key] = instance
+    return instance
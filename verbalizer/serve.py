@@ -0,0 +1,358 @@
+"""
+Local normalization server.
+
+Serves a warm verbalizer over HTTP and/or a Unix domain socket using only
+the standard library:
+
+    python -m verbalizer.serve --port 8090 --unix /tmp/verbalizer.sock --workers 4
+
+Endpoints (JSON bodies):
+
+- ``POST /normalize``        ``{"text": "..."}``        -> ``{"text": "..."}``
+- ``POST /normalize_batch``  ``{"texts": ["...", ...]}`` -> ``{"texts": [...]}``
+- ``GET /health``                                        -> ``{"status": "ok"}``
+
+The verbalizer is built and warmed up once in the parent process, with the
+sample sentences of its language pack if it has any, then the listening
+sockets are shared by pre-forked workers, which inherit the warm instance. Inside a worker, a request that arrives while nothing else is
+queued is answered at once; requests that pile up are micro-batched, up to
+``--max-batch`` texts at a time within ``--max-delay``.
+"""
+
+import argparse
+import json
+import os
+import queue
+import signal
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from .registry import available_languages, get_verbalizer_class
+
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_DELAY = 0.002
+
+# Largest request body accepted, in bytes
+MAX_BODY = 16 * 1024 * 1024
+
+class MicroBatcher:
+    """
+    Collects texts submitted by request threads and normalizes them in batches.
+
+    A text that arrives while nothing else is queued is normalized at once.
+    Otherwise the batch is closed when it holds ``max_batch`` texts or
+    ``max_delay`` seconds after it was opened, whichever comes first.
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        max_batch (int): Largest batch
+        max_delay (float): Longest wait for a batch to fill, in seconds
+    """
+
+    def __init__(self, normalizer, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY):
+        self.normalizer = normalizer
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name='verbalizer-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, text):
+        """
+        Queue a text for normalization.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the normalized text
+        """
+        future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def normalize(self, text):
+        """Normalize one text through the batcher and wait for the result."""
+        return self.submit(text).result()
+
+    def normalize_many(self, texts):
+        """Normalize several texts through the batcher and wait for the results."""
+        futures = [self.submit(text) for text in texts]
+        return [future.result() for future in futures]
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            self._drain(batch)
+            # A lone request is dispatched at once; only when others arrived
+            # with it is the batch given time to fill
+            if len(batch) > 1:
+                deadline = time.monotonic() + self.max_delay
+                while len(batch) < self.max_batch:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(self._queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+            self.run_batch(batch)
+
+    def _drain(self, batch):
+        """Add the texts already queued to ``batch``, up to ``max_batch``."""
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return
+
+    def run_batch(self, batch):
+        """
+        Normalize one batch and resolve its futures.
+
+        A text that occurs several times in the batch is normalized once.
+
+        Args:
+            batch (list): ``(text, future)`` pairs
+        """
+        normalize = self.normalizer.normalize
+        results = {}
+        for text, future in batch:
+            if text not in results:
+                try:
+                    results[text] = (normalize(text), None)
+                except Exception as e:
+                    results[text] = (None, e)
+            result, error = results[text]
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the normalization endpoints."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'verbalizer'
+    # Buffer the response so headers and body leave in one write; the
+    # buffer is flushed after each request
+    wbufsize = -1
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        else:
+            self._send(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path not in ('/normalize', '/normalize_batch'):
+            self._send(404, {'error': 'not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length > MAX_BODY:
+                self._send(413, {'error': 'request body too large'})
+                return
+            body = json.loads(self.rfile.read(length) or b'{}')
+            batcher = self.server.batcher
+            if self.path == '/normalize':
+                text = body['text']
+                if not isinstance(text, str):
+                    raise TypeError("'text' must be a string")
+                self._send(200, {'text': batcher.normalize(text)})
+            else:
+                texts = body['texts']
+                if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                    raise TypeError("'texts' must be a list of strings")
+                self._send(200, {'texts': batcher.normalize_many(texts)})
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {'error': f"bad request: {e}"})
+        except Exception as e:
+            self._send(500, {'error': str(e)})
+
+    def _send(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    """Threaded HTTP server on TCP."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server on a Unix domain socket."""
+
+    daemon_threads = True
+
+
+def make_servers(host=None, port=None, unix=None):
+    """
+    Bind the listening sockets.
+
+    Args:
+        host (str, optional): TCP host
+        port (int, optional): TCP port
+        unix (str, optional): Path of the Unix domain socket
+
+    Returns:
+        list: Bound, not yet serving, server objects
+    """
+    servers = []
+    if port is not None:
+        servers.append(ThreadingHTTPServer((host or '127.0.0.1', port), RequestHandler))
+    if unix is not None:
+        if os.path.exists(unix):
+            os.unlink(unix)
+        servers.append(ThreadingUnixHTTPServer(unix, RequestHandler))
+    if not servers:
+        raise ValueError("Nothing to listen on: give a TCP port and/or a Unix socket path")
+    return servers
+
+
+def serve(servers, normalizer, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY, verbose=False):
+    """
+    Serve requests on already bound sockets until interrupted.
+
+    Args:
+        servers (list): Servers from :func:`make_servers`
+        normalizer: A BaseNormalizer instance
+        max_batch (int): Largest micro-batch
+        max_delay (float): Longest wait for a micro-batch to fill, in seconds
+        verbose (bool): Log every request to stderr
+    """
+    batcher = MicroBatcher(normalizer, max_batch, max_delay)
+    for server in servers:
+        server.batcher = batcher
+        server.verbose = verbose
+    threads = [
+        threading.Thread(target=server.serve_forever, daemon=True)
+        for server in servers[1:]
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        servers[0].serve_forever()
+    finally:
+        for server in servers[1:]:
+            server.shutdown()
+        for server in servers:
+            server.server_close()
+
+
+def prefork(workers, target):
+    """
+    Run ``target`` in ``workers`` forked processes and wait for them.
+
+    SIGINT and SIGTERM in the parent are forwarded to the workers.
+
+    Args:
+        workers (int): Number of worker processes
+        target (callable): Called without arguments in every worker
+    """
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                target()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    def stop(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for pid in children:
+        os.waitpid(pid, 0)
+
+
+def build_parser():
+    """Build the argument parser for ``python -m verbalizer.serve``."""
+    parser = argparse.ArgumentParser(
+        prog='python -m verbalizer.serve',
+        description='Serve text normalization over HTTP and/or a Unix domain socket.',
+    )
+    parser.add_argument('--host', default='127.0.0.1', help="TCP host (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, help="TCP port")
+    parser.add_argument('--unix', help="path of a Unix domain socket")
+    parser.add_argument('-l', '--language', default='sw', choices=available_languages())
+    parser.add_argument('--errors', default='ignore', choices=('ignore', 'warn'),
+                        help="policy for expressions that cannot be verbalized (default: ignore)")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="pre-forked worker processes (default: 1)")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help=f"largest micro-batch (default: {DEFAULT_MAX_BATCH})")
+    parser.add_argument('--max-delay', type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help=f"longest wait for a micro-batch to fill, in ms (default: {DEFAULT_MAX_DELAY * 1000:g})")
+    parser.add_argument('--cache', action='store_true',
+                        help="cache results of repeated texts and expressions in memory")
+    parser.add_argument('-v', '--verbose', action='store_true', help="log every request")
+    return parser
+
+
+def main(argv=None):
+    """Entry point for ``python -m verbalizer.serve``."""
+    args = build_parser().parse_args(argv)
+    if args.port is None and args.unix is None:
+        args.port = 8090
+    if args.workers < 1:
+        raise SystemExit("serve: --workers must be at least 1")
+
+    normalizer = get_verbalizer_class(args.language)(errors=args.errors)
+    if args.cache:
+        normalizer.enable_cache()
+    normalizer.warmup()
+
+    servers = make_servers(args.host, args.port, args.unix)
+    where = []
+    if args.port is not None:
+        where.append(f"http://{args.host}:{servers[0].server_address[1]}")
+    if args.unix is not None:
+        where.append(f"unix:{args.unix}")
+    print(f"verbalizer: serving on {', '.join(where)} with {args.workers} worker(s)",
+          file=sys.stderr, flush=True)
+
+    def run():
+        serve(servers, normalizer, args.max_batch, args.max_delay / 1000, args.verbose)
+
+    try:
+        if args.workers == 1 or not hasattr(os, 'fork'):
+            run()
+        else:
+            prefork(args.workers, run)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.unix is not None and os.path.exists(args.unix):
+            os.unlink(args.unix)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Alignment spans between source and normalized text.
+
+Offsets are kept in flat integer arrays, so a document with millions of
+spans costs a few dozen bytes per span. Span objects are created only when
+a span is accessed.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+
+class Span:
+    """
+    One verbalized region.
+
+    Attributes:
+        start (int): Start offset in the source text
+        end (int): End offset in the source text
+        out_start (int): Start offset in the normalized text
+        out_end (int): End offset in the normalized text
+        category (str): Pattern category of the region
+        text (str): Original source text of the region
+    """
+
+    __slots__ = ('start', 'end', 'out_start', 'out_end', 'category', 'text')
+
+    def __init__(self, start, end, out_start, out_end, category, text):
+        self.start = start
+        self.end = end
+        self.out_start = out_start
+        self.out_end = out_end
+        self.category = category
+        self.text = text
+
+    def __eq__(self, other):
+        if not isinstance(other, Span):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return (
+            f"Span(start={self.start}, end={self.end}, out_start={self.out_start}, "
+            f"out_end={self.out_end}, category={self.category!r}, text={self.text!r})"
+        )
+
+
+class SpanList(Sequence):
+    """
+    Array-backed list of spans over one source text.
+
+    Args:
+        source (str): Source text the spans point into
+        categories (iterable): Category names, stored as small integer codes
+    """
+
+    def __init__(self, source, categories):
+        self.source = source
+        self.categories = tuple(categories)
+        self._codes = {category: code for code, category in enumerate(self.categories)}
+        self._category = array('B')
+        self._offsets = array('q')
+
+    def append(self, start, end, out_start, out_end, category):
+        """Add a span; offsets must be appended in increasing order."""
+        self._category.append(self._codes[category])
+        self._offsets.extend((start, end, out_start, out_end))
+
+    def offsets(self):
+        """
+        Return the raw offsets.
+
+        Returns:
+            array: ``start, end, out_start, out_end`` for every span, flattened
+        """
+        return self._offsets
+
+    def __len__(self):
+        return len(self._category)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("span index out of range")
+        start, end, out_start, out_end = self._offsets[4 * index:4 * index + 4]
+        category = self.categories[self._category[index]]
+        return Span(start, end, out_start, out_end, category, self.source[start:end])
+
+    def __repr__(self):
+        return f"SpanList({list(self)!r})"
@@ -0,0 +1,262 @@
+"""
+Normalization statistics.
+
+A NormalizerStats object is attached to a normalizer only while statistics
+are wanted; with none attached, normalization takes its usual path and pays
+a single attribute check.
+
+Counters are updated once per pass under a lock, so one NormalizerStats can
+be shared by any number of threads.
+"""
+
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from time import perf_counter
+
+# Open collect_stats blocks as (ScopedStats, NormalizerStats) pairs, innermost last
+_blocks = ContextVar('verbalizer_stats_blocks', default=())
+
+
+class NormalizerStats:
+    """
+    Counters for one normalizer.
+
+    Attributes:
+        calls (Counter): Calls per pass ('normalize' or a category name for
+            the single-category normalizers)
+        seconds (Counter): Wall time per pass
+        chars (int): Characters of input processed
+        matches (Counter): Expressions verbalized per category
+        failures (Counter): Expressions that could not be verbalized per category
+        verbalize_seconds (Counter): Time spent verbalizing per category
+        cache_hits (Counter): Passes answered from a result cache, per pass
+    """
+
+    def __init__(self, callbacks=()):
+        """
+        Args:
+            callbacks (iterable): Callables invoked with an event dict after
+                every pass (see :meth:`run_pass`)
+        """
+        self.callbacks = list(callbacks)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Set all counters back to zero."""
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self.calls = Counter()
+        self.seconds = Counter()
+        self.chars = 0
+        self.matches = Counter()
+        self.failures = Counter()
+        self.verbalize_seconds = Counter()
+        self.cache_hits = Counter()
+
+    def add_callback(self, callback):
+        """Register a callable invoked with an event dict after every pass."""
+        self.callbacks.append(callback)
+
+    def run_pass(self, name, text, verbalize, run):
+        """
+        Run one normalization pass and record it.
+
+        The pass runs without the lock, counting into local counters that
+        are added to the shared ones when it is done.
+
+        Args:
+            name (str): Pass name
+            text (str): Input text
+            verbalize (callable): ``verbalize(category, match)`` returning the
+                replacement or None on failure
+            run (callable): ``run(replace)`` performing the pass with the
+                instrumented ``replace(category, match)``
+
+        Returns:
+            str: Result of ``run``
+        """
+        matches = Counter()
+        failures = Counter()
+        verbalize_seconds = Counter()
+
+        def replace(category, match):
+            start = perf_counter()
+            result = verbalize(category, match)
+            verbalize_seconds[category] += perf_counter() - start
+            if result is None:
+                failures[category] += 1
+            else:
+                matches[category] += 1
+            return result
+
+        start = perf_counter()
+        result = run(replace)
+        seconds = perf_counter() - start
+
+        with self._lock:
+            self.calls[name] += 1
+            self.seconds[name] += seconds
+            self.chars += len(text)
+            self.matches.update(matches)
+            self.failures.update(failures)
+            self.verbalize_seconds.update(verbalize_seconds)
+
+        if self.callbacks:
+            event = {
+                'pass': name,
+                'seconds': seconds,
+                'chars': len(text),
+                'matches': dict(matches),
+                'failures': dict(failures),
+                'verbalize_seconds': dict(verbalize_seconds),
+                'cached': False,
+            }
+            for callback in self.callbacks:
+                callback(event)
+        return result
+
+    def record_cached(self, name, text, matches):
+        """
+        Record a pass answered from a result cache.
+
+        Args:
+            name (str): Pass name
+            text (str): Input text
+            matches (iterable): ``(category, count)`` pairs of the pass that
+                produced the cached result
+        """
+        matches = dict(matches)
+        with self._lock:
+            self.calls[name] += 1
+            self.chars += len(text)
+            self.matches.update(matches)
+            self.cache_hits[name] += 1
+
+        if self.callbacks:
+            event = {
+                'pass': name,
+                'seconds': 0.0,
+                'chars': len(text),
+                'matches': matches,
+                'failures': {},
+                'verbalize_seconds': {},
+                'cached': True,
+            }
+            for callback in self.callbacks:
+                callback(event)
+
+    def merge(self, other):
+        """
+        Add the counters of another NormalizerStats, e.g. from a worker.
+
+        Args:
+            other (NormalizerStats or dict): Stats object or :meth:`snapshot`
+        """
+        if isinstance(other, NormalizerStats):
+            other = other.snapshot()
+        with self._lock:
+            self.calls.update(other['calls'])
+            self.seconds.update(other['seconds'])
+            self.chars += other['chars']
+            self.matches.update(other['matches'])
+            self.failures.update(other['failures'])
+            self.verbalize_seconds.update(other['verbalize_seconds'])
+            self.cache_hits.update(other['cache_hits'])
+
+    def snapshot(self):
+        """
+        Return the counters as plain dictionaries.
+
+        Returns:
+            dict: Picklable, JSON-serializable copy of the counters
+        """
+        with self._lock:
+            return {
+                'calls': dict(self.calls),
+                'seconds': dict(self.seconds),
+                'chars': self.chars,
+                'matches': dict(self.matches),
+                'failures': dict(self.failures),
+                'verbalize_seconds': dict(self.verbalize_seconds),
+                'cache_hits': dict(self.cache_hits),
+            }
+
+    def __repr__(self):
+        return f"NormalizerStats({self.snapshot()!r})"
+
+
+class ScopedStats:
+    """
+    Route each pass to the innermost ``collect_stats`` block around it.
+
+    Installed as a normalizer's ``stats`` while any block is open. Blocks
+    are tracked in a context variable, so threads sharing the normalizer
+    each record only their own passes, while work the library hands to a
+    pool on the caller's behalf runs in a copy of the caller's context and
+    is recorded with it. Passes outside any block go to ``fallback``, the
+    statistics enabled with ``enable_stats`` (if any).
+
+    Args:
+        fallback (NormalizerStats or None): Statistics for passes outside blocks
+    """
+
+    def __init__(self, fallback=None):
+        self.fallback = fallback
+        # Blocks open in any context
+        self.open = 0
+
+    def push(self, stats):
+        """Open a block in the current context."""
+        _blocks.set(_blocks.get() + ((self, stats),))
+        self.open += 1
+
+    def pop(self, stats):
+        """
+        Close a block opened in the current context.
+
+        Args:
+            stats (NormalizerStats): The block's statistics
+
+        Returns:
+            bool: Whether any block is still open
+        """
+        blocks = _blocks.get()
+        for index in range(len(blocks) - 1, -1, -1):
+            if blocks[index][1] is stats:
+                _blocks.set(blocks[:index] + blocks[index + 1:])
+                break
+        self.open -= 1
+        return self.open > 0
+
+    def current(self):
+        """The statistics for a pass in the current context, or None."""
+        for owner, stats in reversed(_blocks.get()):
+            if owner is self:
+                return stats
+        return self.fallback
+
+    def run_pass(self, name, text, verbalize, run):
+        """Run a pass under the current context's statistics, if any."""
+        stats = self.current()
+        if stats is None:
+            return run(verbalize)
+        return stats.run_pass(name, text, verbalize, run)
+
+    def record_cached(self, name, text, matches):
+        """Record a cached pass under the current context's statistics, if any."""
+        stats = self.current()
+        if stats is not None:
+            stats.record_cached(name, text, matches)
@@ -0,0 +1,402 @@
+"""
+Streaming normalization of large text files and of pushed text.
+
+Input is read in fixed-size buffers. Each buffer is only normalized up to
+the last point where the text can be split safely; the tail is carried over
+to the next buffer, so an expression such as ``KES 15`` | ``00`` that
+straddles a buffer boundary is seen whole and the output is identical to
+normalizing the entire file at once.
+
+StreamingNormalizer does the same for text pushed a few characters at a
+time, such as LLM tokens, and holds back only the text that could still
+change.
+"""
+
+import bisect
+import os
+import re
+import weakref
+
+from .detector import _is_word
+from .errors import check_policy
+
+
+# Characters read per buffer
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Carried characters after which a cut is forced
+DEFAULT_MAX_CARRY = 8 * DEFAULT_CHUNK_SIZE
+
+# Characters a StreamingNormalizer holds back after which a cut is forced
+DEFAULT_MAX_PENDING = 4096
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def iter_normalized(normalizer, stream, chunk_size=DEFAULT_CHUNK_SIZE, max_carry=DEFAULT_MAX_CARRY):
+    """
+    Normalize a text stream piece by piece.
+
+    Memory use is bounded by ``chunk_size`` plus the carried tail. The tail
+    only grows while there is no safe point to split at (see
+    Detector.last_break); past ``max_carry`` characters the text is cut after
+    its last whitespace anyway, which can change the reading of an
+    expression next to that cut.
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        stream: Text file object opened for reading
+        chunk_size (int): Characters read per buffer
+        max_carry (int): Carried characters after which a cut is forced
+
+    Yields:
+        str: Normalized pieces, in order
+    """
+    detector = normalizer.detector
+    carry = ''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        buffer = carry + chunk
+        cut = detector.last_break(buffer)
+        if not cut and len(buffer) > max_carry:
+            cut = _forced_break(buffer)
+        if not cut:
+            carry = buffer
+            continue
+        yield normalizer.normalize(buffer[:cut])
+        carry = buffer[cut:]
+    if carry:
+        yield normalizer.normalize(carry)
+
+
+def _forced_break(text):
+    """Return the end of the last whitespace in ``text``, or its length if there is none."""
+    end = len(text)
+    for match in _WHITESPACE.finditer(text):
+        end = match.end()
+    return end
+
+
+def _keep(category, match):
+    """Replacement that accepts every expression as it is."""
+    return match.group(0)
+
+
+def split_text(detector, text, size):
+    """
+    Split text into pieces of about ``size`` characters at safe points.
+
+    Normalizing the pieces one by one gives the same result as normalizing
+    ``text`` at once. A piece is longer than ``size`` only when there is no
+    safe point inside it.
+
+    Args:
+        detector: The normalizer's Detector
+        text (str): Input text
+        size (int): Target characters per piece
+
+    Returns:
+        list: ``(offset, piece)`` pairs, in order
+    """
+    pieces = []
+    pos = 0
+    while len(text) - pos > size:
+        cut = detector.last_break(text[pos:pos + size])
+        if cut:
+            end = pos + cut
+        else:
+            match = detector.safe_break.search(text, pos + size)
+            if match is None:
+                break
+            end = match.end()
+        pieces.append((pos, text[pos:end]))
+        pos = end
+    pieces.append((pos, text[pos:]))
+    return pieces
+
+
+def normalize_file(normalizer, src, dst, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    Normalize a text file into another file in bounded memory.
+
+    Line endings are preserved as they are in the input.
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        src: Input path, or a text file object opened for reading
+        dst: Output path, or a text file object opened for writing
+        chunk_size (int): Characters read per buffer
+        encoding (str): Encoding used for paths
+
+    Returns:
+        int: Number of characters written
+    """
+    if isinstance(src, (str, os.PathLike)):
+        with open(src, encoding=encoding, newline='') as stream:
+            return normalize_file(normalizer, stream, dst, chunk_size, encoding)
+    if isinstance(dst, (str, os.PathLike)):
+        with open(dst, 'w', encoding=encoding, newline='') as out:
+            return normalize_file(normalizer, src, out, chunk_size, encoding)
+
+    written = 0
+    for piece in iter_normalized(normalizer, src, chunk_size):
+        written += dst.write(piece)
+    return written
+
+
+# Detector -> PartialMatcher, built on first use
+_matchers = weakref.WeakKeyDictionary()
+
+
+def partial_matcher(detector):
+    """Return the PartialMatcher for a detector's patterns."""
+    matcher = _matchers.get(detector)
+    if matcher is None:
+        # Imported here: only pushed streams need the automaton
+        from .partial import PartialMatcher
+
+        matcher = _matchers[detector] = PartialMatcher(pattern for _, pattern in detector.order)
+    return matcher
+
+
+class StreamingNormalizer:
+    """
+    Push-style normalizer for text that arrives in small pieces.
+
+    ``feed`` returns the normalized text that can no longer change, as soon
+    as it is known; only the shortest tail that could still be part of a
+    currency, date, time or number expression (or of the word being typed)
+    is held back. Concatenating every ``feed`` result and the ``flush``
+    result gives exactly ``normalize`` of the concatenated input, as long as
+    no more than ``max_pending`` characters are held back; past that the
+    text is cut at a safe break (see Detector.last_break) or else after the
+    last whitespace before the expression in progress, which can change the
+    reading next to that cut.
+
+    A cut is made at offset ``h`` once the characters on both sides of it are
+    known, no expression in progress (see verbalizer.partial) crosses it or
+    touches its word boundary, the two sides are not both word characters,
+    so that ``\\b`` reads the same in either half, and no expression could
+    start at ``h`` once the text before it is cut off. Expressions that the
+    text after them has ruled out no longer hold anything back.
+
+    Each offset is examined once, when the character after it arrives, so a
+    feed costs time in proportion to its own length rather than to the text
+    held back.
+
+        stream = get_verbalizer('sw').streaming()
+        for token in tokens:
+            speak(stream.feed(token))
+        speak(stream.flush())
+
+    Args:
+        normalizer: A BaseNormalizer instance
+        errors (str, optional): Error policy ('ignore', 'warn' or 'raise');
+            defaults to the normalizer's policy
+        max_pending (int): Characters held back after which a cut is forced
+
+    Raises:
+        ValueError: For the 'collect' policy
+    """
+
+    def __init__(self, normalizer, errors=None, max_pending=DEFAULT_MAX_PENDING):
+        errors = normalizer.errors if errors is None else check_policy(errors)
+        if errors == 'collect':
+            raise ValueError("StreamingNormalizer does not support errors='collect'")
+        self.normalizer = normalizer
+        self.errors = errors
+        self.max_pending = max_pending
+        self._matcher = partial_matcher(normalizer.detector)
+        self._reset()
+
+    def _reset(self):
+        self._pending = ''
+        # Automaton states after the pending text, the starts of the
+        # possible matches that have consumed its last character, and the
+        # start of a match that may end after it
+        self._states = {}
+        self._live = ()
+        self._ended = None
+        # Offsets where a cut may still become possible, each with the
+        # largest start of a possible match that blocks it (-1: none); both
+        # lists increase (see _offer)
+        self._cuts = []
+        self._blocks = []
+
+    @property
+    def pending(self):
+        """The text received but not yet normalized."""
+        return self._pending
+
+    def _scan(self, begin):
+        """Run the automaton over the pending text from offset ``begin``."""
+        matcher = self._matcher
+        text = self._pending
+        states = self._states
+        live = self._live
+        ended = self._ended
+        blocks = self._blocks
+        for pos in range(begin, len(text)):
+            char = text[pos]
+            before = text[pos - 1] if pos else ''
+            states = matcher.step(states, pos, before, char)
+            after = tuple(states.values())
+            if pos:
+                self._offer(pos, before, char, live, after, ended)
+            live = after
+            ended = matcher.ended(states)
+            # Cuts blocked at or above the start of a match that may end
+            # here never become possible
+            if ended is not None:
+                while blocks and blocks[-1] >= ended:
+                    blocks.pop()
+                    self._cuts.pop()
+        self._states = states
+        self._live = live
+        self._ended = ended
+
+    def _offer(self, cut, before, char, live, after, ended):
+        """
+        Record offset ``cut`` as a possible cut.
+
+        A start seen at an offset only counts if it is at least the
+        smallest start of the matches still in progress or ending after that
+        offset: merged runs keep the smaller start, so a larger one can only
+        belong to a run that died without completing a match. The cut is
+        possible while every start that blocks it is below that smallest
+        start. Ends only lower it, so a cut blocked at or above the start of
+        a match ending after it never becomes possible, and a cut blocked as
+        high as a later one is never the last possible cut; neither is kept.
+
+        Args:
+            cut (int): Offset
+            before (str): Character before the offset
+            char (str): Character at the offset
+            live (tuple): Starts of the possible matches that have consumed
+                ``before``
+            after (tuple): The same for ``char``
+            ended (int): Start of a match that may end at the offset, or None
+        """
+        word = _is_word(char)
+        word_before = _is_word(before)
+        if word and word_before:
+            # \b would read differently in either half
+            return
+        if word:
+            # No expression in progress may cross the cut, and a match
+            # ending here looks at the character after it
+            block = max(live, default=-1)
+            if ended is not None and block >= ended:
+                return
+            block = max(block, max((start for start in after if start < cut), default=-1))
+        elif word_before and self._matcher.step({}, 0, '', char):
+            # At the start of a text, \b and \B read as after a non-word
+            # character, so an expression could start at the cut
+            return
+        else:
+            block = max(after, default=-1)
+        blocks = self._blocks
+        while blocks and blocks[-1] >= block:
+            blocks.pop()
+            self._cuts.pop()
+        blocks.append(block)
+        self._cuts.append(cut)
+
+    def _cut(self):
+        """
+        Find the last offset where the pending text can be cut.
+
+        Returns:
+            int: Offset, or 0 if there is none
+        """
+        text = self._pending
+        threshold = min(self._states.values(), default=len(text))
+        index = bisect.bisect_left(self._blocks, threshold)
+        if index:
+            return self._cuts[index - 1]
+        if len(text) > self.max_pending:
+            return self._forced_cut(threshold)
+        return 0
+
+    def _forced_cut(self, threshold):
+        """
+        Choose where to cut text held back for too long.
+
+        A safe break is taken if there is one; otherwise the end of the last
+        whitespace before ``threshold`` that no expression found so far
+        spans, or failing that the end of any whitespace before it.
+
+        Args:
+            threshold (int): Start of the leftmost expression in progress, or
+                the length of the pending text
+
+        Returns:
+            int: Offset
+        """
+        text = self._pending
+        detector = self.normalizer.detector
+        cut = detector.last_break(text)
+        if cut:
+            return cut
+        limit = threshold or len(text)
+        spans = [(start, end) for start, end, _, _ in detector.scan(text, _keep)]
+        starts = [start for start, _ in spans]
+        for match in reversed(list(_WHITESPACE.finditer(text, 0, limit))):
+            cut = match.end()
+            index = bisect.bisect_left(starts, cut)
+            if not index or spans[index - 1][1] <= cut:
+                return cut
+        return _forced_break(text[:limit])
+
+    def feed(self, chunk):
+        """
+        Add text to the stream.
+
+        Args:
+            chunk (str): Next piece of text
+
+        Returns:
+            str: Normalized text that is now final, possibly ''
+        """
+        if not chunk:
+            return ''
+        begin = len(self._pending)
+        self._pending += chunk
+        if not self._matcher.supported:
+            cut = self.normalizer.detector.last_break(self._pending)
+            if not cut and len(self._pending) > self.max_pending:
+                cut = self._forced_cut(len(self._pending))
+            return self._emit(cut) if cut else ''
+        self._scan(begin)
+        pieces = []
+        # The unfinished text is rescanned after a cut, since it no longer
+        # has a character before it; that can make a later cut possible
+        cut = self._cut()
+        while cut:
+            pieces.append(self._emit(cut))
+            pending = self._pending
+            self._reset()
+            self._pending = pending
+            self._scan(0)
+            cut = self._cut()
+        return ''.join(pieces)
+
+    def _emit(self, cut):
+        """Normalize and drop the pending text up to ``cut``."""
+        text = self._pending[:cut]
+        self._pending = self._pending[cut:]
+        return self.normalizer.normalize(text, self.errors)
+
+    def flush(self):
+        """
+        End the stream.
+
+        Returns:
+            str: Normalized text held back so far; the stream can then be
+            reused for a new text
+        """
+        text = self._pending
+        self._reset()
+        return self.normalizer.normalize(text, self.errors) if text else ''